@@ -120,14 +120,10 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
-def _convert_struct(data: Any) -> Any:
-    if isinstance(data, (str, int, float, bool)) or data is None:
-        return data
-    if hasattr(data, "items"):
-        return {key: _convert_struct(value) for key, value in data.items()}
-    if isinstance(data, Sequence) and not isinstance(data, (str, bytes, bytearray)):
-        return [_convert_struct(value) for value in data]
-    return data
+def _struct_data_to_dict(document: Any) -> dict[str, Any]:
+    if not document.struct_data:
+        return {}
+    return json_format.MessageToDict(document._pb.struct_data)  # type: ignore[attr-defined]
 
 
 def load_scenarios(path: Path | None) -> list[Scenario]:
@@ -178,7 +174,7 @@ def evaluate_scenario(
             except json.JSONDecodeError:
                 LOGGER.debug("Failed to decode json_data for document %s", document.id)
         elif document.struct_data:
-            struct = _convert_struct(document.struct_data)
+            struct = _struct_data_to_dict(document)
 
         tags = struct.get("tags") if isinstance(struct.get("tags"), list) else []
         label = struct.get("ground_truth_label")
@@ -7,7 +7,6 @@ import argparse
 import json
 import logging
 import sys
-from collections.abc import Sequence as AbcSequence
 from itertools import islice
 from typing import Any, Iterable, Sequence
 
@@ -68,14 +67,10 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
-def _convert_struct(data: Any) -> Any:
-    if isinstance(data, (str, int, float, bool)) or data is None:
-        return data
-    if hasattr(data, "items"):
-        return {key: _convert_struct(value) for key, value in data.items()}
-    if isinstance(data, AbcSequence) and not isinstance(data, (str, bytes, bytearray)):
-        return [_convert_struct(value) for value in data]
-    return data
+def _struct_data_to_dict(document: Any) -> dict[str, Any]:
+    if not document.struct_data:
+        return {}
+    return json_format.MessageToDict(document._pb.struct_data)  # type: ignore[attr-defined]
 
 
 def _snippet(value: Any, length: int = 120) -> str | None:
@@ -98,7 +93,7 @@ def print_summary(results: Iterable[discoveryengine.SearchResponse.SearchResult]
             except json.JSONDecodeError:
                 LOGGER.debug("Failed to decode json_data for document %s", document.id)
         elif document.struct_data:
-            struct = _convert_struct(document.struct_data)
+            struct = _struct_data_to_dict(document)
         summary = (
             struct.get("summary")
             or struct.get("subject")
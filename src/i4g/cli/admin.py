@@ -8,7 +8,6 @@ import os
 import subprocess
 import sys
 import warnings
-from collections.abc import Sequence as AbcSequence
 from pathlib import Path
 from typing import Any
 
@@ -29,16 +28,12 @@ warnings.filterwarnings("ignore", category=FutureWarning)
 SETTINGS = get_settings()
 
 
-def _convert_struct(data: Any) -> Any:
-    """Recursively convert proto-plus map/repeated containers into builtin types."""
+def _struct_data_to_dict(document: Any) -> dict[str, Any]:
+    """Convert a Document's ``struct_data`` to builtin types using the protobuf runtime."""
 
-    if isinstance(data, (str, int, float, bool)) or data is None:
-        return data
-    if hasattr(data, "items"):
-        return {key: _convert_struct(value) for key, value in data.items()}
-    if isinstance(data, AbcSequence) and not isinstance(data, (str, bytes, bytearray)):
-        return [_convert_struct(value) for value in data]
-    return data
+    if not document.struct_data:
+        return {}
+    return json_format.MessageToDict(document._pb.struct_data)  # type: ignore[attr-defined]
 
 
 def ensure_ollama_running() -> bool:
@@ -153,9 +148,9 @@ def run_vertex_search(args: argparse.Namespace) -> None:
             try:
                 struct = json.loads(document.json_data)
             except json.JSONDecodeError:
-                struct = _convert_struct(document.struct_data) if document.struct_data else {}
+                struct = _struct_data_to_dict(document)
         elif document.struct_data:
-            struct = _convert_struct(document.struct_data)
+            struct = _struct_data_to_dict(document)
 
         summary = struct.get("summary") or document.title or "<no summary>"
         label = struct.get("ground_truth_label") or "<unknown>"
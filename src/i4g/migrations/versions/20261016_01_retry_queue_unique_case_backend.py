@@ -0,0 +1,48 @@
+"""Make ingestion retry entries unique per case and backend."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str | None = "20261016_01"
+down_revision: str | None = "20251129_01"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Collapse duplicate retry rows and enforce one row per ``(case_id, backend)``."""
+
+    # Keep the most recently updated row for each pair (ties broken by retry_id).
+    op.execute(
+        sa.text(
+            """
+            DELETE FROM ingestion_retry_queue
+            WHERE EXISTS (
+                SELECT 1 FROM ingestion_retry_queue AS newer
+                WHERE newer.case_id = ingestion_retry_queue.case_id
+                  AND newer.backend = ingestion_retry_queue.backend
+                  AND (
+                    newer.updated_at > ingestion_retry_queue.updated_at
+                    OR (
+                      newer.updated_at = ingestion_retry_queue.updated_at
+                      AND newer.retry_id > ingestion_retry_queue.retry_id
+                    )
+                  )
+            )
+            """
+        )
+    )
+    op.drop_index("idx_retry_queue_case_backend", table_name="ingestion_retry_queue")
+    op.create_index("idx_retry_queue_case_backend", "ingestion_retry_queue", ["case_id", "backend"], unique=True)
+
+
+def downgrade() -> None:
+    """Restore the non-unique ``(case_id, backend)`` index."""
+
+    op.drop_index("idx_retry_queue_case_backend", table_name="ingestion_retry_queue")
+    op.create_index("idx_retry_queue_case_backend", "ingestion_retry_queue", ["case_id", "backend"], unique=False)
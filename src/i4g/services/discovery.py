@@ -6,7 +6,8 @@ import json
 import os
 from dataclasses import dataclass
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, Sequence
+from itertools import islice
+from typing import Any, Dict, List, Optional
 
 from google.cloud import discoveryengine_v1beta as discoveryengine
 from google.protobuf import json_format
@@ -75,16 +76,12 @@ def get_default_discovery_params(query: str, page_size: int = 10) -> DiscoverySe
     )
 
 
-def _convert_struct(value: Any) -> Any:
-    """Recursively convert protobuf Structs to standard Python types."""
+def _struct_data_to_dict(document: Any) -> Dict[str, Any]:
+    """Convert a Document's ``struct_data`` to builtin types using the protobuf runtime."""
 
-    if isinstance(value, (str, int, float, bool)) or value is None:
-        return value
-    if hasattr(value, "items"):
-        return {key: _convert_struct(child) for key, child in value.items()}
-    if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
-        return [_convert_struct(item) for item in value]
-    return value
+    if not document.struct_data:
+        return {}
+    return json_format.MessageToDict(document._pb.struct_data)  # type: ignore[attr-defined]
 
 
 @lru_cache(maxsize=1)
@@ -99,6 +96,16 @@ def _parse_boost_spec(boost_json: Optional[str]) -> Optional[discoveryengine.Sea
 
     if not boost_json:
         return None
+    return _compile_boost_spec(boost_json)
+
+
+@lru_cache(maxsize=32)
+def _compile_boost_spec(boost_json: str) -> discoveryengine.SearchRequest.BoostSpec:
+    """Parse BoostSpec JSON once per distinct string.
+
+    Callers must treat the returned message as read-only; assigning it to
+    ``SearchRequest.boost_spec`` copies it into the request.
+    """
 
     try:
         payload = json.loads(boost_json)
@@ -147,8 +154,8 @@ def run_discovery_search(params: DiscoverySearchParams) -> Dict[str, Any]:
         raise RuntimeError(f"Discovery search failed: {exc}") from exc
 
     formatted: List[Dict[str, Any]] = []
-    raw_results = list(search_response)
-    for rank, result in enumerate(raw_results, start=1):
+    # Iterating the pager past the first page triggers extra RPCs; stop at page_size.
+    for rank, result in enumerate(islice(search_response, request.page_size), start=1):
         document = result.document
         struct_data: Dict[str, Any] = {}
 
@@ -156,9 +163,9 @@ def run_discovery_search(params: DiscoverySearchParams) -> Dict[str, Any]:
             try:
                 struct_data = json.loads(document.json_data)
             except json.JSONDecodeError:
-                struct_data = _convert_struct(document.struct_data) if document.struct_data else {}
+                struct_data = _struct_data_to_dict(document)
         elif document.struct_data:
-            struct_data = _convert_struct(document.struct_data)
+            struct_data = _struct_data_to_dict(document)
 
         summary = (
             struct_data.get("summary")
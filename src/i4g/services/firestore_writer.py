@@ -5,7 +5,8 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from google.cloud import firestore
 
@@ -49,6 +50,13 @@ class FirestoreWriteResult:
     indicator_paths: List[str] = field(default_factory=list)
 
 
+@lru_cache(maxsize=8)
+def _firestore_client(project: str) -> firestore.Client:
+    """Share one Firestore client (and its gRPC channel) per project across writers."""
+
+    return firestore.Client(project=project)
+
+
 class FirestoreWriterError(RuntimeError):
     """Raised when Firestore writes fail."""
 
@@ -69,7 +77,7 @@ class FirestoreWriter:
         if not collection:
             raise ValueError("FirestoreWriter requires a collection name")
 
-        self._client = client or firestore.Client(project=project)
+        self._client = client or _firestore_client(project)
         self._collection = self._client.collection(collection)
         # Firestore batches are capped at 500 operations.
         self._batch_size = max(1, min(batch_size, 500))
@@ -92,13 +100,29 @@ class FirestoreWriter:
             :class:`FirestoreWriteResult` describing the written document paths.
         """
 
-        if not sql_result:
-            raise FirestoreWriterError("SQL writer result is required for Firestore fan-out")
+        return self.persist_case_bundles([(bundle, sql_result)], ingestion_run_id=ingestion_run_id)[0]
 
-        case_id = sql_result.case_id
-        case_ref = self._collection.document(case_id)
-        timestamp = _utcnow()
+    def persist_case_bundles(
+        self,
+        items: Sequence[Tuple[CaseBundle, SqlWriterResult]],
+        *,
+        ingestion_run_id: str | None = None,
+    ) -> List[FirestoreWriteResult]:
+        """Persist several case bundles, packing their writes into shared batch commits.
 
+        Args:
+            items: ``(bundle, sql_result)`` pairs to mirror into Firestore.
+            ingestion_run_id: Optional run identifier stored alongside each case document.
+
+        Returns:
+            One :class:`FirestoreWriteResult` per input pair, in order.
+        """
+
+        for _, sql_result in items:
+            if not sql_result:
+                raise FirestoreWriterError("SQL writer result is required for Firestore fan-out")
+
+        timestamp = _utcnow()
         batch = self._client.batch()
         operations = 0
 
@@ -117,53 +141,68 @@ class FirestoreWriter:
             if operations >= self._batch_size:
                 _commit_batch()
 
+        results: List[FirestoreWriteResult] = []
+        case_ids = ", ".join(sql_result.case_id for _, sql_result in items)
+        try:
+            for bundle, sql_result in items:
+                results.append(self._queue_case(bundle, sql_result, ingestion_run_id, timestamp, _queue_set))
+            _commit_batch(force=True)
+        except Exception as exc:  # pragma: no cover - surfaced via unit tests
+            LOGGER.exception("Firestore write failed for case_id=%s", case_ids)
+            raise FirestoreWriterError(f"Firestore write failed for case_id={case_ids}: {exc}") from exc
+
+        return results
+
+    def _queue_case(
+        self,
+        bundle: CaseBundle,
+        sql_result: SqlWriterResult,
+        ingestion_run_id: str | None,
+        timestamp: datetime,
+        queue_set: Callable[[firestore.DocumentReference, Dict[str, Any]], None],
+    ) -> FirestoreWriteResult:
+        case_ref = self._collection.document(sql_result.case_id)
         document_alias_map: Dict[str, str] = {}
         entity_alias_map: Dict[str, str] = {}
 
         result = FirestoreWriteResult(case_path=case_ref.path)
 
-        try:
-            case_payload = self._build_case_payload(bundle.case, sql_result, ingestion_run_id, timestamp)
-            _queue_set(case_ref, case_payload)
-
-            for doc_payload, document_id in zip(bundle.documents, sql_result.document_ids):
-                if doc_payload.alias:
-                    document_alias_map[doc_payload.alias] = document_id
-                doc_ref = case_ref.collection("documents").document(document_id)
-                serialised = self._build_document_payload(doc_payload, document_id, timestamp)
-                _queue_set(doc_ref, serialised)
-                result.document_paths.append(doc_ref.path)
-
-            for entity_payload, entity_id in zip(bundle.entities, sql_result.entity_ids):
-                if entity_payload.alias:
-                    entity_alias_map[entity_payload.alias] = entity_id
-                entity_ref = case_ref.collection("entities").document(entity_id)
-                serialised_entity = self._build_entity_payload(
-                    entity_payload,
-                    entity_id,
-                    document_alias_map,
-                    timestamp,
-                )
-                _queue_set(entity_ref, serialised_entity)
-                result.entity_paths.append(entity_ref.path)
-
-            for indicator_payload, indicator_id in zip(bundle.indicators, sql_result.indicator_ids):
-                indicator_ref = case_ref.collection("indicators").document(indicator_id)
-                serialised_indicator = self._build_indicator_payload(
-                    indicator_payload,
-                    indicator_id,
-                    document_alias_map,
-                    entity_alias_map,
-                    bundle.case.dataset,
-                    timestamp,
-                )
-                _queue_set(indicator_ref, serialised_indicator)
-                result.indicator_paths.append(indicator_ref.path)
-
-            _commit_batch(force=True)
-        except Exception as exc:  # pragma: no cover - surfaced via unit tests
-            LOGGER.exception("Firestore write failed for case_id=%s", case_id)
-            raise FirestoreWriterError(f"Firestore write failed for case_id={case_id}: {exc}") from exc
+        case_payload = self._build_case_payload(bundle.case, sql_result, ingestion_run_id, timestamp)
+        queue_set(case_ref, case_payload)
+
+        for doc_payload, document_id in zip(bundle.documents, sql_result.document_ids):
+            if doc_payload.alias:
+                document_alias_map[doc_payload.alias] = document_id
+            doc_ref = case_ref.collection("documents").document(document_id)
+            serialised = self._build_document_payload(doc_payload, document_id, timestamp)
+            queue_set(doc_ref, serialised)
+            result.document_paths.append(doc_ref.path)
+
+        for entity_payload, entity_id in zip(bundle.entities, sql_result.entity_ids):
+            if entity_payload.alias:
+                entity_alias_map[entity_payload.alias] = entity_id
+            entity_ref = case_ref.collection("entities").document(entity_id)
+            serialised_entity = self._build_entity_payload(
+                entity_payload,
+                entity_id,
+                document_alias_map,
+                timestamp,
+            )
+            queue_set(entity_ref, serialised_entity)
+            result.entity_paths.append(entity_ref.path)
+
+        for indicator_payload, indicator_id in zip(bundle.indicators, sql_result.indicator_ids):
+            indicator_ref = case_ref.collection("indicators").document(indicator_id)
+            serialised_indicator = self._build_indicator_payload(
+                indicator_payload,
+                indicator_id,
+                document_alias_map,
+                entity_alias_map,
+                bundle.case.dataset,
+                timestamp,
+            )
+            queue_set(indicator_ref, serialised_indicator)
+            result.indicator_paths.append(indicator_ref.path)
 
         return result
 
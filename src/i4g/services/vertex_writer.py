@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
 
 from google.cloud import discoveryengine_v1beta as discoveryengine
 from google.protobuf import json_format
@@ -13,6 +14,9 @@ from i4g.services.vertex_documents import VertexDocumentBuilderError, build_vert
 
 LOGGER = logging.getLogger(__name__)
 
+# Inline import requests accept at most 100 documents each.
+MAX_IMPORT_DOCUMENTS = 100
+
 
 @dataclass(slots=True)
 class VertexWriteResult:
@@ -22,6 +26,13 @@ class VertexWriteResult:
     warnings: List[str] = field(default_factory=list)
 
 
+@lru_cache(maxsize=1)
+def _document_client() -> discoveryengine.DocumentServiceClient:
+    """Share one DocumentService client (and its gRPC channel) across writers."""
+
+    return discoveryengine.DocumentServiceClient()
+
+
 class VertexWriterError(RuntimeError):
     """Raised when Vertex ingestion fails despite retries."""
 
@@ -43,7 +54,7 @@ class VertexDocumentWriter:
         if not project or not data_store_id:
             raise ValueError("VertexDocumentWriter requires both project and data_store_id")
 
-        self._client = client or discoveryengine.DocumentServiceClient()
+        self._client = client or _document_client()
         self._parent = self._client.branch_path(
             project=project,
             location=location,
@@ -57,22 +68,39 @@ class VertexDocumentWriter:
     def upsert_record(self, record: Dict[str, Any]) -> VertexWriteResult:
         """Persist a single record to Vertex AI Search via import_documents."""
 
+        return self.upsert_records([record])[0]
+
+    def upsert_records(self, records: Sequence[Dict[str, Any]]) -> List[VertexWriteResult]:
+        """Persist several records with as few import_documents calls as possible.
+
+        Documents are imported in chunks of ``MAX_IMPORT_DOCUMENTS``. Vertex does not
+        attribute ``error_samples`` to individual documents, so any warnings are
+        attached to every result of the chunk that produced them.
+        """
+
         try:
-            document = build_vertex_document(record, default_dataset=self._default_dataset)
+            documents = [build_vertex_document(record, default_dataset=self._default_dataset) for record in records]
         except VertexDocumentBuilderError as exc:  # pragma: no cover - builder already logged
             raise VertexWriterError(str(exc)) from exc
 
+        results: List[VertexWriteResult] = []
+        for start in range(0, len(documents), MAX_IMPORT_DOCUMENTS):
+            results.extend(self._import_documents(documents[start : start + MAX_IMPORT_DOCUMENTS]))
+        return results
+
+    def _import_documents(self, documents: Sequence[discoveryengine.Document]) -> List[VertexWriteResult]:
         request = discoveryengine.ImportDocumentsRequest(
             parent=self._parent,
-            inline_source=discoveryengine.ImportDocumentsRequest.InlineSource(documents=[document]),
+            inline_source=discoveryengine.ImportDocumentsRequest.InlineSource(documents=documents),
             reconciliation_mode=self._reconcile_mode,
         )
 
+        document_ids = ", ".join(document.id for document in documents)
         try:
             operation = self._client.import_documents(request=request)
             response = operation.result(timeout=self._timeout)
         except Exception as exc:  # pragma: no cover - network/backend failure
-            raise VertexWriterError(f"Vertex import failed for document_id={document.id}: {exc}") from exc
+            raise VertexWriterError(f"Vertex import failed for document_id={document_ids}: {exc}") from exc
 
         warnings: List[str] = []
         for sample in getattr(response, "error_samples", [])[:3]:
@@ -82,9 +110,9 @@ class VertexDocumentWriter:
                 warnings.append(str(sample))
 
         if warnings:
-            LOGGER.warning("Vertex import completed with warnings for document_id=%s", document.id)
+            LOGGER.warning("Vertex import completed with warnings for document_id=%s", document_ids)
 
-        return VertexWriteResult(document_id=document.id, warnings=warnings)
+        return [VertexWriteResult(document_id=document.id, warnings=list(warnings)) for document in documents]
 
 
 __all__ = ["VertexDocumentWriter", "VertexWriteResult", "VertexWriterError"]
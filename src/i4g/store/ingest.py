@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import logging
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence
 
 from i4g.services.factories import (
     build_firestore_writer,
@@ -51,6 +54,23 @@ class IngestResult:
     firestore_error: str | None = None
 
 
+class PartialIngestError(RuntimeError):
+    """Raised when a bulk ingest fails after some of its rows were already written.
+
+    Replaying the batch would write those rows again, so callers should queue
+    backend retries from :attr:`results` instead of retrying case by case.
+
+    Attributes:
+        results: One :class:`IngestResult` per payload, in input order, with every
+            optional backend write that did not complete marked as attempted and
+            failed. Empty when the error was raised without them.
+    """
+
+    def __init__(self, message: str, results: Sequence[IngestResult] = ()) -> None:
+        super().__init__(message)
+        self.results = list(results)
+
+
 @dataclass(slots=True)
 class BackendWriteAttempt:
     """Represents the outcome of an optional backend write."""
@@ -125,6 +145,20 @@ def build_case_bundle(
     return CaseBundle(case=case_payload, documents=documents, entities=entities)
 
 
+def flatten_entities(entities: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Reduce ``{"people": [{"value": "Anna"}, ...]}`` to ``{"people": ["Anna", ...]}``.
+
+    Plain string entries pass through unchanged, so flattening an already flat
+    mapping is a cheap copy. Non-list values are dropped.
+    """
+
+    return {
+        key: [value["value"] if isinstance(value, dict) else value for value in values]
+        for key, values in entities.items()
+        if isinstance(values, list)
+    }
+
+
 def _normalise_entity_value(raw_value: Any) -> tuple[str | None, float, str | None]:
     if isinstance(raw_value, dict):
         canonical = raw_value.get("value") or raw_value.get("canonical")
@@ -179,6 +213,7 @@ class IngestPipeline:
         self.sql_writer: Optional[SqlWriter]
         self.vertex_writer: Optional["VertexDocumentWriter"] = None
         self.firestore_writer: Optional["FirestoreWriter"] = None
+        self._fanout_executor: Optional[ThreadPoolExecutor] = None
 
         if vector_store is not None:
             self.vector_store = vector_store
@@ -250,48 +285,13 @@ class IngestPipeline:
         Returns:
             :class:`IngestResult` describing all persistence side-effects.
         """
-        case_id = classification_result.get("case_id") or str(uuid.uuid4())
-
-        record = ScamRecord(
-            case_id=case_id,
-            text=classification_result.get("text", ""),
-            entities={
-                k: [v["value"] if isinstance(v, dict) else v for v in vs]
-                for k, vs in classification_result.get("entities", {}).items()
-                if isinstance(vs, list)
-            },
-            classification=classification_result.get("fraud_type", ""),
-            confidence=float(classification_result.get("fraud_confidence", 0.0)),
-            created_at=datetime.utcnow(),
-            metadata={
-                "explanation": classification_result.get("explanation"),
-                "reasons": classification_result.get("reasons"),
-            },
-        )
+        record = self._build_record(classification_result)
+        case_id = record.case_id
 
         # 1️⃣ Structured storage
         self.structured_store.upsert_record(record)
 
-        need_case_bundle = (self._sql_enabled and self.sql_writer is not None) or (
-            self._firestore_enabled and self.firestore_writer is not None
-        )
-        bundle: CaseBundle | None = None
-        if need_case_bundle:
-            text = classification_result.get("text") or record.text
-            if not text:
-                LOGGER.debug("Skipping SQL/Firestore fan-out for case_id=%s due to empty text", record.case_id)
-            else:
-                dataset = self._resolve_dataset(classification_result)
-                try:
-                    bundle = build_case_bundle(
-                        classification_result,
-                        case_id=record.case_id,
-                        dataset=dataset,
-                        text=text,
-                    )
-                except ValueError:
-                    LOGGER.warning("Case bundle missing required fields for case_id=%s", record.case_id)
-
+        bundle = self._build_bundle(classification_result, record)
         sql_result = self._write_sql_case(bundle, ingestion_run_id)
         firestore_attempt = self._write_firestore_case(bundle, sql_result, ingestion_run_id)
 
@@ -317,6 +317,204 @@ class IngestPipeline:
             firestore_error=firestore_attempt.error,
         )
 
+    def ingest_classified_cases(
+        self,
+        classification_results: Sequence[Dict[str, Any]],
+        *,
+        ingestion_run_id: str | None = None,
+    ) -> List[IngestResult]:
+        """Persist a micro-batch of classification payloads with one call per backend.
+
+        Structured rows are written in one transaction, SQL bundles share one
+        session, Firestore writes share batch commits, and Vertex receives a single
+        multi-document import. Vector and Vertex writes run on a two-thread pool so
+        their RPCs overlap with the SQL/Firestore writes. When a bulk backend call
+        fails the batch is replayed case by case so failures stay attributed to the
+        records that caused them.
+
+        Args:
+            classification_results: Classifier payloads, as accepted by
+                :meth:`ingest_classified_case`.
+
+        Keyword Args:
+            ingestion_run_id: When provided, stored alongside SQL dual-write rows.
+
+        Returns:
+            One :class:`IngestResult` per payload, in input order.
+
+        Raises:
+            PartialIngestError: A write failed after the structured rows were
+                committed; its ``results`` flag the backend writes to retry.
+        """
+        if not classification_results:
+            return []
+
+        # Everything that can reject a payload runs before the first write.
+        records = [self._build_record(result) for result in classification_results]
+        bundles = [self._build_bundle(result, record) for result, record in zip(classification_results, records)]
+
+        # 1️⃣ Structured storage (all-or-nothing; a failure here leaves nothing written)
+        self.structured_store.upsert_records(records)
+
+        sql_results: List[SqlWriterResult | None] = [None] * len(records)
+        firestore_attempts: List[BackendWriteAttempt] | None = None
+        vertex_future = None
+        try:
+            # Vector embeddings and the Vertex import do not depend on the SQL/Firestore
+            # results, so their RPCs overlap with the dual writes below.
+            executor = self._fanout_pool()
+            vector_future = executor.submit(self._write_vectors, records)
+            vertex_future = executor.submit(self._write_vertex_documents, classification_results)
+
+            sql_results = self._write_sql_cases(bundles, ingestion_run_id)
+            firestore_attempts = self._write_firestore_cases(bundles, sql_results, ingestion_run_id)
+
+            # 2️⃣ Vector storage
+            vector_written = vector_future.result()
+            vertex_attempts = vertex_future.result()
+        except Exception as exc:
+            raise PartialIngestError(
+                f"Bulk ingest failed after structured rows were written for {len(records)} cases",
+                results=self._partial_results(records, bundles, sql_results, firestore_attempts, vertex_future, exc),
+            ) from exc
+
+        return [
+            IngestResult(
+                case_id=record.case_id,
+                sql_result=sql_result,
+                vector_written=vector_written,
+                vertex_written=vertex_attempt.succeeded,
+                firestore_written=firestore_attempt.succeeded,
+                vertex_attempted=vertex_attempt.attempted,
+                firestore_attempted=firestore_attempt.attempted,
+                vertex_error=vertex_attempt.error,
+                firestore_error=firestore_attempt.error,
+            )
+            for record, sql_result, firestore_attempt, vertex_attempt in zip(
+                records, sql_results, firestore_attempts, vertex_attempts
+            )
+        ]
+
+    def _partial_results(
+        self,
+        records: Sequence[ScamRecord],
+        bundles: Sequence[CaseBundle | None],
+        sql_results: Sequence[SqlWriterResult | None],
+        firestore_attempts: Sequence[BackendWriteAttempt] | None,
+        vertex_future: Future | None,
+        error: Exception,
+    ) -> List[IngestResult]:
+        """Describe a batch that failed after its structured rows were committed.
+
+        Backend writes that finished keep their outcome; every other enabled write is
+        reported as attempted and failed so the caller can queue a retry for it.
+        Firestore is only flagged for cases with a SQL result, which its replay needs.
+        """
+        message = str(error)
+        failed = BackendWriteAttempt(attempted=True, succeeded=False, error=message)
+        skipped = BackendWriteAttempt(attempted=False, succeeded=False)
+
+        vertex_attempts: Sequence[BackendWriteAttempt] | None = None
+        if vertex_future is not None:
+            try:
+                vertex_attempts = vertex_future.result()
+            except Exception:
+                vertex_attempts = None
+        if vertex_attempts is None:
+            vertex_enabled = self._vertex_enabled and self.vertex_writer is not None
+            vertex_attempts = [failed if vertex_enabled else skipped] * len(records)
+
+        if firestore_attempts is None:
+            firestore_enabled = self._firestore_enabled and self.firestore_writer is not None
+            firestore_attempts = [
+                failed if firestore_enabled and bundle is not None and sql_result is not None else skipped
+                for bundle, sql_result in zip(bundles, sql_results)
+            ]
+
+        return [
+            IngestResult(
+                case_id=record.case_id,
+                sql_result=sql_result,
+                vertex_written=vertex_attempt.succeeded,
+                firestore_written=firestore_attempt.succeeded,
+                vertex_attempted=vertex_attempt.attempted,
+                firestore_attempted=firestore_attempt.attempted,
+                vertex_error=vertex_attempt.error,
+                firestore_error=firestore_attempt.error,
+            )
+            for record, sql_result, firestore_attempt, vertex_attempt in zip(
+                records, sql_results, firestore_attempts, vertex_attempts
+            )
+        ]
+
+    def ingest_many(
+        self,
+        classification_results: Iterable[Dict[str, Any]],
+        *,
+        batch_size: int = 256,
+        ingestion_run_id: str | None = None,
+    ) -> List[IngestResult]:
+        """Ingest an arbitrarily large payload stream in bulk batches.
+
+        Payloads are grouped into chunks of ``batch_size`` and each chunk goes
+        through :meth:`ingest_classified_cases`, so embedding and vector-store
+        writes happen once per chunk rather than once per case. The vector store
+        persists once at the end of the run.
+
+        Returns:
+            One :class:`IngestResult` per payload, in input order.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        results: List[IngestResult] = []
+        iterator = iter(classification_results)
+        # The vector index is flushed to disk once after the last chunk, not after every write.
+        deferred = (
+            self.vector_store.deferred_persist()
+            if self._vector_enabled and self.vector_store is not None
+            else nullcontext()
+        )
+        with deferred:
+            while batch := list(islice(iterator, batch_size)):
+                results.extend(self.ingest_classified_cases(batch, ingestion_run_id=ingestion_run_id))
+        return results
+
+    def _build_record(self, classification_result: Dict[str, Any]) -> ScamRecord:
+        return ScamRecord(
+            case_id=classification_result.get("case_id") or str(uuid.uuid4()),
+            text=classification_result.get("text", ""),
+            entities=flatten_entities(classification_result.get("entities", {})),
+            classification=classification_result.get("fraud_type", ""),
+            confidence=float(classification_result.get("fraud_confidence", 0.0)),
+            created_at=datetime.utcnow(),
+            metadata={
+                "explanation": classification_result.get("explanation"),
+                "reasons": classification_result.get("reasons"),
+            },
+        )
+
+    def _build_bundle(self, classification_result: Dict[str, Any], record: ScamRecord) -> CaseBundle | None:
+        need_case_bundle = (self._sql_enabled and self.sql_writer is not None) or (
+            self._firestore_enabled and self.firestore_writer is not None
+        )
+        if not need_case_bundle:
+            return None
+        text = classification_result.get("text") or record.text
+        if not text:
+            LOGGER.debug("Skipping SQL/Firestore fan-out for case_id=%s due to empty text", record.case_id)
+            return None
+        dataset = self._resolve_dataset(classification_result)
+        try:
+            return build_case_bundle(
+                classification_result,
+                case_id=record.case_id,
+                dataset=dataset,
+                text=text,
+            )
+        except ValueError:
+            LOGGER.warning("Case bundle missing required fields for case_id=%s", record.case_id)
+            return None
+
     def query_similar_cases(self, text: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """Search for semantically similar scam cases."""
         if self.vector_store is None:
@@ -366,6 +564,101 @@ class IngestPipeline:
             LOGGER.exception("Vertex writer failed for case_id=%s", classification_result.get("case_id"))
             return BackendWriteAttempt(attempted=True, succeeded=False, error=str(exc))
 
+    def close(self) -> None:
+        """Shut down the fan-out worker threads used by :meth:`ingest_classified_cases`."""
+        executor, self._fanout_executor = self._fanout_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _fanout_pool(self) -> ThreadPoolExecutor:
+        if self._fanout_executor is None:
+            self._fanout_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ingest-fanout")
+        return self._fanout_executor
+
+    def _write_vectors(self, records: Sequence[ScamRecord]) -> bool:
+        if not self._vector_enabled or self.vector_store is None:
+            return False
+        try:
+            self.vector_store.add_records(records)
+            return True
+        except Exception:  # pragma: no cover - embedding backend failures shouldn't abort ingestion
+            LOGGER.exception("Vector store write failed for %d cases", len(records))
+            return False
+
+    def _write_sql_cases(
+        self,
+        bundles: Sequence[CaseBundle | None],
+        ingestion_run_id: str | None,
+    ) -> List[SqlWriterResult | None]:
+        results: List[SqlWriterResult | None] = [None] * len(bundles)
+        if not self._sql_enabled or self.sql_writer is None:
+            return results
+        indexes = [index for index, bundle in enumerate(bundles) if bundle is not None]
+        if not indexes:
+            return results
+        try:
+            written = self.sql_writer.persist_case_bundles(
+                [bundles[index] for index in indexes], ingestion_run_id=ingestion_run_id
+            )
+        except Exception:  # pragma: no cover - fall back to per-case writes to isolate the failure
+            LOGGER.warning("Bulk SQL write failed for %d cases; retrying individually", len(indexes), exc_info=True)
+            for index in indexes:
+                results[index] = self._write_sql_case(bundles[index], ingestion_run_id)
+            return results
+        for index, sql_result in zip(indexes, written):
+            results[index] = sql_result
+        return results
+
+    def _write_firestore_cases(
+        self,
+        bundles: Sequence[CaseBundle | None],
+        sql_results: Sequence[SqlWriterResult | None],
+        ingestion_run_id: str | None,
+    ) -> List[BackendWriteAttempt]:
+        attempts = [BackendWriteAttempt(attempted=False, succeeded=False) for _ in bundles]
+        if not self._firestore_enabled or self.firestore_writer is None:
+            return attempts
+        indexes = [
+            index
+            for index, (bundle, sql_result) in enumerate(zip(bundles, sql_results))
+            if bundle is not None and sql_result is not None
+        ]
+        if not indexes:
+            return attempts
+        try:
+            self.firestore_writer.persist_case_bundles(
+                [(bundles[index], sql_results[index]) for index in indexes],
+                ingestion_run_id=ingestion_run_id,
+            )
+        except Exception:  # pragma: no cover - fall back to per-case writes to isolate the failure
+            LOGGER.warning(
+                "Bulk Firestore write failed for %d cases; retrying individually", len(indexes), exc_info=True
+            )
+            for index in indexes:
+                attempts[index] = self._write_firestore_case(bundles[index], sql_results[index], ingestion_run_id)
+            return attempts
+        for index in indexes:
+            attempts[index] = BackendWriteAttempt(attempted=True, succeeded=True)
+        return attempts
+
+    def _write_vertex_documents(self, classification_results: Sequence[Dict[str, Any]]) -> List[BackendWriteAttempt]:
+        if not self._vertex_enabled or self.vertex_writer is None:
+            return [BackendWriteAttempt(attempted=False, succeeded=False) for _ in classification_results]
+
+        payloads = []
+        for classification_result in classification_results:
+            payload = dict(classification_result)
+            payload.setdefault("dataset", payload.get("dataset") or self._default_dataset)
+            payloads.append(payload)
+        try:
+            self.vertex_writer.upsert_records(payloads)
+        except Exception:  # pragma: no cover - fall back to per-record imports to isolate the failure
+            LOGGER.warning(
+                "Bulk Vertex import failed for %d records; retrying individually", len(payloads), exc_info=True
+            )
+            return [self._write_vertex_document(result) for result in classification_results]
+        return [BackendWriteAttempt(attempted=True, succeeded=True) for _ in classification_results]
+
     def _resolve_dataset(self, classification_result: Dict[str, Any]) -> str:
         metadata = classification_result.get("metadata")
         if not isinstance(metadata, dict):
@@ -7,9 +7,10 @@ import uuid
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Collection, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session, sessionmaker
 
 from i4g.store import sql as sql_schema
@@ -34,6 +35,16 @@ class RetryItem:
     next_attempt_at: datetime
 
 
+@dataclass(slots=True)
+class RetryEnqueueSpec:
+    """Pending retry entry accepted by :meth:`IngestionRetryStore.enqueue_many`."""
+
+    case_id: str
+    backend: str
+    payload: Dict[str, Any]
+    delay_seconds: int = 0
+
+
 class IngestionRetryStore:
     """CRUD helpers around the ``ingestion_retry_queue`` table."""
 
@@ -62,63 +73,124 @@ class IngestionRetryStore:
     ) -> str:
         """Insert or update a retry entry for ``case_id``/``backend``."""
 
+        spec = RetryEnqueueSpec(case_id=case_id, backend=backend, payload=payload, delay_seconds=delay_seconds)
+        return self.enqueue_many([spec])[0]
+
+    def enqueue_many(self, items: Sequence[RetryEnqueueSpec]) -> List[str]:
+        """Insert or update many retry entries in a single transaction.
+
+        Entries are coalesced on ``case_id``/``backend``: a later failure replaces the payload and
+        ``next_attempt_at`` of the existing row (keeping its ``retry_id`` and ``attempt_count``).
+        Duplicates within ``items`` collapse to the last one. Returns one ``retry_id`` per pair.
+        """
+
+        if not items:
+            return []
+
+        latest: Dict[Tuple[str, str], RetryEnqueueSpec] = {}
+        for item in items:
+            latest[(item.case_id, item.backend)] = item
+
         timestamp = _utcnow()
-        next_attempt = timestamp + timedelta(seconds=max(delay_seconds, 0))
-        retry_id = str(uuid.uuid4())
+        rows = [
+            {
+                "retry_id": str(uuid.uuid4()),
+                "case_id": item.case_id,
+                "backend": item.backend,
+                "payload_json": item.payload,
+                "attempt_count": 0,
+                "next_attempt_at": timestamp + timedelta(seconds=max(item.delay_seconds, 0)),
+                "created_at": timestamp,
+                "updated_at": timestamp,
+            }
+            for item in latest.values()
+        ]
 
         with self._session_scope() as session:
-            existing = session.execute(
-                sa.select(sql_schema.ingestion_retry_queue).where(
-                    sql_schema.ingestion_retry_queue.c.case_id == case_id,
-                    sql_schema.ingestion_retry_queue.c.backend == backend,
-                )
-            ).first()
-
-            if existing:
-                retry_id = existing.retry_id
-                session.execute(
-                    sa.update(sql_schema.ingestion_retry_queue)
-                    .where(sql_schema.ingestion_retry_queue.c.retry_id == retry_id)
-                    .values(
-                        payload_json=payload,
-                        next_attempt_at=next_attempt,
-                        updated_at=timestamp,
-                    )
+            retry_ids = self._upsert(session, rows)
+            if retry_ids is None:
+                retry_ids = self._select_then_write(session, rows)
+
+        LOGGER.info("Queued %s retry entr%s", len(rows), "y" if len(rows) == 1 else "ies")
+        return [retry_ids[key] for key in latest]
+
+    @staticmethod
+    def _upsert(session: Session, rows: List[Dict[str, Any]]) -> Optional[Dict[Tuple[str, str], str]]:
+        """Write ``rows`` with ``INSERT ... ON CONFLICT (case_id, backend) DO UPDATE`` where supported."""
+
+        dialect = session.get_bind().dialect.name
+        if dialect == "postgresql":
+            insert = postgresql.insert
+        elif dialect == "sqlite":
+            insert = sqlite.insert
+        else:
+            return None
+
+        table = sql_schema.ingestion_retry_queue
+        statement = insert(table).values(rows)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.case_id, table.c.backend],
+            set_={
+                "payload_json": statement.excluded.payload_json,
+                "next_attempt_at": statement.excluded.next_attempt_at,
+                "updated_at": statement.excluded.updated_at,
+            },
+        ).returning(table.c.case_id, table.c.backend, table.c.retry_id)
+        return {(row.case_id, row.backend): row.retry_id for row in session.execute(statement)}
+
+    @staticmethod
+    def _select_then_write(session: Session, rows: List[Dict[str, Any]]) -> Dict[Tuple[str, str], str]:
+        """Portable fallback: look up existing pairs, then batch the inserts and updates."""
+
+        table = sql_schema.ingestion_retry_queue
+        existing = {
+            (row.case_id, row.backend): row.retry_id
+            for row in session.execute(
+                sa.select(table.c.retry_id, table.c.case_id, table.c.backend).where(
+                    table.c.case_id.in_({row["case_id"] for row in rows})
                 )
-                LOGGER.info(
-                    "Updated retry queue entry retry_id=%s backend=%s case_id=%s",
-                    retry_id,
-                    backend,
-                    case_id,
+            )
+        }
+        retry_ids: Dict[Tuple[str, str], str] = {}
+        inserts: List[Dict[str, Any]] = []
+        updates: List[Dict[str, Any]] = []
+        for row in rows:
+            key = (row["case_id"], row["backend"])
+            retry_id = existing.get(key)
+            if retry_id:
+                updates.append(
+                    {
+                        "target_retry_id": retry_id,
+                        "payload_json": row["payload_json"],
+                        "next_attempt_at": row["next_attempt_at"],
+                        "updated_at": row["updated_at"],
+                    }
                 )
-                return retry_id
+            else:
+                retry_id = row["retry_id"]
+                inserts.append(row)
+            retry_ids[key] = retry_id
 
-            session.execute(
-                sa.insert(sql_schema.ingestion_retry_queue).values(
-                    retry_id=retry_id,
-                    case_id=case_id,
-                    backend=backend,
-                    payload_json=payload,
-                    attempt_count=0,
-                    next_attempt_at=next_attempt,
-                    created_at=timestamp,
-                    updated_at=timestamp,
-                )
-            )
-            LOGGER.info("Queued retry retry_id=%s backend=%s case_id=%s", retry_id, backend, case_id)
-        return retry_id
+        if inserts:
+            session.execute(sa.insert(table), inserts)
+        if updates:
+            session.execute(sa.update(table).where(table.c.retry_id == sa.bindparam("target_retry_id")), updates)
+        return retry_ids
+
+    def fetch_ready(self, *, limit: int = 25, exclude_ids: Collection[str] = ()) -> List[RetryItem]:
+        """Return retry entries whose ``next_attempt_at`` has elapsed.
 
-    def fetch_ready(self, *, limit: int = 25) -> List[RetryItem]:
-        """Return retry entries whose ``next_attempt_at`` has elapsed."""
+        ``exclude_ids`` skips entries that are still in flight, so a caller can fetch the next
+        page while the current one is being replayed.
+        """
 
         now = _utcnow()
+        table = sql_schema.ingestion_retry_queue
+        query = sa.select(table).where(table.c.next_attempt_at <= now)
+        if exclude_ids:
+            query = query.where(table.c.retry_id.not_in(list(exclude_ids)))
         with self._session_scope() as session:
-            rows = session.execute(
-                sa.select(sql_schema.ingestion_retry_queue)
-                .where(sql_schema.ingestion_retry_queue.c.next_attempt_at <= now)
-                .order_by(sql_schema.ingestion_retry_queue.c.next_attempt_at.asc())
-                .limit(limit)
-            ).fetchall()
+            rows = session.execute(query.order_by(table.c.next_attempt_at.asc()).limit(limit)).fetchall()
 
         items: List[RetryItem] = []
         for row in rows:
@@ -174,4 +246,4 @@ class IngestionRetryStore:
             return next_count
 
 
-__all__ = ["IngestionRetryStore", "RetryItem"]
+__all__ = ["IngestionRetryStore", "RetryEnqueueSpec", "RetryItem"]
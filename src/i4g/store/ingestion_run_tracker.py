@@ -6,7 +6,7 @@ import logging
 import uuid
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Iterator, Literal, Optional
+from typing import Iterator, Literal, Optional, Sequence
 
 import sqlalchemy as sa
 from sqlalchemy.orm import Session, sessionmaker
@@ -72,16 +72,35 @@ class IngestionRunTracker:
     ) -> None:
         """Increment counters for a successfully processed case."""
 
-        entity_count = len(sql_result.entity_ids) if sql_result else 0
-        indicator_count = len(sql_result.indicator_ids) if sql_result else 0
-        sql_writes = 1 if sql_result else 0
+        self.record_cases_bulk(
+            run_id,
+            [sql_result],
+            firestore_writes=firestore_writes,
+            vertex_writes=vertex_writes,
+        )
+
+    def record_cases_bulk(
+        self,
+        run_id: str,
+        sql_results: Sequence[SqlWriterResult | None],
+        *,
+        firestore_writes: int = 0,
+        vertex_writes: int = 0,
+    ) -> None:
+        """Increment counters for a batch of processed cases with a single UPDATE."""
+
+        if not sql_results and not firestore_writes and not vertex_writes:
+            return
+        entity_count = sum(len(result.entity_ids) for result in sql_results if result)
+        indicator_count = sum(len(result.indicator_ids) for result in sql_results if result)
+        sql_writes = sum(1 for result in sql_results if result)
         timestamp = _utcnow()
         with self._session_scope() as session:
             session.execute(
                 sa.update(sql_schema.ingestion_runs)
                 .where(sql_schema.ingestion_runs.c.run_id == run_id)
                 .values(
-                    case_count=sql_schema.ingestion_runs.c.case_count + 1,
+                    case_count=sql_schema.ingestion_runs.c.case_count + len(sql_results),
                     entity_count=sql_schema.ingestion_runs.c.entity_count + entity_count,
                     indicator_count=sql_schema.ingestion_runs.c.indicator_count + indicator_count,
                     sql_writes=sql_schema.ingestion_runs.c.sql_writes + sql_writes,
@@ -15,10 +15,12 @@ Key features:
 
 import json
 import sqlite3
+import threading
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from i4g.settings import get_settings
 
@@ -40,77 +42,118 @@ class ReviewStore:
             resolved = (Path(SETTINGS.project_root) / resolved).resolve()
         resolved.parent.mkdir(parents=True, exist_ok=True)
         self.db_path = resolved
+        # One connection per store, shared across threads and serialised by the lock.
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        # Depth of nested ``bulk()`` blocks; only touched while holding the lock.
+        self._bulk_depth = 0
         self._init_tables()
 
     # -------------------------------------------------------------------------
     # Internal utilities
     # -------------------------------------------------------------------------
-    def _connect(self) -> sqlite3.Connection:
-        """Return a SQLite connection with row factory set to dict."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        return conn
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Yield the shared connection under the store lock, committing on success.
+
+        Inside :meth:`bulk` the commit (or rollback) is left to the enclosing block.
+        """
+        with self._lock:
+            if self._bulk_depth:
+                yield self._conn
+                return
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.rollback()
+                raise
+            else:
+                self._conn.commit()
+
+    @contextmanager
+    def bulk(self) -> Iterator["ReviewStore"]:
+        """Group every store call made inside the block into one transaction.
+
+        The store lock is held for the whole block, so other threads wait until
+        it commits (or rolls back on error).
+        """
+        with self._lock:
+            self._bulk_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._bulk_depth -= 1
+                if not self._bulk_depth:
+                    self._conn.rollback()
+                raise
+            else:
+                self._bulk_depth -= 1
+                if not self._bulk_depth:
+                    self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
 
     def _init_tables(self) -> None:
         """Create required tables if they do not exist."""
-        conn = self._connect()
-        cur = conn.cursor()
-
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS review_queue (
-                review_id TEXT PRIMARY KEY,
-                case_id TEXT NOT NULL,
-                queued_at TEXT NOT NULL,
-                priority TEXT DEFAULT 'medium',
-                status TEXT DEFAULT 'queued',
-                assigned_to TEXT,
-                notes TEXT,
-                last_updated TEXT
-            )
-            """
-        )
+        with self._connect() as conn:
+            cur = conn.cursor()
 
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS review_actions (
-                action_id TEXT PRIMARY KEY,
-                review_id TEXT NOT NULL,
-                actor TEXT,
-                action TEXT,
-                payload TEXT,
-                created_at TEXT,
-                FOREIGN KEY (review_id) REFERENCES review_queue (review_id)
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS review_queue (
+                    review_id TEXT PRIMARY KEY,
+                    case_id TEXT NOT NULL,
+                    queued_at TEXT NOT NULL,
+                    priority TEXT DEFAULT 'medium',
+                    status TEXT DEFAULT 'queued',
+                    assigned_to TEXT,
+                    notes TEXT,
+                    last_updated TEXT
+                )
+                """
             )
-            """
-        )
 
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS saved_searches (
-                search_id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                owner TEXT,
-                params TEXT,
-                created_at TEXT,
-                favorite INTEGER DEFAULT 0,
-                tags TEXT DEFAULT '[]'
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS review_actions (
+                    action_id TEXT PRIMARY KEY,
+                    review_id TEXT NOT NULL,
+                    actor TEXT,
+                    action TEXT,
+                    payload TEXT,
+                    created_at TEXT,
+                    FOREIGN KEY (review_id) REFERENCES review_queue (review_id)
+                )
+                """
             )
-            """
-        )
 
-        # Ensure favorite and tags columns exist for older schemas
-        try:
-            cur.execute("ALTER TABLE saved_searches ADD COLUMN favorite INTEGER DEFAULT 0")
-        except sqlite3.OperationalError:
-            pass
-        try:
-            cur.execute("ALTER TABLE saved_searches ADD COLUMN tags TEXT DEFAULT '[]'")
-        except sqlite3.OperationalError:
-            pass
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS saved_searches (
+                    search_id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    owner TEXT,
+                    params TEXT,
+                    created_at TEXT,
+                    favorite INTEGER DEFAULT 0,
+                    tags TEXT DEFAULT '[]'
+                )
+                """
+            )
 
-        conn.commit()
-        conn.close()
+            # Ensure favorite and tags columns exist for older schemas
+            try:
+                cur.execute("ALTER TABLE saved_searches ADD COLUMN favorite INTEGER DEFAULT 0")
+            except sqlite3.OperationalError:
+                pass
+            try:
+                cur.execute("ALTER TABLE saved_searches ADD COLUMN tags TEXT DEFAULT '[]'")
+            except sqlite3.OperationalError:
+                pass
 
     # -------------------------------------------------------------------------
     # Queue management
@@ -170,20 +213,43 @@ class ReviewStore:
         payload: Optional[Dict[str, Any]] = None,
     ) -> str:
         """Insert a review action (for audit trail)."""
-        action_id = str(uuid.uuid4())
+        entry = {"review_id": review_id, "actor": actor, "action": action, "payload": payload}
+        return self.log_actions_bulk([entry])[0]
+
+    def log_actions_bulk(self, entries: Iterable[Dict[str, Any]]) -> List[str]:
+        """Insert several review actions in one transaction.
+
+        Each entry carries ``review_id``, ``actor``, ``action`` and optional ``payload``
+        and ``created_at`` (ISO timestamp; defaults to now) keys.
+
+        Returns:
+            The generated action IDs, in input order.
+        """
         now = datetime.now(timezone.utc).isoformat()
-        payload_json = json.dumps(payload or {})
+        rows = [
+            (
+                str(uuid.uuid4()),
+                entry["review_id"],
+                entry.get("actor"),
+                entry.get("action"),
+                json.dumps(entry.get("payload") or {}),
+                entry.get("created_at") or now,
+            )
+            for entry in entries
+        ]
+        if not rows:
+            return []
 
         with self._connect() as conn:
-            conn.execute(
+            conn.executemany(
                 """
                 INSERT INTO review_actions
                     (action_id, review_id, actor, action, payload, created_at)
                 VALUES (?, ?, ?, ?, ?, ?)
                 """,
-                (action_id, review_id, actor, action, payload_json, now),
+                rows,
             )
-        return action_id
+        return [row[0] for row in rows]
 
     def ensure_placeholder_review(self, review_id: str, *, case_id: str) -> None:
         """Create a queue placeholder so system logs have a review context."""
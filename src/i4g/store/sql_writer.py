@@ -224,24 +224,54 @@ class SqlWriter:
             :class:`SqlWriterResult` summarizing written identifiers.
         """
 
+        return self.persist_case_bundles([bundle], ingestion_run_id=ingestion_run_id)[0]
+
+    def persist_case_bundles(
+        self, bundles: Sequence[CaseBundle], *, ingestion_run_id: str | None = None
+    ) -> List[SqlWriterResult]:
+        """Persist several case bundles inside one transaction.
+
+        Either every bundle is committed or none is; callers that need per-case
+        isolation should retry failed batches through :meth:`persist_case_bundle`.
+
+        Args:
+            bundles: Case payloads to upsert.
+            ingestion_run_id: Optional ingestion run foreign key.
+
+        Returns:
+            One :class:`SqlWriterResult` per bundle, in input order.
+        """
+
+        now = _utcnow()
+        results: List[SqlWriterResult] = []
+        with self._session_scope() as session:
+            for bundle in bundles:
+                results.append(self._persist_bundle(session, bundle, ingestion_run_id, now))
+        return results
+
+    def _persist_bundle(
+        self,
+        session: Session,
+        bundle: CaseBundle,
+        ingestion_run_id: str | None,
+        now: datetime,
+    ) -> SqlWriterResult:
         case_payload = bundle.case
         case_id = _generate_uuid(case_payload.case_id)
         raw_text_hash = case_payload.raw_text_sha256 or _hash_text(case_payload.text)
-        now = _utcnow()
 
-        with self._session_scope() as session:
-            self._upsert_case(session, case_id, case_payload, raw_text_hash, ingestion_run_id, now)
-            doc_ids, doc_alias_map = self._persist_documents(session, case_id, bundle.documents, now)
-            entity_ids, entity_alias_map = self._persist_entities(session, case_id, bundle.entities, doc_alias_map, now)
-            indicator_ids = self._persist_indicators(
-                session,
-                case_id,
-                bundle.indicators,
-                doc_alias_map,
-                entity_alias_map,
-                case_payload.dataset,
-                now,
-            )
+        self._upsert_case(session, case_id, case_payload, raw_text_hash, ingestion_run_id, now)
+        doc_ids, doc_alias_map = self._persist_documents(session, case_id, bundle.documents, now)
+        entity_ids, entity_alias_map = self._persist_entities(session, case_id, bundle.entities, doc_alias_map, now)
+        indicator_ids = self._persist_indicators(
+            session,
+            case_id,
+            bundle.indicators,
+            doc_alias_map,
+            entity_alias_map,
+            case_payload.dataset,
+            now,
+        )
 
         return SqlWriterResult(case_id=case_id, document_ids=doc_ids, entity_ids=entity_ids, indicator_ids=indicator_ids)
 
@@ -16,7 +16,7 @@ import json
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from i4g.settings import get_settings
 from i4g.store.schema import ScamRecord
@@ -89,31 +89,48 @@ class StructuredStore:
         Args:
             record: ScamRecord instance to persist.
         """
+        self.upsert_records([record])
+
+    def upsert_records(self, records: Sequence[ScamRecord]) -> None:
+        """Insert or update several ScamRecords in a single transaction.
+
+        Args:
+            records: ScamRecord instances to persist.
+        """
+        if not records:
+            return
         cur = self._conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO scam_records (case_id, text, entities, classification, confidence, created_at, embedding, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(case_id) DO UPDATE SET
-                text=excluded.text,
-                entities=excluded.entities,
-                classification=excluded.classification,
-                confidence=excluded.confidence,
-                created_at=excluded.created_at,
-                embedding=excluded.embedding,
-                metadata=excluded.metadata
-            """,
-            (
-                record.case_id,
-                record.text,
-                json.dumps(record.entities),
-                record.classification,
-                float(record.confidence),
-                record.created_at.isoformat(),
-                json.dumps(record.embedding) if record.embedding is not None else None,
-                json.dumps(record.metadata) if record.metadata is not None else None,
-            ),
-        )
+        try:
+            cur.executemany(
+                """
+                INSERT INTO scam_records (case_id, text, entities, classification, confidence, created_at, embedding, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(case_id) DO UPDATE SET
+                    text=excluded.text,
+                    entities=excluded.entities,
+                    classification=excluded.classification,
+                    confidence=excluded.confidence,
+                    created_at=excluded.created_at,
+                    embedding=excluded.embedding,
+                    metadata=excluded.metadata
+                """,
+                [
+                    (
+                        record.case_id,
+                        record.text,
+                        json.dumps(record.entities),
+                        record.classification,
+                        float(record.confidence),
+                        record.created_at.isoformat(),
+                        json.dumps(record.embedding) if record.embedding is not None else None,
+                        json.dumps(record.metadata) if record.metadata is not None else None,
+                    )
+                    for record in records
+                ],
+            )
+        except Exception:
+            self._conn.rollback()
+            raise
         self._conn.commit()
 
     def get_by_id(self, case_id: str) -> Optional[ScamRecord]:
@@ -9,8 +9,9 @@ from __future__ import annotations
 import json
 import os
 import shutil
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 from uuid import uuid4
 
 from langchain_chroma import Chroma
@@ -62,6 +63,7 @@ class _ChromaBackend:
             embedding_function=embeddings,
             persist_directory=persist_dir,
         )
+        self.auto_persist = True
 
     def add_texts(
         self,
@@ -70,7 +72,8 @@ class _ChromaBackend:
         ids: Sequence[str],
     ) -> List[str]:
         self.store.add_texts(texts=texts, metadatas=metadatas, ids=ids)
-        self.persist()
+        if self.auto_persist:
+            self.persist()
         return list(ids)
 
     def similarity_search_with_score(self, query_text: str, top_k: int):
@@ -78,7 +81,8 @@ class _ChromaBackend:
 
     def delete(self, ids: Sequence[str]) -> bool:
         self.store.delete(ids=list(ids))
-        self.persist()
+        if self.auto_persist:
+            self.persist()
         return True
 
     def list_collections(self) -> List[str]:
@@ -105,6 +109,7 @@ class _FaissBackend:
         self.persist_dir = Path(persist_dir)
         self.embeddings = embeddings
         self.store: Optional[FAISS] = None
+        self.auto_persist = True
 
         os.makedirs(self.persist_dir, exist_ok=True)
         self._load_if_available()
@@ -135,7 +140,8 @@ class _FaissBackend:
             )
         else:
             self.store.add_texts(texts=list(texts), metadatas=list(metadatas), ids=list(ids))
-        self.persist()
+        if self.auto_persist:
+            self.persist()
         return list(ids)
 
     def similarity_search_with_score(self, query_text: str, top_k: int):
@@ -147,7 +153,8 @@ class _FaissBackend:
         if not self.store:
             return False
         self.store.delete(ids=list(ids))
-        self.persist()
+        if self.auto_persist:
+            self.persist()
         return True
 
     def list_collections(self) -> List[str]:
@@ -317,3 +324,21 @@ class VectorStore:
     def persist(self) -> None:
         """Flush backend state to disk (a no-op for Chroma which auto-persists)."""
         self._backend.persist()
+
+    @contextmanager
+    def deferred_persist(self) -> Iterator["VectorStore"]:
+        """Skip the per-write flush inside the block and persist once on exit.
+
+        The FAISS backend otherwise rewrites its whole index to disk after every
+        ``add_texts``/``delete`` call.
+        """
+        if not self._backend.auto_persist:
+            # Already deferred by an enclosing block, which owns the final flush.
+            yield self
+            return
+        self._backend.auto_persist = False
+        try:
+            yield self
+        finally:
+            self._backend.auto_persist = True
+            self._backend.persist()
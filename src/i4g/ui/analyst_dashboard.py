@@ -14,6 +14,7 @@ It supports:
 
 from __future__ import annotations
 
+import hashlib
 import json
 from datetime import date, datetime, time, timezone
 from pathlib import Path
@@ -53,6 +54,13 @@ def _date_to_iso(value: date, *, use_end_of_day: bool = False) -> str:
     return datetime.combine(value, boundary).replace(tzinfo=timezone.utc).isoformat()
 
 
+def _wk(prefix: str, identifier: Any) -> str:
+    """Return a short, fixed-length widget key for a per-record Streamlit widget."""
+
+    digest = hashlib.blake2b(str(identifier).encode("utf-8"), digest_size=4).hexdigest()
+    return f"{prefix}_{digest}"
+
+
 def run_search(params: Dict[str, Any], offset: int) -> None:
     try:
         st.session_state["case_reviews"] = {}
@@ -77,19 +85,21 @@ def run_search(params: Dict[str, Any], offset: int) -> None:
             "search_id": payload.get("search_id"),
         }
 
-        try:
-            history_payload = ui_api.fetch_search_history(limit=st.session_state.get("history_limit", 10))
+        history_payload, saved_payload = ui_api.fetch_search_side_panels(
+            history_limit=st.session_state.get("history_limit", 10),
+            saved_limit=25,
+        )
+        if isinstance(history_payload, Exception):
+            st.session_state["search_history_error"] = str(history_payload)
+        else:
             st.session_state["search_history"] = history_payload.get("events", [])
             st.session_state["search_history_error"] = None
-        except Exception as exc:
-            st.session_state["search_history_error"] = str(exc)
 
-        try:
-            saved_payload = ui_api.fetch_saved_searches(limit=25)
+        if isinstance(saved_payload, Exception):
+            st.session_state["saved_search_error"] = str(saved_payload)
+        else:
             st.session_state["saved_searches"] = saved_payload.get("items", [])
             st.session_state["saved_search_error"] = None
-        except Exception as exc:
-            st.session_state["saved_search_error"] = str(exc)
     except Exception as exc:
         st.session_state["search_results"] = None
         st.session_state["search_error"] = str(exc)
@@ -121,6 +131,31 @@ def _execute_saved_search(saved_id: str, params: Dict[str, Any]) -> None:
     st.rerun()
 
 
+def _upsert_saved_search(record: Dict[str, Any]) -> None:
+    """Merge a saved-search record returned by the API into the cached list."""
+
+    items = list(st.session_state.get("saved_searches") or [])
+    search_id = record.get("search_id")
+    for idx, item in enumerate(items):
+        if search_id and item.get("search_id") == search_id:
+            items[idx] = record
+            break
+    else:
+        items.insert(0, record)
+    st.session_state["saved_searches"] = items
+
+
+def _rerun_with_cleared_queue_selection() -> None:
+    """Rerun after a queue action without carrying the old row selection over.
+
+    The table selection is a row index; once the action moves a case out of the queue the same index would
+    point at a different review.
+    """
+
+    st.session_state.pop("review_queue_table", None)
+    st.rerun()
+
+
 def _tag_badge(tag: str) -> str:
     color = TAG_PAL[hash(tag) % len(TAG_PAL)]
     return f"<span style='background:{color}; padding:2px 6px; border-radius:6px; margin-right:4px;'>{tag}</span>"
@@ -963,8 +998,7 @@ if search_submitted:
                 favorite=current_favorite,
             )
             st.success(f"Saved search '{save_name.strip()}'")
-            payload = ui_api.fetch_saved_searches(limit=25)
-            st.session_state["saved_searches"] = payload.get("items", [])
+            _upsert_saved_search(response)
             st.session_state["saved_search_error"] = None
             st.session_state["active_saved_search_id"] = response.get("search_id")
         except Exception as exc:
@@ -1078,7 +1112,7 @@ if search_results:
             st.markdown("Semantic match:")
             st.json(vector_hit)
 
-        if st.button("Show queue entries", key=f"show_queue_{case_id}"):
+        if st.button("Show queue entries", key=_wk("show_queue", case_id)):
             try:
                 payload = ui_api.fetch_case_reviews(
                     case_id,
@@ -1099,7 +1133,7 @@ if search_results:
                 st.write(f"- `review_id={review_id}` · status={status} · notes={notes or '—'}")
                 action_cols = st.columns(3)
 
-                if action_cols[0].button("Claim", key=f"claim_search_{review_id}"):
+                if action_cols[0].button("Claim", key=_wk("claim_search", review_id)):
                     try:
                         ui_api.post_action(f"/{review_id}/claim", {})
                         st.success(f"Review {review_id} claimed.")
@@ -1107,7 +1141,7 @@ if search_results:
                     except Exception as exc:
                         st.error(f"Failed to claim {review_id}: {exc}")
 
-                if action_cols[1].button("Accept", key=f"accept_search_{review_id}"):
+                if action_cols[1].button("Accept", key=_wk("accept_search", review_id)):
                     try:
                         ui_api.post_action(
                             f"/{review_id}/decision",
@@ -1122,7 +1156,7 @@ if search_results:
                     except Exception as exc:
                         st.error(f"Failed to accept {review_id}: {exc}")
 
-                if action_cols[2].button("Reject", key=f"reject_search_{review_id}"):
+                if action_cols[2].button("Reject", key=_wk("reject_search", review_id)):
                     try:
                         ui_api.post_action(
                             f"/{review_id}/decision",
@@ -1191,23 +1225,44 @@ if not queue:
 
 st.write(f"Showing {len(queue)} cases (status={status})")
 
-for case in queue:
-    with st.expander(f"Case {case.get('case_id')} / review_id={case.get('review_id')}"):
+# Render read-only fields in one table; action widgets are only built for the selected row.
+queue_rows = [
+    {
+        "case_id": item.get("case_id"),
+        "review_id": item.get("review_id"),
+        "notes": item.get("notes", ""),
+    }
+    for item in queue
+]
+queue_event = st.dataframe(
+    queue_rows,
+    use_container_width=True,
+    hide_index=True,
+    on_select="rerun",
+    selection_mode="single-row",
+    key="review_queue_table",
+)
+selected_rows = [row for row in (queue_event.selection.rows if queue_event else []) if row < len(queue)]
+if not selected_rows:
+    st.caption("Select a case in the table to claim, accept, reject, or generate a report.")
+else:
+    case = queue[selected_rows[0]]
+    with st.expander(f"Case {case.get('case_id')} / review_id={case.get('review_id')}", expanded=True):
         st.write(case.get("notes", "No notes"))
         cols = st.columns([1, 1, 1, 2])
 
         # Claim
-        if cols[0].button("👀 Claim", key=f"claim_{case['review_id']}"):
+        if cols[0].button("👀 Claim", key=_wk("claim", case["review_id"])):
             try:
                 resp = ui_api.post_action(f"/{case['review_id']}/claim", {})
                 st.success("Claimed")
-                st.rerun()
+                _rerun_with_cleared_queue_selection()
             except Exception as e:
                 st.error(f"Claim failed: {e}")
 
         # Accept (with auto_generate_report option)
-        auto_report = cols[1].checkbox("Auto report", key=f"auto_{case['review_id']}")
-        if cols[1].button("✅ Accept", key=f"accept_{case['review_id']}"):
+        auto_report = cols[1].checkbox("Auto report", key=_wk("auto", case["review_id"]))
+        if cols[1].button("✅ Accept", key=_wk("accept", case["review_id"])):
             try:
                 payload = {
                     "decision": "accepted",
@@ -1216,22 +1271,22 @@ for case in queue:
                 }
                 resp = ui_api.post_action(f"/{case['review_id']}/decision", payload)
                 st.success("Accepted")
-                st.rerun()
+                _rerun_with_cleared_queue_selection()
             except Exception as e:
                 st.error(f"Accept failed: {e}")
 
         # Reject
-        if cols[2].button("❌ Reject", key=f"reject_{case['review_id']}"):
+        if cols[2].button("❌ Reject", key=_wk("reject", case["review_id"])):
             try:
                 payload = {"decision": "rejected", "notes": "Rejected via dashboard"}
                 resp = ui_api.post_action(f"/{case['review_id']}/decision", payload)
                 st.success("Rejected")
-                st.rerun()
+                _rerun_with_cleared_queue_selection()
             except Exception as e:
                 st.error(f"Reject failed: {e}")
 
         # Manual report generation
-        if cols[3].button("📄 Generate Report", key=f"report_{case['review_id']}"):
+        if cols[3].button("📄 Generate Report", key=_wk("report", case["review_id"])):
             try:
                 # Ensure the case is marked accepted before triggering report generation
                 ui_api.post_action(
@@ -1258,7 +1313,7 @@ for case in queue:
                 st.error(f"Report generation request failed: {e}")
 
         # Show actions/audit
-        if st.button("Show history", key=f"history_{case['review_id']}"):
+        if st.button("Show history", key=_wk("history", case["review_id"])):
             try:
                 client = ui_api.api_client()
                 r = client.get(f"/{case['review_id']}/actions")
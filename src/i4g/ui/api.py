@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import importlib.util
 import json
-from collections.abc import Sequence
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Dict, List, Optional
 from typing import Sequence as Seq
 
@@ -17,7 +24,34 @@ except ImportError:  # pragma: no cover - optional dependency
     discoveryengine = None  # type: ignore[assignment]
     json_format = None  # type: ignore[assignment]
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - optional speedup
+    simdjson = None  # type: ignore[assignment]
+
 HAS_VERTEX_SEARCH = discoveryengine is not None and json_format is not None
+# HTTP/2 needs the ``h2`` package (``httpx[http2]``); fall back to HTTP/1.1 without it.
+HAS_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def _json_loads(data: str | bytes) -> Any:
+    """Parse JSON with orjson when available, falling back to the stdlib."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json(response: httpx.Response) -> Any:
+    """Raise for HTTP errors, then decode the body straight from bytes."""
+
+    response.raise_for_status()
+    return _json_loads(response.content)
 
 
 @st.cache_resource
@@ -38,17 +72,41 @@ API_BASE_URL = SETTINGS.api.base_url
 API_KEY = SETTINGS.api.key
 
 
-def _convert_struct(data: Any) -> Any:
-    if isinstance(data, (str, int, float, bool)) or data is None:
-        return data
-    if hasattr(data, "items"):
-        return {key: _convert_struct(value) for key, value in data.items()}
-    if isinstance(data, Sequence) and not isinstance(data, (str, bytes, bytearray)):
-        return [_convert_struct(value) for value in data]
-    return data
+@lru_cache(maxsize=32)
+def _compile_boost_spec(boost_json: str) -> Any:
+    """Parse BoostSpec JSON once per distinct string; treat the result as read-only."""
+
+    try:
+        boost_data = _json_loads(boost_json)
+    except json.JSONDecodeError as exc:
+        raise RuntimeError(f"Failed to parse BoostSpec JSON: {exc}") from exc
+
+    boost_spec = discoveryengine.SearchRequest.BoostSpec()
+    json_format.ParseDict(boost_data, boost_spec._pb)
+    return boost_spec
+
+
+def _result_payload(result: Any, include_raw: bool) -> Dict[str, Any]:
+    """Convert only the parts of a SearchResult the dashboard needs to dicts."""
+
+    pb = result._pb  # type: ignore[attr-defined]
+    if include_raw:
+        return json_format.MessageToDict(pb)
+    payload: Dict[str, Any] = {"document": json_format.MessageToDict(pb.document)}
+    if pb.HasField("rank_signals"):
+        payload["rankSignals"] = json_format.MessageToDict(pb.rank_signals)
+    return payload
+
 
+def perform_vertex_search(params: Dict[str, Any], include_raw: bool = False) -> List[VertexResult]:
+    """Run a Discovery search and format the first page of hits.
+
+    Args:
+        params: Search inputs collected by the Discovery panel.
+        include_raw: Convert and keep the full response message for each hit. When
+            False only the document and rank signals are converted and ``raw`` is empty.
+    """
 
-def perform_vertex_search(params: Dict[str, Any]) -> List[Dict[str, Any]]:
     client = _search_client()
 
     serving_config = client.serving_config_path(
@@ -70,55 +128,126 @@ def perform_vertex_search(params: Dict[str, Any]) -> List[Dict[str, Any]]:
 
     boost_json = params.get("boost_json")
     if boost_json:
-        try:
-            boost_data = json.loads(boost_json)
-        except json.JSONDecodeError as exc:
-            raise RuntimeError(f"Failed to parse BoostSpec JSON: {exc}") from exc
-
-        boost_spec = discoveryengine.SearchRequest.BoostSpec()
-        json_format.ParseDict(boost_data, boost_spec._pb)
-        request.boost_spec = boost_spec
+        # Assignment copies the cached message into the request, so it is never mutated.
+        request.boost_spec = _compile_boost_spec(boost_json)
 
+    # Convert each result once as it streams in; every field is then read from plain
+    # dicts rather than through protobuf attribute reflection. The pager would
+    # otherwise fetch follow-up pages transparently, so stop at page_size.
     try:
-        raw_results = list(client.search(request=request))
+        return [
+            _format_result(rank, _result_payload(result, include_raw), include_raw)
+            for rank, result in enumerate(islice(client.search(request=request), request.page_size), start=1)
+        ]
     except Exception as exc:  # pragma: no cover - network/dependency issues
         raise RuntimeError(f"Vertex search failed: {exc}") from exc
 
-    formatted_results: List[Dict[str, Any]] = []
-    for rank, result in enumerate(raw_results, start=1):
-        document = result.document
-        struct: Dict[str, Any] = {}
-        if document.json_data:
-            try:
-                struct = json.loads(document.json_data)
-            except json.JSONDecodeError:
-                struct = _convert_struct(document.struct_data) if document.struct_data else {}
-        elif document.struct_data:
-            struct = _convert_struct(document.struct_data)
-
-        summary = struct.get("summary") or struct.get("text") or struct.get("title") or getattr(document, "title", "")
-        tags = struct.get("tags") or []
-        label = struct.get("ground_truth_label")
-
-        raw_payload = json_format.MessageToDict(result._pb)  # type: ignore[attr-defined]
-
-        formatted_results.append(
-            {
-                "rank": rank,
-                "document_id": document.id,
-                "document_name": document.name,
-                "summary": summary,
-                "label": label,
-                "tags": tags,
-                "source": struct.get("source") or struct.get("index_type"),
-                "index_type": struct.get("index_type"),
-                "struct": struct,
-                "rank_signals": raw_payload.get("rankSignals", {}),
-                "raw": raw_payload,
-            }
-        )
 
-    return formatted_results
+@dataclass(slots=True, frozen=True)
+class VertexResult:
+    """Formatted Discovery search hit rendered by the dashboard."""
+
+    rank: int
+    document_id: Optional[str]
+    document_name: Optional[str]
+    summary: str
+    label: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+    source: Optional[str] = None
+    index_type: Optional[str] = None
+    struct: Dict[str, Any] = field(default_factory=dict)
+    rank_signals: Dict[str, Any] = field(default_factory=dict)
+    raw: Dict[str, Any] = field(default_factory=dict)
+    json_data: Optional[str] = None
+
+    def full_struct(self) -> Dict[str, Any]:
+        """Return every structured field, parsing deferred ``jsonData`` on demand."""
+
+        if self.json_data is None:
+            return self.struct
+        return _json_loads(self.json_data)
+
+
+# Struct fields the results table reads; everything else is parsed only on demand.
+_SUMMARY_FIELDS = ("summary", "text", "title", "tags", "ground_truth_label", "source", "index_type")
+
+
+_SIMDJSON_LOCAL = threading.local()
+
+
+def _simdjson_parser() -> Any:
+    """Return this thread's reusable simdjson parser (Streamlit runs scripts on several threads)."""
+
+    parser = getattr(_SIMDJSON_LOCAL, "parser", None)
+    if parser is None:
+        parser = _SIMDJSON_LOCAL.parser = simdjson.Parser()
+    return parser
+
+
+def _parse_json_data(json_data: str) -> tuple[Dict[str, Any], bool]:
+    """Parse a document's ``jsonData`` blob for the results table.
+
+    With pysimdjson installed only ``_SUMMARY_FIELDS`` are converted to Python
+    objects and the second item is True, meaning the full struct must be parsed
+    later via :meth:`VertexResult.full_struct`. Otherwise the blob is parsed eagerly.
+
+    The parser is reused across calls and invalidates its previous document on each
+    parse, so every value is copied into plain Python objects before returning.
+    """
+
+    if simdjson is not None:
+        parsed = _simdjson_parser().parse(json_data.encode("utf-8"))
+        if isinstance(parsed, simdjson.Object):
+            fields: Dict[str, Any] = {}
+            for key in _SUMMARY_FIELDS:
+                value = parsed.get(key)
+                if isinstance(value, simdjson.Array):
+                    value = value.as_list()
+                elif isinstance(value, simdjson.Object):
+                    value = value.as_dict()
+                if value is not None:
+                    fields[key] = value
+            return fields, True
+    return _json_loads(json_data), False
+
+
+def _intern(value: Any) -> Any:
+    """Intern short repeated labels (source/index_type) shared across results."""
+
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _format_result(rank: int, raw_payload: Dict[str, Any], keep_raw: bool = True, _get: Any = dict.get) -> VertexResult:
+    """Shape one ``MessageToDict`` search result into a :class:`VertexResult`."""
+
+    document = _get(raw_payload, "document") or {}
+    struct: Dict[str, Any] = _get(document, "structData") or {}
+    deferred_json: Optional[str] = None
+    json_data = _get(document, "jsonData")
+    if json_data:
+        try:
+            struct, partial = _parse_json_data(json_data)
+        except ValueError:
+            pass
+        else:
+            deferred_json = json_data if partial else None
+
+    source = _intern(_get(struct, "source"))
+    index_type = _intern(_get(struct, "index_type"))
+    return VertexResult(
+        rank=rank,
+        document_id=_get(document, "id"),
+        document_name=_get(document, "name"),
+        summary=_get(struct, "summary") or _get(struct, "text") or _get(struct, "title") or _get(document, "title", ""),
+        label=_get(struct, "ground_truth_label"),
+        tags=_get(struct, "tags") or [],
+        source=source or index_type,
+        index_type=index_type,
+        struct=struct,
+        rank_signals=_get(raw_payload, "rankSignals", {}),
+        raw=raw_payload if keep_raw else {},
+        json_data=deferred_json,
+    )
 
 
 def vertex_search_available() -> bool:
@@ -127,68 +256,88 @@ def vertex_search_available() -> bool:
     return HAS_VERTEX_SEARCH
 
 
+# Four clients (api/reviews/intakes/accounts) per base/key pair; bounded so stale credentials age out.
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _build_client(
+    base: str,
+    key: str,
+    suffix: str = "",
+    extra_headers: tuple[tuple[str, str], ...] = (),
+    timeout: float = 30.0,
+) -> httpx.Client:
+    """Return a pooled client for a (base, key, suffix) tuple, shared across reruns.
+
+    Clients are intentionally never closed by callers so keep-alive connections are
+    reused between requests. The connection settings are part of the cache key, so a
+    changed base URL or key simply resolves to another client.
+    """
+
+    headers = {"X-API-KEY": key, **dict(extra_headers)}
+    base_url = f"{base.rstrip('/')}{suffix}" if suffix else base
+    return httpx.Client(
+        base_url=base_url,
+        headers=headers,
+        timeout=timeout,
+        transport=httpx.HTTPTransport(
+            retries=1,
+            http2=HAS_HTTP2,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        ),
+    )
+
+
+def _connection() -> tuple[str, str]:
+    return st.session_state.get("api_base", API_BASE_URL), st.session_state.get("api_key", API_KEY)
+
+
 def api_client() -> httpx.Client:
-    base = st.session_state.get("api_base", API_BASE_URL)
-    key = st.session_state.get("api_key", API_KEY)
-    return httpx.Client(base_url=base, headers={"X-API-KEY": key}, timeout=30.0)
+    base, key = _connection()
+    return _build_client(base, key)
 
 
 def reviews_client() -> httpx.Client:
-    base = st.session_state.get("api_base", API_BASE_URL).rstrip("/")
-    key = st.session_state.get("api_key", API_KEY)
-    reviews_base = f"{base}/reviews"
-    return httpx.Client(base_url=reviews_base, headers={"X-API-KEY": key}, timeout=30.0)
+    base, key = _connection()
+    return _build_client(base, key, "/reviews")
 
 
 def intake_client() -> httpx.Client:
-    base = st.session_state.get("api_base", API_BASE_URL).rstrip("/")
-    key = st.session_state.get("api_key", API_KEY)
-    intake_base = f"{base}/intakes"
-    return httpx.Client(base_url=intake_base, headers={"X-API-KEY": key}, timeout=30.0)
+    base, key = _connection()
+    return _build_client(base, key, "/intakes")
 
 
 def account_list_client() -> httpx.Client:
-    base = st.session_state.get("api_base", API_BASE_URL).rstrip("/")
-    key = st.session_state.get("api_key", API_KEY)
-    accounts_base = f"{base}/accounts"
-    headers = {"X-API-KEY": key, "X-ACCOUNTLIST-KEY": key}
-    return httpx.Client(base_url=accounts_base, headers=headers, timeout=60.0)
+    base, key = _connection()
+    return _build_client(base, key, "/accounts", (("X-ACCOUNTLIST-KEY", key),), 60.0)
 
 
 def run_account_list_extraction(payload: Dict[str, Any]) -> Dict[str, Any]:
     client = account_list_client()
     response = client.post("/extract", json=payload)
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
 
 
 def fetch_queue(status: str = "queued", limit: int = 50) -> List[Dict[str, Any]]:
     client = reviews_client()
     response = client.get("/queue", params={"status": status, "limit": limit})
-    response.raise_for_status()
-    data = response.json()
-    return data.get("items", [])
+    return _json(response).get("items", [])
 
 
 def fetch_review(review_id: str) -> Dict[str, Any]:
     client = reviews_client()
     response = client.get(f"/{review_id}")
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
 
 
 def post_action(path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     client = reviews_client()
     response = client.post(path, json=payload)
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
 
 
 def post_patch(path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     client = reviews_client()
     response = client.patch(path, json=payload)
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
 
 
 def search_cases_api(
@@ -217,29 +366,67 @@ def search_cases_api(
 
     client = reviews_client()
     response = client.get("/search", params=params)
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
 
 
 def fetch_case_reviews(case_id: str, limit: int = 5) -> Dict[str, Any]:
     client = reviews_client()
     response = client.get(f"/case/{case_id}", params={"limit": limit})
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
 
 
 def fetch_search_history(limit: int = 10) -> Dict[str, Any]:
     client = reviews_client()
     response = client.get("/search/history", params={"limit": limit})
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
+
+
+@st.cache_resource(show_spinner=False)
+def _side_panel_pool() -> ThreadPoolExecutor:
+    """Return the shared thread pool used to overlap independent reviews API calls."""
+
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="ui-side-panels")
+
+
+def _get_json_or_error(client: httpx.Client, path: str, params: Dict[str, Any]) -> Dict[str, Any] | Exception:
+    try:
+        return _json(client.get(path, params=params))
+    except Exception as exc:
+        return exc
+
+
+def _gather_reviews_gets(requests: Seq[tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any] | Exception]:
+    """Issue independent GETs against the reviews API concurrently.
+
+    The requests share the pooled ``reviews_client()`` so they reuse its keep-alive
+    connections. Each slot holds either the decoded JSON payload or the exception
+    raised for that request, so one failing call does not hide the others.
+    """
+
+    client = reviews_client()
+    pool = _side_panel_pool()
+    futures = [pool.submit(_get_json_or_error, client, path, params) for path, params in requests]
+    return [future.result() for future in futures]
+
+
+def fetch_search_side_panels(
+    history_limit: int = 10, saved_limit: int = 25
+) -> tuple[Dict[str, Any] | Exception, Dict[str, Any] | Exception]:
+    """Fetch search history and saved searches in parallel (one RTT instead of two)."""
+
+    history, saved = _gather_reviews_gets(
+        [
+            ("/search/history", {"limit": history_limit}),
+            ("/search/saved", {"limit": saved_limit, "owner_only": False}),
+        ]
+    )
+    return history, saved
 
 
 def fetch_saved_searches(limit: int = 25, owner_only: bool = False) -> Dict[str, Any]:
     client = reviews_client()
     response = client.get("/search/saved", params={"limit": limit, "owner_only": owner_only})
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
 
 
 def save_search(
@@ -257,8 +444,7 @@ def save_search(
     if favorite is not None:
         body["favorite"] = favorite
     response = client.post("/search/saved", json=body)
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
 
 
 def patch_saved_search(
@@ -276,43 +462,45 @@ def patch_saved_search(
     if favorite is not None:
         payload["favorite"] = favorite
     response = client.patch(f"/search/saved/{search_id}", json=payload)
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
 
 
 def share_saved_search(search_id: str) -> Dict[str, Any]:
     client = reviews_client()
     response = client.post(f"/search/saved/{search_id}/share")
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
 
 
 def export_saved_search(search_id: str) -> Dict[str, Any]:
     client = reviews_client()
     response = client.get(f"/search/saved/{search_id}/export")
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
 
 
 def import_saved_search_api(payload: Dict[str, Any]) -> Dict[str, Any]:
     client = reviews_client()
     response = client.post("/search/saved/import", json=payload)
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
 
 
 def delete_saved_search(search_id: str) -> Dict[str, Any]:
     client = reviews_client()
     response = client.delete(f"/search/saved/{search_id}")
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
 
 
-def fetch_tag_presets(limit: int = 100) -> Dict[str, Any]:
-    client = reviews_client()
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_tag_presets_cached(base_url: str, api_key: str, limit: int) -> Dict[str, Any]:
+    """Fetch tag presets once per connection/limit and reuse them for a minute."""
+
+    client = _build_client(base_url, api_key, "/reviews")
     response = client.get("/search/saved/tag-presets", params={"limit": limit})
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
+
+
+def fetch_tag_presets(limit: int = 100) -> Dict[str, Any]:
+    base, key = _connection()
+    return _fetch_tag_presets_cached(base, key, limit)
 
 
 def submit_intake(submission: Dict[str, Any], attachments: Seq[tuple[str, bytes, str]]) -> Dict[str, Any]:
@@ -320,35 +508,34 @@ def submit_intake(submission: Dict[str, Any], attachments: Seq[tuple[str, bytes,
     data = {"payload": json.dumps(submission)}
     files = [("files", (name, content, content_type)) for name, content, content_type in attachments]
     response = client.post("/", data=data, files=files if files else None)
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
 
 
 def list_intakes(limit: int = 25) -> Dict[str, Any]:
     client = intake_client()
     response = client.get("/", params={"limit": limit})
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
 
 
 def fetch_intake(intake_id: str) -> Dict[str, Any]:
     client = intake_client()
     response = client.get(f"/{intake_id}")
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
 
 
 def fetch_intake_job(job_id: str) -> Dict[str, Any]:
     client = intake_client()
     response = client.get(f"/jobs/{job_id}")
-    response.raise_for_status()
-    return response.json()
+    return _json(response)
+
+
+_TAG_SPLIT = re.compile(r"\s*,\s*")
 
 
 def _parse_tags(raw_value: str) -> List[str]:
     if not raw_value:
         return []
-    return [tag.strip() for tag in raw_value.split(",") if tag.strip()]
+    return [tag for tag in _TAG_SPLIT.split(raw_value.strip()) if tag]
 
 
 def bulk_update_saved_search_tags(
@@ -357,6 +544,9 @@ def bulk_update_saved_search_tags(
     remove: Optional[List[str]] = None,
     replace: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
+    if not search_ids or not (add or remove or replace):
+        # Nothing to change; skip the round-trip entirely.
+        return {"updated": 0}
     payload: Dict[str, Any] = {"search_ids": search_ids}
     if add:
         payload["add"] = add
@@ -376,10 +566,11 @@ def bulk_update_saved_search_tags(
             except Exception:
                 detail = exc.response.text
         raise RuntimeError(detail) from exc
-    return response.json()
+    return _json_loads(response.content)
 
 
 __all__ = [
+    "VertexResult",
     "perform_vertex_search",
     "api_client",
     "reviews_client",
@@ -391,6 +582,7 @@ __all__ = [
     "fetch_case_reviews",
     "fetch_search_history",
     "fetch_saved_searches",
+    "fetch_search_side_panels",
     "save_search",
     "patch_saved_search",
     "share_saved_search",
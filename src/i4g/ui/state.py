@@ -70,6 +70,7 @@ def ensure_session_defaults() -> None:
         "vertex_search_results": None,
         "vertex_search_error": None,
         "vertex_search_params": None,
+        "vertex_search_raw_download": None,
         "account_list_start_date": default_start,
         "account_list_end_date": today,
         "account_list_categories": ["bank", "crypto", "payments"],
@@ -80,8 +81,10 @@ def ensure_session_defaults() -> None:
         "account_list_error": None,
     }
 
-    for key, value in defaults.items():
-        st.session_state.setdefault(key, value)
+    session = st.session_state
+    missing = {key: value for key, value in defaults.items() if key not in session}
+    if missing:
+        session.update(missing)
 
 
 __all__ = ["ensure_session_defaults"]
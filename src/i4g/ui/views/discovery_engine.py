@@ -7,7 +7,44 @@ from typing import Any, Dict, List, Optional
 
 import streamlit as st
 
-from i4g.ui.api import perform_vertex_search
+from i4g.ui.api import VertexResult, perform_vertex_search
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def _dump_json_bytes(payload: Any) -> bytes:
+    """Serialize ``payload`` as indented JSON bytes, preferring orjson."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+_RANK_SIGNAL_COLUMNS = (
+    ("semanticSimilarityScore", "semantic"),
+    ("keywordSimilarityScore", "keyword"),
+    ("topicalityRank", "topicality"),
+)
+
+
+def _result_row(item: VertexResult) -> Dict[str, Any]:
+    """Flatten a formatted Discovery result into a single table row."""
+
+    rank_signals = item.rank_signals
+    row: Dict[str, Any] = {
+        "rank": item.rank,
+        "document_id": item.document_id,
+        "label": item.label,
+        "summary": item.summary,
+        "source": item.source,
+        "index_type": item.index_type,
+        "tags": ", ".join(item.tags),
+    }
+    row.update((column, rank_signals.get(key)) for key, column in _RANK_SIGNAL_COLUMNS)
+    return row
 
 
 def render_discovery_engine_panel() -> None:
@@ -46,14 +83,15 @@ def render_discovery_engine_panel() -> None:
     show_raw_toggle = st.checkbox("Show raw JSON for each result", key="vertex_search_show_raw")
 
     if vertex_submitted:
-        query_value = (st.session_state.get("vertex_search_query") or "").strip()
-        project_value = (st.session_state.get("vertex_search_project") or "").strip()
-        location_value = (st.session_state.get("vertex_search_location") or "").strip() or "global"
-        data_store_value = (st.session_state.get("vertex_search_data_store") or "").strip()
-        serving_config_value = (st.session_state.get("vertex_search_serving_config") or "").strip() or "default_search"
-        page_size_value = int(st.session_state.get("vertex_search_page_size") or 5)
-        filter_value = (st.session_state.get("vertex_search_filter") or "").strip()
-        boost_value = (st.session_state.get("vertex_search_boost_json") or "").strip()
+        get = st.session_state.get
+        query_value = (get("vertex_search_query") or "").strip()
+        project_value = (get("vertex_search_project") or "").strip()
+        location_value = (get("vertex_search_location") or "").strip() or "global"
+        data_store_value = (get("vertex_search_data_store") or "").strip()
+        serving_config_value = (get("vertex_search_serving_config") or "").strip() or "default_search"
+        page_size_value = int(get("vertex_search_page_size") or 5)
+        filter_value = (get("vertex_search_filter") or "").strip()
+        boost_value = (get("vertex_search_boost_json") or "").strip()
 
         params: Dict[str, Optional[str] | int] = {
             "query": query_value,
@@ -80,19 +118,21 @@ def render_discovery_engine_panel() -> None:
         else:
             try:
                 with st.spinner("Querying Discovery..."):
-                    vertex_results = perform_vertex_search(params)
+                    vertex_results = perform_vertex_search(params, include_raw=show_raw_toggle)
             except RuntimeError as exc:
                 st.session_state["vertex_search_results"] = None
                 st.session_state["vertex_search_error"] = str(exc)
             else:
                 st.session_state["vertex_search_results"] = vertex_results
                 st.session_state["vertex_search_error"] = None
+            # Serialized lazily below, once per query rather than on every rerun.
+            st.session_state["vertex_search_raw_download"] = None
 
     vertex_error = st.session_state.get("vertex_search_error")
     if vertex_error:
         st.error(f"Discovery search failed: {vertex_error}")
 
-    vertex_results_state: Optional[List[Dict[str, Any]]] = st.session_state.get("vertex_search_results")
+    vertex_results_state: Optional[List[VertexResult]] = st.session_state.get("vertex_search_results")
     vertex_params = st.session_state.get("vertex_search_params") or {}
 
     if vertex_results_state:
@@ -101,64 +141,53 @@ def render_discovery_engine_panel() -> None:
             f"{len(vertex_results_state)} result(s) · page size {vertex_params.get('page_size', 'n/a')} · "
             f"data store {vertex_params.get('data_store_id', 'n/a')}"
         )
-        raw_download = json.dumps([item["raw"] for item in vertex_results_state], indent=2)
-        st.download_button(
-            label="Download raw JSON",
-            data=raw_download,
-            file_name="vertex_search_results.json",
-            mime="application/json",
-            key="vertex_search_download",
+        if any(item.raw for item in vertex_results_state):
+            raw_download = st.session_state.get("vertex_search_raw_download")
+            if raw_download is None:
+                raw_download = _dump_json_bytes([item.raw for item in vertex_results_state])
+                st.session_state["vertex_search_raw_download"] = raw_download
+            st.download_button(
+                label="Download raw JSON",
+                data=raw_download,
+                file_name="vertex_search_results.json",
+                mime="application/json",
+                key="vertex_search_download",
+            )
+        else:
+            st.caption("Enable 'Show raw JSON' and rerun the search to download raw payloads.")
+        st.dataframe(
+            [_result_row(item) for item in vertex_results_state],
+            use_container_width=True,
+            hide_index=True,
+        )
+
+        # Only the selected result pays the cost of rendering its JSON payloads.
+        results_by_rank = {item.rank: item for item in vertex_results_state}
+        selected_rank = st.selectbox(
+            "Inspect result",
+            options=list(results_by_rank),
+            format_func=lambda rank: f"#{rank} — {results_by_rank[rank].document_id}",
+            key="vertex_search_inspect_rank",
         )
-        for item in vertex_results_state:
-            header_text = f"#{item['rank']} — {item['document_id']}"
-            result_label = item.get("label")
-            if result_label:
-                header_text += f" (label: {result_label})"
-            st.markdown(f"**{header_text}**")
-
-            summary = item.get("summary")
-            if summary:
-                st.write(summary)
-
-            meta_parts = []
-            source_value = item.get("source")
-            if source_value:
-                meta_parts.append(f"source={source_value}")
-            index_type_value = item.get("index_type")
-            if index_type_value and index_type_value != source_value:
-                meta_parts.append(f"index_type={index_type_value}")
-            if meta_parts:
-                st.caption(" · ".join(meta_parts))
-
-            tags = item.get("tags") or []
-            if tags:
-                st.caption("Tags: " + ", ".join(tags))
-
-            rank_signals = item.get("rank_signals") or {}
+        selected = results_by_rank.get(selected_rank)
+        if selected:
+            rank_signals = selected.rank_signals
             if rank_signals:
-                highlight = []
-                for key, label_text in (
-                    ("semanticSimilarityScore", "semantic"),
-                    ("keywordSimilarityScore", "keyword"),
-                    ("topicalityRank", "topicality"),
-                ):
-                    value = rank_signals.get(key)
-                    if value is not None:
-                        highlight.append(f"{label_text}={value}")
+                highlight = [
+                    f"{column}={rank_signals[key]}"
+                    for key, column in _RANK_SIGNAL_COLUMNS
+                    if rank_signals.get(key) is not None
+                ]
                 if highlight:
                     st.caption(" · ".join(highlight))
                 with st.expander("Rank signals", expanded=False):
                     st.json(rank_signals)
-
-            struct_data = item.get("struct") or {}
+            struct_data = selected.full_struct()
             if struct_data:
                 with st.expander("Structured fields", expanded=False):
                     st.json(struct_data)
-
-            if show_raw_toggle:
+            if show_raw_toggle and selected.raw:
                 with st.expander("Raw response", expanded=False):
-                    st.json(item["raw"])
-
-            st.markdown("---")
+                    st.json(selected.raw)
     elif vertex_results_state == [] and vertex_params:
         st.info("Discovery returned no matches. Try adjusting the query or filters.")
@@ -4,42 +4,56 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 import sys
+from collections.abc import Mapping
 from datetime import datetime, timedelta, timezone
 
 from i4g.services.account_list import AccountListRequest, AccountListResult, AccountListService, log_account_list_run
 from i4g.settings import Settings, get_settings
+from i4g.worker.jobs.common import configure_logging
 
-LOGGER = logging.getLogger("i4g.worker.jobs.account_list")
-_BOOL_TRUE = {"1", "true", "yes", "on"}
-_DEFAULT_FORMATS = ["xlsx", "pdf"]
-
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # pragma: no cover - optional speedup
+    _parse_iso = None
 
-def _configure_logging() -> None:
-    level_name = os.getenv("I4G_RUNTIME__LOG_LEVEL", "INFO").upper()
-    level = getattr(logging, level_name, logging.INFO)
-    logging.basicConfig(level=level, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+LOGGER = logging.getLogger("i4g.worker.jobs.account_list")
+_ENV_PREFIX = "I4G_ACCOUNT_JOB__"
+_BOOL_TRUE = frozenset({"1", "true", "yes", "on"})
+_DEFAULT_FORMATS = ("xlsx", "pdf")
+_LIST_SPLIT = re.compile(r"\s*,\s*")
 
 
 def _parse_datetime(value: str) -> datetime:
     cleaned = value.strip()
-    if cleaned.endswith("Z"):
-        cleaned = f"{cleaned[:-1]}+00:00"
-    timestamp = datetime.fromisoformat(cleaned)
+    if _parse_iso is not None:
+        # ciso8601 understands the trailing "Z" natively and raises ValueError like fromisoformat.
+        timestamp = _parse_iso(cleaned)
+    else:
+        if cleaned.endswith("Z"):
+            cleaned = f"{cleaned[:-1]}+00:00"
+        timestamp = datetime.fromisoformat(cleaned)
     if timestamp.tzinfo is None:
         return timestamp.replace(tzinfo=timezone.utc)
     return timestamp.astimezone(timezone.utc)
 
 
-def _env_bool(name: str, default: bool) -> bool:
-    raw = os.getenv(name)
+def _env_snapshot() -> dict[str, str]:
+    """Capture the job's environment variables in a single pass over ``os.environ``."""
+
+    return {key: value for key, value in os.environ.items() if key.startswith(_ENV_PREFIX)}
+
+
+def _env_bool(name: str, default: bool, env: Mapping[str, str] | None = None) -> bool:
+    raw = (os.environ if env is None else env).get(name)
     if raw is None:
         return default
     return raw.strip().lower() in _BOOL_TRUE
 
 
-def _env_int(name: str, default: int) -> int:
-    raw = os.getenv(name)
+def _env_int(name: str, default: int, env: Mapping[str, str] | None = None) -> int:
+    raw = (os.environ if env is None else env).get(name)
     if raw is None or not raw.strip():
         return default
     try:
@@ -48,15 +62,15 @@ def _env_int(name: str, default: int) -> int:
         raise ValueError(f"{name} must be an integer") from exc
 
 
-def _env_list(name: str) -> list[str]:
-    raw = os.getenv(name)
+def _env_list(name: str, env: Mapping[str, str] | None = None) -> list[str]:
+    raw = (os.environ if env is None else env).get(name)
     if not raw:
         return []
-    return [item.strip().lower() for item in raw.split(",") if item.strip()]
+    return [item.lower() for item in _LIST_SPLIT.split(raw.strip()) if item]
 
 
-def _resolve_formats(settings: Settings) -> list[str]:
-    formats = _env_list("I4G_ACCOUNT_JOB__OUTPUT_FORMATS")
+def _resolve_formats(settings: Settings, env: Mapping[str, str] | None = None) -> list[str]:
+    formats = _env_list("I4G_ACCOUNT_JOB__OUTPUT_FORMATS", env)
     if formats:
         return formats
     if settings.account_list.default_formats:
@@ -66,21 +80,22 @@ def _resolve_formats(settings: Settings) -> list[str]:
 
 def _build_request_from_env(settings: Settings, *, now: datetime | None = None) -> AccountListRequest:
     reference = now or datetime.now(timezone.utc)
+    env = _env_snapshot()
 
-    start_env = os.getenv("I4G_ACCOUNT_JOB__START_TIME")
-    end_env = os.getenv("I4G_ACCOUNT_JOB__END_TIME")
-    window_days = _env_int("I4G_ACCOUNT_JOB__WINDOW_DAYS", 15)
+    start_env = env.get("I4G_ACCOUNT_JOB__START_TIME")
+    end_env = env.get("I4G_ACCOUNT_JOB__END_TIME")
+    window_days = _env_int("I4G_ACCOUNT_JOB__WINDOW_DAYS", 15, env)
     if window_days <= 0:
         raise ValueError("I4G_ACCOUNT_JOB__WINDOW_DAYS must be positive")
 
     end_time = _parse_datetime(end_env) if end_env else reference
     start_time = _parse_datetime(start_env) if start_env else end_time - timedelta(days=window_days)
 
-    categories = _env_list("I4G_ACCOUNT_JOB__CATEGORIES")
-    top_k_raw = _env_int("I4G_ACCOUNT_JOB__TOP_K", 200)
+    categories = _env_list("I4G_ACCOUNT_JOB__CATEGORIES", env)
+    top_k_raw = _env_int("I4G_ACCOUNT_JOB__TOP_K", 200, env)
     top_k = min(top_k_raw, settings.account_list.max_top_k)
-    include_sources = _env_bool("I4G_ACCOUNT_JOB__INCLUDE_SOURCES", True)
-    output_formats = _resolve_formats(settings)
+    include_sources = _env_bool("I4G_ACCOUNT_JOB__INCLUDE_SOURCES", True, env)
+    output_formats = _resolve_formats(settings, env)
 
     return AccountListRequest(
         start_time=start_time,
@@ -114,7 +129,7 @@ def _log_result_summary(result: AccountListResult, *, actor: str) -> None:
 def main() -> int:
     """Entry point executed by the Cloud Run job container."""
 
-    _configure_logging()
+    configure_logging()
 
     try:
         settings = get_settings()
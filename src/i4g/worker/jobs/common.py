@@ -0,0 +1,39 @@
+"""Helpers shared by the Cloud Run job entrypoints."""
+
+from __future__ import annotations
+
+import logging
+import os
+
+_LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s"
+
+
+def configure_logging(formatter: logging.Formatter | None = None) -> None:
+    """Configure root logging at ``I4G_RUNTIME__LOG_LEVEL`` (default INFO).
+
+    Args:
+        formatter: Optional formatter for the stderr handler; defaults to the plain text job format.
+    """
+
+    level_name = os.getenv("I4G_RUNTIME__LOG_LEVEL", "INFO").upper()
+    level = getattr(logging, level_name, logging.INFO)
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter or logging.Formatter(_LOG_FORMAT))
+    logging.basicConfig(level=level, handlers=[handler])
+
+
+def env_flag(name: str) -> bool | None:
+    """Parse a boolean environment variable, returning ``None`` when unset or unrecognised."""
+
+    raw = os.getenv(name)
+    if raw is None:
+        return None
+    normalized = raw.strip().lower()
+    if normalized in {"1", "true", "yes", "on"}:
+        return True
+    if normalized in {"0", "false", "no", "off"}:
+        return False
+    return None
+
+
+__all__ = ["configure_logging", "env_flag"]
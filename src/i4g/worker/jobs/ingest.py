@@ -4,10 +4,19 @@ from __future__ import annotations
 
 import json
 import logging
+import mmap
+import multiprocessing
 import os
+import queue
 import sys
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Iterator, Optional
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional
 
 from i4g.services.factories import (
     build_ingestion_retry_store,
@@ -17,44 +26,254 @@ from i4g.services.factories import (
 )
 from i4g.services.ingest_payloads import prepare_ingest_payload
 from i4g.settings import get_settings
-from i4g.store.ingest import IngestPipeline
+from i4g.store.ingest import IngestPipeline, PartialIngestError
+from i4g.store.ingestion_retry_store import RetryEnqueueSpec
 from i4g.store.sql_writer import SqlWriterResult
+from i4g.worker.jobs.common import configure_logging, env_flag
 
-LOGGER = logging.getLogger("i4g.worker.jobs.ingest")
-
-
-def _configure_logging() -> None:
-    level_name = os.getenv("I4G_RUNTIME__LOG_LEVEL", "INFO").upper()
-    level = getattr(logging, level_name, logging.INFO)
-    logging.basicConfig(level=level, format="%(asctime)s %(levelname)s %(name)s %(message)s")
-
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
 
-def _env_flag(name: str) -> bool | None:
-    raw = os.getenv(name)
-    if raw is None:
-        return None
-    normalized = raw.strip().lower()
-    if normalized in {"1", "true", "yes", "on"}:
-        return True
-    if normalized in {"0", "false", "no", "off"}:
-        return False
-    return None
+LOGGER = logging.getLogger("i4g.worker.jobs.ingest")
+_READ_CHUNK_BYTES = 1 << 20
+_MMAP_MAX_BYTES = 1 << 31
+_RETRY_FLUSH_SIZE = 100
+_RUN_COUNTER_FLUSH_SIZE = 50
+_PREFETCH_QUEUE_SIZE = 64
+_PREFETCH_EOF = object()
+_PREPARE_BATCH_SIZE = 256
+_PREPARE_CHUNK_SIZE = 32
+_PARALLEL_PREPARE_MIN_BYTES = 64 << 20
+_INGEST_BATCH_SIZE = 100
+
+
+_LOG_RECORD_FIELDS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class _JsonLogFormatter(logging.Formatter):
+    """Render log records as one JSON object per line using Cloud Logging's special fields.
+
+    Attributes passed via ``extra=`` become top-level keys, so per-record fields are indexed
+    by the log sink instead of being interpolated into the message.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        created = record.created
+        entry: Dict[str, Any] = {
+            "severity": record.levelname,
+            "message": record.getMessage(),
+            "logger": record.name,
+            "timestamp": {"seconds": int(created), "nanos": int((created % 1) * 1_000_000_000)},
+        }
+        for key, value in record.__dict__.items():
+            if key not in _LOG_RECORD_FIELDS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        if orjson is not None:
+            return orjson.dumps(entry, default=str).decode()
+        return json.dumps(entry, default=str)
+
+
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _iter_lines(handle: BinaryIO, chunk_size: int = _READ_CHUNK_BYTES) -> Iterator[bytes]:
+    """Yield newline-delimited records from large binary reads.
+
+    Each chunk is split in C; a trailing partial line is carried over (as a list of
+    fragments, joined once) until the chunk that completes it arrives.
+    """
+
+    pending: list[bytes] = []
+    while True:
+        chunk = handle.read(chunk_size)
+        if not chunk:
+            break
+        lines = chunk.split(b"\n")
+        if len(lines) == 1:
+            pending.append(chunk)
+            continue
+        if pending:
+            pending.append(lines[0])
+            lines[0] = b"".join(pending)
+            pending = []
+        tail = lines.pop()
+        if tail:
+            pending.append(tail)
+        yield from lines
+    if pending:
+        yield b"".join(pending)
+
+
+def _iter_mmap_lines(mapped: mmap.mmap) -> Iterator[bytes]:
+    """Yield newline-delimited records by scanning a read-only memory map, closing it when done."""
+
+    with mapped:
+        start = 0
+        find = mapped.find
+        while (newline := find(b"\n", start)) != -1:
+            yield mapped[start:newline]
+            start = newline + 1
+        if start < len(mapped):
+            yield mapped[start:]
+
+
+def _open_lines(handle: BinaryIO) -> Iterator[bytes]:
+    # Map regular local files below 2 GiB; FUSE/network mounts that refuse mmap fall back to chunked reads.
+    try:
+        if 0 < os.fstat(handle.fileno()).st_size < _MMAP_MAX_BYTES:
+            return _iter_mmap_lines(mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ))
+    except (OSError, ValueError):
+        pass
+    return _iter_lines(handle)
 
 
 def _load_jsonl(path: Path) -> Iterator[dict]:
-    with path.open("r", encoding="utf-8") as handle:
-        for line_no, raw in enumerate(handle, start=1):
+    # Binary mode lets orjson validate UTF-8 itself instead of decoding each line in Python.
+    with path.open("rb", buffering=0) as handle:
+        for line_no, raw in enumerate(_open_lines(handle), start=1):
             raw = raw.strip()
             if not raw:
                 continue
             try:
-                yield json.loads(raw)
-            except json.JSONDecodeError as exc:
+                yield _json_loads(raw)
+            except ValueError as exc:
                 raise ValueError(f"failed to parse JSON on line {line_no}: {exc}") from exc
 
 
+def _prepare_worker_count(path: Path, *, dry_run: bool, batch_limit: int | None) -> int:
+    """Return how many processes should run ``prepare_ingest_payload`` (0 keeps it serial)."""
+
+    override = os.getenv("I4G_INGEST__PREPARE_WORKERS")
+    if override:
+        try:
+            return max(0, int(override))
+        except ValueError:
+            LOGGER.warning("Invalid prepare workers override: %s", override)
+    if dry_run or (batch_limit and batch_limit < _PREPARE_BATCH_SIZE * 4):
+        return 0
+    try:
+        if path.stat().st_size < _PARALLEL_PREPARE_MIN_BYTES:
+            return 0
+    except OSError:
+        return 0
+    return max(0, (os.cpu_count() or 1) - 1)
+
+
+def _prepare_records(path: Path, *, dataset_name: str, workers: int = 0) -> Iterator[tuple[dict, dict]]:
+    """Yield ``(payload, diagnostics)`` for each JSONL record, in file order.
+
+    With ``workers > 1`` records are prepared in batches on a process pool; the next batch is
+    submitted before the previous one is drained so parsing overlaps preparation.
+    """
+
+    prepare = partial(prepare_ingest_payload, default_dataset=dataset_name)
+    if workers <= 1:
+        for record in _load_jsonl(path):
+            yield prepare(record)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        pending: Iterable[tuple[dict, dict]] = ()
+        batch: List[dict] = []
+        try:
+            for record in _load_jsonl(path):
+                batch.append(record)
+                if len(batch) >= _PREPARE_BATCH_SIZE:
+                    submitted = executor.map(prepare, batch, chunksize=_PREPARE_CHUNK_SIZE)
+                    yield from pending
+                    pending, batch = submitted, []
+        except Exception:
+            # Records read before a parse error are still handed over before the error surfaces.
+            yield from pending
+            yield from executor.map(prepare, batch, chunksize=_PREPARE_CHUNK_SIZE)
+            raise
+        yield from pending
+        yield from executor.map(prepare, batch, chunksize=_PREPARE_CHUNK_SIZE)
+
+
+def _prefetch_payloads(
+    path: Path, *, dataset_name: str, maxsize: int = _PREFETCH_QUEUE_SIZE, workers: int = 0
+) -> Iterator[tuple[dict, dict]]:
+    """Yield prepared ``(payload, diagnostics)`` pairs parsed on a background thread.
+
+    The bounded queue keeps the reader at most ``maxsize`` records ahead of ingestion. Reader
+    errors are re-raised in the consuming thread once the records before them are drained.
+    """
+
+    buffer: queue.Queue = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+    errors: List[BaseException] = []
+
+    def _put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            with closing(_prepare_records(path, dataset_name=dataset_name, workers=workers)) as prepared:
+                for item in prepared:
+                    if not _put(item):
+                        return
+        except BaseException as exc:  # handed to the consumer below
+            errors.append(exc)
+        finally:
+            _put(_PREFETCH_EOF)
+
+    producer = threading.Thread(target=_produce, name="ingest-reader", daemon=True)
+    producer.start()
+    try:
+        while (item := buffer.get()) is not _PREFETCH_EOF:
+            yield item
+        if errors:
+            raise errors[0]
+    finally:
+        stop.set()
+        producer.join(timeout=1.0)
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _clone_json(value: Any) -> Any:
+    """Deep-copy JSON-shaped data, raising ``TypeError`` on anything else."""
+
+    if isinstance(value, _JSON_SCALARS):
+        return value
+    if isinstance(value, dict):
+        cloned: Dict[str, Any] = {}
+        for key, item in value.items():
+            if not isinstance(key, str):
+                raise TypeError(f"non-string key: {key!r}")
+            cloned[key] = _clone_json(item)
+        return cloned
+    if isinstance(value, (list, tuple)):
+        return [_clone_json(item) for item in value]
+    raise TypeError(f"unsupported type: {type(value).__name__}")
+
+
 def _clone_payload(payload: dict) -> dict:
+    # Payloads parsed from JSONL are plain JSON; walking them avoids a dumps/loads round-trip.
+    try:
+        return _clone_json(payload)
+    except (TypeError, RecursionError):
+        pass
     try:
+        if orjson is not None:
+            # Leave datetimes/dataclasses to ``default=str`` so clones match the stdlib output.
+            options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+            return orjson.loads(orjson.dumps(payload, default=str, option=options))
         return json.loads(json.dumps(payload, default=str))
     except Exception:
         return dict(payload)
@@ -71,8 +290,7 @@ def _serialise_sql_result(result: Optional[SqlWriterResult]) -> Dict[str, Any] |
     }
 
 
-def _maybe_enqueue_retry(
-    retry_store,
+def _build_retry_spec(
     *,
     backend: str,
     attempted: bool,
@@ -82,72 +300,187 @@ def _maybe_enqueue_retry(
     max_retries: int,
     error: Optional[str] = None,
     sql_result: Optional[SqlWriterResult] = None,
-) -> int:
-    if not retry_store or not attempted or succeeded:
-        return 0
+    case_id: Optional[str] = None,
+    deep_clone: bool = True,
+) -> Optional[RetryEnqueueSpec]:
+    """Describe a retry entry for a failed backend write, or ``None`` when no retry is due.
+
+    With ``deep_clone=False`` the spec references ``payload`` directly; callers must not mutate
+    it before the spec is written (the retry store serialises it to JSON at that point).
+    """
+
+    if not attempted or succeeded:
+        return None
+    case_id = case_id or payload.get("case_id") or "unknown"
     if max_retries <= 0:
-        LOGGER.info(
-            "Skipping %s retry for case_id=%s because max_retries=%s",
-            backend,
-            payload.get("case_id") or "unknown",
-            max_retries,
-        )
+        LOGGER.info("Skipping %s retry for case_id=%s because max_retries=%s", backend, case_id, max_retries)
+        return None
+    queue_payload: Dict[str, Any] = {"record": _clone_payload(payload) if deep_clone else payload}
+    context: Dict[str, Any] = {}
+    serialised_sql = _serialise_sql_result(sql_result)
+    if serialised_sql:
+        context["sql_result"] = serialised_sql
+    if error:
+        context["error"] = error
+    if context:
+        queue_payload["context"] = context
+    return RetryEnqueueSpec(case_id=case_id, backend=backend, payload=queue_payload, delay_seconds=retry_delay)
+
+
+def _log_scheduled_retry(spec: RetryEnqueueSpec, max_retries: int) -> None:
+    LOGGER.warning(
+        "Scheduled %s retry for case_id=%s (max_attempts=%s) error=%s",
+        spec.backend,
+        spec.case_id,
+        max_retries,
+        spec.payload.get("context", {}).get("error"),
+    )
+
+
+def _flush_retries(retry_store, pending: List[RetryEnqueueSpec], max_retries: int) -> int:
+    """Write buffered retry specs in one batch, returning how many were scheduled."""
+
+    if not pending:
         return 0
-    case_id = payload.get("case_id") or "unknown"
     try:
-        cloned = _clone_payload(payload)
-        queue_payload: Dict[str, Any] = {"record": cloned}
-        context: Dict[str, Any] = {}
-        serialised_sql = _serialise_sql_result(sql_result)
-        if serialised_sql:
-            context["sql_result"] = serialised_sql
-        if error:
-            context["error"] = error
-        if context:
-            queue_payload["context"] = context
-        retry_store.enqueue(case_id=case_id, backend=backend, payload=queue_payload, delay_seconds=retry_delay)
-        LOGGER.warning(
-            "Scheduled %s retry for case_id=%s (max_attempts=%s) error=%s",
-            backend,
-            case_id,
-            max_retries,
-            error,
-        )
-        return 1
+        retry_store.enqueue_many(pending)
     except Exception:
-        LOGGER.exception("Failed to enqueue %s retry for case_id=%s", backend, case_id)
+        LOGGER.exception("Failed to enqueue %s buffered retries", len(pending))
         return 0
+    else:
+        for spec in pending:
+            _log_scheduled_retry(spec, max_retries)
+        return len(pending)
+    finally:
+        pending.clear()
+
+
+def _scan_dry_run(path: Path, *, batch_limit: int | None) -> int:
+    """Validate that ``path`` parses and log raw case ids without preparing payloads."""
+
+    info_enabled = LOGGER.isEnabledFor(logging.INFO)
+    processed = 0
+    for record in _load_jsonl(path):
+        if batch_limit and processed >= batch_limit:
+            break
+        if info_enabled:
+            text = record.get("text")
+            LOGGER.info(
+                "Dry run (fast); would ingest record",
+                extra={
+                    "case_id": record.get("case_id") or "generated",
+                    "text_length": len(text) if isinstance(text, str) else 0,
+                },
+            )
+        processed += 1
+    return processed
+
+
+def _ingest_batch_size() -> int:
+    """Return how many payloads are handed to ``ingest_classified_cases`` per call."""
+
+    override = os.getenv("I4G_INGEST__BATCH_SIZE")
+    if override:
+        try:
+            return max(1, int(override))
+        except ValueError:
+            LOGGER.warning("Invalid ingest batch size override: %s", override)
+    return _INGEST_BATCH_SIZE
+
+
+def _ingest_batch(pipeline: IngestPipeline, payloads: List[dict], *, run_id: str | None) -> List[Any]:
+    """Ingest ``payloads`` in one bulk call, falling back to per-record calls if it raises.
+
+    The fallback only runs when the bulk call failed before writing anything. A batch that
+    failed after its structured rows were committed returns the partial results carried by
+    the error, so the caller queues backend retries instead of replaying it. Case ids are
+    assigned up front so a replayed payload upserts the same rows instead of minting new ones.
+
+    Returns one entry per payload: an ``IngestResult`` or the exception raised for it.
+    """
+
+    for payload in payloads:
+        if not payload.get("case_id"):
+            payload["case_id"] = str(uuid.uuid4())
+    try:
+        return list(pipeline.ingest_classified_cases(payloads, ingestion_run_id=run_id))
+    except PartialIngestError as exc:
+        LOGGER.warning(
+            "Bulk ingest partially failed for %d records; queuing backend retries", len(payloads), exc_info=exc
+        )
+        return list(exc.results) or [exc] * len(payloads)
+    except Exception:  # pragma: no cover - isolate the failing record(s)
+        LOGGER.warning("Bulk ingest failed for %d records; retrying individually", len(payloads), exc_info=True)
+
+    outcomes: List[Any] = []
+    for payload in payloads:
+        try:
+            outcomes.append(pipeline.ingest_classified_case(payload, ingestion_run_id=run_id))
+        except Exception as exc:
+            outcomes.append(exc)
+    return outcomes
+
+
+@dataclass(slots=True)
+class _PendingRunCounters:
+    """Run counter deltas accumulated between ``record_cases_bulk`` flushes."""
+
+    sql_results: List[Optional[SqlWriterResult]] = field(default_factory=list)
+    firestore_writes: int = 0
+    vertex_writes: int = 0
+
+    def add(self, sql_result: Optional[SqlWriterResult], *, firestore_written: bool, vertex_written: bool) -> None:
+        self.sql_results.append(sql_result)
+        self.firestore_writes += 1 if firestore_written else 0
+        self.vertex_writes += 1 if vertex_written else 0
+
+    def flush(self, run_tracker, run_id: str) -> None:
+        if not self.sql_results:
+            return
+        try:
+            run_tracker.record_cases_bulk(
+                run_id,
+                self.sql_results,
+                firestore_writes=self.firestore_writes,
+                vertex_writes=self.vertex_writes,
+            )
+        except Exception:
+            LOGGER.exception("Failed to update ingestion run counters run_id=%s", run_id)
+        self.sql_results = []
+        self.firestore_writes = 0
+        self.vertex_writes = 0
 
 
 def main() -> int:
     """Entry point executed by the Cloud Run job container."""
 
-    _configure_logging()
+    configure_logging(_JsonLogFormatter())
 
-    settings = get_settings()
+    ingestion = get_settings().ingestion
 
     dataset_override = os.getenv("I4G_INGEST__JSONL_PATH")
-    dataset_path = Path(dataset_override) if dataset_override else Path(settings.ingestion.dataset_path)
+    dataset_path = Path(dataset_override) if dataset_override else Path(ingestion.dataset_path)
 
     batch_limit_override = os.getenv("I4G_INGEST__BATCH_LIMIT")
     try:
-        batch_limit = int(batch_limit_override) if batch_limit_override else settings.ingestion.batch_limit
+        batch_limit = int(batch_limit_override) if batch_limit_override else ingestion.batch_limit
     except ValueError:
         LOGGER.warning("Invalid batch limit override: %s", batch_limit_override)
-        batch_limit = settings.ingestion.batch_limit
-
-    dry_run_override = _env_flag("I4G_INGEST__DRY_RUN")
-    dry_run = dry_run_override if dry_run_override is not None else settings.ingestion.dry_run
-
-    reset_override = _env_flag("I4G_INGEST__RESET_VECTOR")
-    reset_vector = reset_override if reset_override is not None else settings.ingestion.reset_vector
-    vector_override = _env_flag("I4G_INGEST__ENABLE_VECTOR")
-    enable_vector = vector_override if vector_override is not None else settings.ingestion.enable_vector_store
-    vertex_override = _env_flag("I4G_INGEST__ENABLE_VERTEX")
-    enable_vertex = vertex_override if vertex_override is not None else settings.ingestion.enable_vertex
-    firestore_override = _env_flag("I4G_INGEST__ENABLE_FIRESTORE")
-    enable_firestore = firestore_override if firestore_override is not None else settings.ingestion.enable_firestore
-    dataset_name = os.getenv("I4G_INGEST__DATASET_NAME") or dataset_path.stem or settings.ingestion.default_dataset
+        batch_limit = ingestion.batch_limit
+
+    dry_run_override = env_flag("I4G_INGEST__DRY_RUN")
+    dry_run = dry_run_override if dry_run_override is not None else ingestion.dry_run
+    dry_run_fast = dry_run and bool(env_flag("I4G_INGEST__DRY_RUN_FAST"))
+
+    reset_override = env_flag("I4G_INGEST__RESET_VECTOR")
+    reset_vector = reset_override if reset_override is not None else ingestion.reset_vector
+    vector_override = env_flag("I4G_INGEST__ENABLE_VECTOR")
+    enable_vector = vector_override if vector_override is not None else ingestion.enable_vector_store
+    vertex_override = env_flag("I4G_INGEST__ENABLE_VERTEX")
+    enable_vertex = vertex_override if vertex_override is not None else ingestion.enable_vertex
+    firestore_override = env_flag("I4G_INGEST__ENABLE_FIRESTORE")
+    enable_firestore = firestore_override if firestore_override is not None else ingestion.enable_firestore
+    dataset_name = os.getenv("I4G_INGEST__DATASET_NAME") or dataset_path.stem or ingestion.default_dataset
 
     LOGGER.info(
         (
@@ -167,6 +500,15 @@ def main() -> int:
         LOGGER.warning("JSONL dataset not found; nothing to ingest: %s", dataset_path)
         return 0
 
+    if dry_run_fast:
+        try:
+            processed = _scan_dry_run(dataset_path, batch_limit=batch_limit)
+        except Exception:  # pragma: no cover - unexpected reader failure
+            LOGGER.exception("Ingestion batch aborted due to reader error")
+            return 1
+        LOGGER.info("Ingestion complete: processed=%s failures=%s", processed, 0)
+        return 0
+
     structured_store = build_structured_store()
     vector_store = None
     if enable_vector:
@@ -191,8 +533,8 @@ def main() -> int:
     run_tracker = None
     run_id = None
     retry_store = None
-    retry_delay = settings.ingestion.retry_delay_seconds
-    max_retries = settings.ingestion.max_retries
+    retry_delay = ingestion.retry_delay_seconds
+    max_retries = ingestion.max_retries
     if not dry_run:
         try:
             run_tracker = build_ingestion_run_tracker()
@@ -215,82 +557,136 @@ def main() -> int:
     processed = 0
     failures = 0
     scheduled_retries = 0
-
-    try:
-        for record in _load_jsonl(dataset_path):
-            if batch_limit and processed >= batch_limit:
-                break
-            payload, diagnostics = prepare_ingest_payload(record, default_dataset=dataset_name)
-            if dry_run:
-                LOGGER.info(
-                    "Dry run enabled; would ingest case_id=%s classification=%s confidence=%.2f text_source=%s",
-                    payload.get("case_id") or "generated",
-                    diagnostics["classification"],
-                    diagnostics["confidence"],
-                    diagnostics["text_source"],
-                )
-                processed += 1
+    pending_retries: List[RetryEnqueueSpec] = []
+    run_counters = _PendingRunCounters()
+
+    batch_size = _ingest_batch_size()
+    batch: List[tuple[dict, dict]] = []
+    # Skip building per-record log arguments entirely when INFO is filtered out.
+    info_enabled = LOGGER.isEnabledFor(logging.INFO)
+    track_runs = bool(run_tracker and run_id)
+
+    def flush_batch() -> None:
+        nonlocal processed, failures, scheduled_retries
+        if not batch:
+            return
+        outcomes = _ingest_batch(pipeline, [payload for payload, _ in batch], run_id=run_id)
+        for (payload, diagnostics), result in zip(batch, outcomes):
+            case_id = payload.get("case_id")
+            if isinstance(result, Exception):
+                failures += 1
+                LOGGER.error("Failed to ingest record case_id=%s", case_id, exc_info=result)
                 continue
             try:
-                result = pipeline.ingest_classified_case(payload, ingestion_run_id=run_id)
                 case_id = result.case_id
                 payload["case_id"] = case_id
                 if run_id:
                     payload.setdefault("ingestion_run_id", run_id)
-                if run_tracker and run_id:
-                    try:
-                        run_tracker.record_case(
-                            run_id,
-                            result.sql_result,
-                            firestore_writes=1 if result.firestore_written else 0,
-                            vertex_writes=1 if result.vertex_written else 0,
-                        )
-                    except Exception:
-                        LOGGER.exception("Failed to update ingestion run counters run_id=%s", run_id)
+                if track_runs:
+                    run_counters.add(
+                        result.sql_result,
+                        firestore_written=result.firestore_written,
+                        vertex_written=result.vertex_written,
+                    )
 
                 if retry_store:
-                    scheduled_retries += _maybe_enqueue_retry(
-                        retry_store,
-                        backend="firestore",
-                        attempted=result.firestore_attempted,
-                        succeeded=result.firestore_written,
-                        payload=payload,
-                        retry_delay=retry_delay,
-                        max_retries=max_retries,
-                        error=result.firestore_error,
-                        sql_result=result.sql_result,
-                    )
-                    scheduled_retries += _maybe_enqueue_retry(
-                        retry_store,
-                        backend="vertex",
-                        attempted=result.vertex_attempted,
-                        succeeded=result.vertex_written,
-                        payload=payload,
-                        retry_delay=retry_delay,
-                        max_retries=max_retries,
-                        error=result.vertex_error,
-                    )
+                    for backend, attempted, succeeded, error, sql_result in (
+                        (
+                            "firestore",
+                            result.firestore_attempted,
+                            result.firestore_written,
+                            result.firestore_error,
+                            result.sql_result,
+                        ),
+                        ("vertex", result.vertex_attempted, result.vertex_written, result.vertex_error, None),
+                    ):
+                        try:
+                            spec = _build_retry_spec(
+                                backend=backend,
+                                attempted=attempted,
+                                succeeded=succeeded,
+                                payload=payload,
+                                retry_delay=retry_delay,
+                                max_retries=max_retries,
+                                error=error,
+                                sql_result=sql_result,
+                                case_id=case_id,
+                                deep_clone=False,
+                            )
+                        except Exception:
+                            LOGGER.exception("Failed to prepare %s retry for case_id=%s", backend, case_id)
+                            continue
+                        if spec is not None:
+                            pending_retries.append(spec)
                 processed += 1
-                LOGGER.info(
-                    "Ingested record case_id=%s classification=%s confidence=%.2f text_source=%s",
-                    case_id,
-                    diagnostics["classification"],
-                    diagnostics["confidence"],
-                    diagnostics["text_source"],
-                )
-            except Exception:  # pragma: no cover - defensive logging around ingestion pipeline
+                if info_enabled:
+                    LOGGER.info(
+                        "Ingested record",
+                        extra={
+                            "case_id": case_id,
+                            "classification": diagnostics["classification"],
+                            "confidence": diagnostics["confidence"],
+                            "text_source": diagnostics["text_source"],
+                        },
+                    )
+            except Exception:  # pragma: no cover - defensive logging around ingestion bookkeeping
                 failures += 1
-                LOGGER.exception("Failed to ingest record case_id=%s", payload.get("case_id"))
+                LOGGER.exception("Failed to ingest record case_id=%s", case_id)
+        batch.clear()
+
+        if track_runs and len(run_counters.sql_results) >= _RUN_COUNTER_FLUSH_SIZE:
+            run_counters.flush(run_tracker, run_id)
+        if retry_store and len(pending_retries) >= _RETRY_FLUSH_SIZE:
+            scheduled_retries += _flush_retries(retry_store, pending_retries, max_retries)
+
+    try:
+        prepare_workers = _prepare_worker_count(dataset_path, dry_run=dry_run, batch_limit=batch_limit)
+        if prepare_workers > 1:
+            LOGGER.info("Preparing payloads on %s worker processes", prepare_workers)
+        payloads = _prefetch_payloads(dataset_path, dataset_name=dataset_name, workers=prepare_workers)
+        with closing(payloads) as records:
+            for payload, diagnostics in records:
+                if batch_limit and processed >= batch_limit:
+                    break
+                if dry_run:
+                    if info_enabled:
+                        LOGGER.info(
+                            "Dry run enabled; would ingest record",
+                            extra={
+                                "case_id": payload.get("case_id") or "generated",
+                                "classification": diagnostics["classification"],
+                                "confidence": diagnostics["confidence"],
+                                "text_source": diagnostics["text_source"],
+                            },
+                        )
+                    processed += 1
+                    continue
+                batch.append((payload, diagnostics))
+                # Flush early when the batch would reach the limit; failures do not count towards it.
+                if len(batch) >= batch_size or (batch_limit and processed + len(batch) >= batch_limit):
+                    flush_batch()
+            flush_batch()
     except Exception as exc:  # pragma: no cover - unexpected reader failure
         LOGGER.exception("Ingestion batch aborted due to reader error")
+        # Records read before the failure are still ingested.
+        flush_batch()
+        if retry_store:
+            _flush_retries(retry_store, pending_retries, max_retries)
         if run_tracker and run_id:
+            run_counters.flush(run_tracker, run_id)
             try:
                 run_tracker.complete_run(run_id, status="failed", last_error=str(exc))
             except Exception:
                 LOGGER.exception("Failed to mark ingestion run as failed run_id=%s", run_id)
         return 1
+    finally:
+        pipeline.close()
+
+    if retry_store:
+        scheduled_retries += _flush_retries(retry_store, pending_retries, max_retries)
 
     if run_tracker and run_id:
+        run_counters.flush(run_tracker, run_id)
         run_status = "succeeded" if failures == 0 else "partial"
         last_error = None if failures == 0 else f"Encountered {failures} ingestion failure(s)"
         try:
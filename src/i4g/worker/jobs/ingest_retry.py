@@ -5,27 +5,25 @@ from __future__ import annotations
 import logging
 import os
 import sys
-from typing import Any, Dict, Tuple
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Tuple
 
 from i4g.services.factories import build_firestore_writer, build_ingestion_retry_store, build_vertex_writer
 from i4g.settings import get_settings
 from i4g.store.ingest import build_case_bundle
 from i4g.store.ingestion_retry_store import IngestionRetryStore, RetryItem
 from i4g.store.sql_writer import SqlWriterResult
+from i4g.worker.jobs.common import configure_logging
 
 LOGGER = logging.getLogger("i4g.worker.jobs.ingest_retry")
+_DEFAULT_CONCURRENCY = 16
 
 
 class RetryPayloadError(RuntimeError):
     """Raised when a retry payload is irrecoverably malformed."""
 
 
-def _configure_logging() -> None:
-    level_name = os.getenv("I4G_RUNTIME__LOG_LEVEL", "INFO").upper()
-    level = getattr(logging, level_name, logging.INFO)
-    logging.basicConfig(level=level, format="%(asctime)s %(levelname)s %(name)s %(message)s")
-
-
 def _extract_retry_payload(payload: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     record = payload.get("record") if isinstance(payload, dict) else None
     context = payload.get("context") if isinstance(payload, dict) else None
@@ -91,6 +89,40 @@ def _process_vertex_retry(
     vertex_writer.upsert_record(payload)
 
 
+def _build_writer(backend: str) -> Any:
+    if backend == "firestore":
+        return build_firestore_writer()
+    if backend == "vertex":
+        return build_vertex_writer()
+    return None
+
+
+def _replay_item(item: RetryItem, *, writers: Dict[str, Any], default_dataset: str) -> None:
+    """Replay a single retry entry against its backend writer; safe to run on a worker thread."""
+
+    record, context = _extract_retry_payload(item.payload or {})
+    if item.backend not in ("firestore", "vertex"):
+        raise RetryPayloadError(f"Unsupported backend '{item.backend}'")
+    writer = writers.get(item.backend)
+    if isinstance(writer, Exception):
+        raise RuntimeError(f"{item.backend} writer unavailable") from writer
+    if item.backend == "firestore":
+        _process_firestore_retry(
+            item,
+            record,
+            context,
+            firestore_writer=writer,
+            default_dataset=default_dataset,
+        )
+    else:
+        _process_vertex_retry(
+            item,
+            record,
+            vertex_writer=writer,
+            default_dataset=default_dataset,
+        )
+
+
 def _handle_retry_failure(
     store: IngestionRetryStore,
     item: RetryItem,
@@ -131,10 +163,77 @@ def _handle_retry_failure(
     return "rescheduled"
 
 
+def _replay_batch(
+    executor: ThreadPoolExecutor,
+    store: IngestionRetryStore,
+    items: List[RetryItem],
+    *,
+    writers: Dict[str, Any],
+    default_dataset: str,
+    retry_delay: int,
+    max_retries: int,
+) -> Counter[str]:
+    """Replay ``items`` on ``executor`` and tally their outcomes.
+
+    Writers are built once per backend on the calling thread and shared; a build failure is
+    replayed as a backend error. Retry-store bookkeeping also stays on the calling thread.
+    """
+
+    for backend in sorted({item.backend for item in items} - writers.keys()):
+        try:
+            writers[backend] = _build_writer(backend)
+        except Exception as exc:
+            LOGGER.exception("Failed to initialise %s writer", backend)
+            writers[backend] = exc
+
+    outcomes: Counter[str] = Counter()
+    futures = {
+        executor.submit(_replay_item, item, writers=writers, default_dataset=default_dataset): item for item in items
+    }
+    for future in as_completed(futures):
+        item = futures[future]
+        try:
+            future.result()
+            store.delete(item.retry_id)
+            outcomes["successes"] += 1
+            LOGGER.info("Replayed %s backend for case_id=%s", item.backend, item.case_id)
+        except RetryPayloadError:
+            outcomes["failures"] += 1
+            outcomes["dropped"] += 1
+            store.delete(item.retry_id)
+            LOGGER.exception(
+                "Dropping retry_id=%s backend=%s due to malformed payload",
+                item.retry_id,
+                item.backend,
+            )
+        except Exception:
+            outcomes["failures"] += 1
+            outcome = _handle_retry_failure(
+                store,
+                item,
+                retry_delay=retry_delay,
+                max_retries=max_retries,
+            )
+            if outcome in ("rescheduled", "dropped"):
+                outcomes[outcome] += 1
+            else:
+                LOGGER.warning(
+                    "Failed to schedule retry for retry_id=%s backend=%s",
+                    item.retry_id,
+                    item.backend,
+                )
+            LOGGER.exception(
+                "Backend replay failed for retry_id=%s backend=%s",
+                item.retry_id,
+                item.backend,
+            )
+    return outcomes
+
+
 def main() -> int:
     """Entry point executed by the Cloud Run job container."""
 
-    _configure_logging()
+    configure_logging()
     settings = get_settings()
 
     batch_limit = int(os.getenv("I4G_INGEST_RETRY__BATCH_LIMIT", "25") or 25)
@@ -167,73 +266,47 @@ def main() -> int:
     max_retries = settings.ingestion.max_retries
     default_dataset = settings.ingestion.default_dataset
 
-    successes = 0
-    failures = 0
-    rescheduled = 0
-    dropped = 0
-
-    firestore_writer = None
-    vertex_writer = None
-
-    for item in ready_items:
-        record, context = _extract_retry_payload(item.payload or {})
-        try:
-            if item.backend == "firestore":
-                if firestore_writer is None:
-                    firestore_writer = build_firestore_writer()
-                _process_firestore_retry(
-                    item,
-                    record,
-                    context,
-                    firestore_writer=firestore_writer,
-                    default_dataset=default_dataset,
-                )
-            elif item.backend == "vertex":
-                if vertex_writer is None:
-                    vertex_writer = build_vertex_writer()
-                _process_vertex_retry(
-                    item,
-                    record,
-                    vertex_writer=vertex_writer,
-                    default_dataset=default_dataset,
-                )
-            else:
-                raise RetryPayloadError(f"Unsupported backend '{item.backend}'")
-            retry_store.delete(item.retry_id)
-            successes += 1
-            LOGGER.info("Replayed %s backend for case_id=%s", item.backend, item.case_id)
-        except RetryPayloadError:
-            failures += 1
-            dropped += 1
-            retry_store.delete(item.retry_id)
-            LOGGER.exception(
-                "Dropping retry_id=%s backend=%s due to malformed payload",
-                item.retry_id,
-                item.backend,
+    try:
+        concurrency = int(os.getenv("I4G_INGEST_RETRY__CONCURRENCY", str(_DEFAULT_CONCURRENCY)))
+    except ValueError:
+        LOGGER.warning("Invalid retry concurrency override; using %s", _DEFAULT_CONCURRENCY)
+        concurrency = _DEFAULT_CONCURRENCY
+    concurrency = max(1, min(concurrency, len(ready_items)))
+
+    outcomes: Counter[str] = Counter()
+    writers: Dict[str, Any] = {}
+    with (
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="ingest-retry-fetch") as prefetcher,
+        ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="ingest-retry") as executor,
+    ):
+        while ready_items:
+            # Fetch the next page while this one replays; in-flight entries are excluded so they are not re-read.
+            next_batch = prefetcher.submit(
+                retry_store.fetch_ready,
+                limit=batch_limit,
+                exclude_ids=[item.retry_id for item in ready_items],
             )
-        except Exception:
-            failures += 1
-            outcome = _handle_retry_failure(
+            outcomes += _replay_batch(
+                executor,
                 retry_store,
-                item,
+                ready_items,
+                writers=writers,
+                default_dataset=default_dataset,
                 retry_delay=retry_delay,
                 max_retries=max_retries,
             )
-            if outcome == "rescheduled":
-                rescheduled += 1
-            elif outcome == "dropped":
-                dropped += 1
-            else:
-                LOGGER.warning(
-                    "Failed to schedule retry for retry_id=%s backend=%s",
-                    item.retry_id,
-                    item.backend,
-                )
-            LOGGER.exception(
-                "Backend replay failed for retry_id=%s backend=%s",
-                item.retry_id,
-                item.backend,
-            )
+            try:
+                ready_items = next_batch.result()
+            except Exception:
+                LOGGER.exception("Failed to fetch the next ingestion retry batch; stopping")
+                break
+            if ready_items:
+                LOGGER.info("Processing %s more ingestion retry item(s)", len(ready_items))
+
+    successes = outcomes["successes"]
+    failures = outcomes["failures"]
+    rescheduled = outcomes["rescheduled"]
+    dropped = outcomes["dropped"]
 
     LOGGER.info(
         ("Ingestion retry batch complete: successes=%s failures=%s rescheduled=%s dropped=%s"),
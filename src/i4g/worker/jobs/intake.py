@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import importlib.util
 import logging
 import os
 import sys
@@ -10,14 +11,10 @@ import httpx
 
 from i4g.services.intake import IntakeService
 from i4g.services.intake_job_runner import LocalPipelineIntakeJobRunner
+from i4g.worker.jobs.common import configure_logging
 
 LOGGER = logging.getLogger("i4g.worker.jobs.intake")
-
-
-def _configure_logging() -> None:
-    level_name = os.getenv("I4G_RUNTIME__LOG_LEVEL", "INFO").upper()
-    level = getattr(logging, level_name, logging.INFO)
-    logging.basicConfig(level=level, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+_HAS_HTTP2 = importlib.util.find_spec("h2") is not None
 
 
 def _safe_post(
@@ -43,7 +40,14 @@ def _process_via_api(intake_id: str, job_id: str, api_base: str, api_key: str |
     runner = LocalPipelineIntakeJobRunner()
     headers = {"X-API-KEY": api_key} if api_key else {}
     base = api_base.rstrip("/")
-    with httpx.Client(base_url=base, headers=headers, timeout=30.0) as client:
+    # The status updates, fetch, and case attachment all share one kept-alive (HTTP/2 when available) connection.
+    with httpx.Client(
+        base_url=base,
+        headers=headers,
+        timeout=30.0,
+        http2=_HAS_HTTP2,
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60.0),
+    ) as client:
         try:
             _safe_post(
                 client,
@@ -123,7 +127,7 @@ def _process_via_api(intake_id: str, job_id: str, api_base: str, api_key: str |
 def main() -> int:
     """Entry point executed by the Cloud Run job container."""
 
-    _configure_logging()
+    configure_logging()
 
     intake_id = os.getenv("I4G_INTAKE__ID")
     job_id = os.getenv("I4G_INTAKE__JOB_ID")
@@ -5,64 +5,115 @@ from __future__ import annotations
 import logging
 import os
 import sys
-from typing import List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
 
 from i4g.services.factories import build_review_store
+from i4g.store.review_store import ReviewStore
+from i4g.worker.jobs.common import configure_logging
 from i4g.worker.tasks import generate_report_for_case
 
 LOGGER = logging.getLogger("i4g.worker.jobs.report")
+_DEFAULT_CONCURRENCY = 8
 
 
-def _configure_logging() -> None:
-    level_name = os.getenv("I4G_RUNTIME__LOG_LEVEL", "INFO").upper()
-    level = getattr(logging, level_name, logging.INFO)
-    logging.basicConfig(level=level, format="%(asctime)s %(levelname)s %(name)s %(message)s")
-
-
-def _resolve_review_ids(limit: int) -> List[str]:
+def _explicit_review_ids() -> Optional[List[str]]:
     explicit = os.getenv("I4G_REPORT__REVIEW_IDS")
     if explicit:
         return [value.strip() for value in explicit.split(",") if value.strip()]
+    return None
+
+
+def _resolve_review_ids(limit: int, *, store: ReviewStore) -> List[str]:
+    explicit = _explicit_review_ids()
+    if explicit is not None:
+        return explicit
 
     target_status = os.getenv("I4G_REPORT__TARGET_STATUS", "accepted")
-    store = build_review_store()
     queue = store.get_queue(status=target_status, limit=limit)
     return [item["review_id"] for item in queue]
 
 
+def _report_concurrency() -> int:
+    raw = os.getenv("I4G_REPORT__CONCURRENCY")
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            LOGGER.warning("Invalid report concurrency override: %s", raw)
+    return _DEFAULT_CONCURRENCY
+
+
+def _flush_action_log(store: ReviewStore, action_log: List[Dict[str, Any]]) -> None:
+    if not action_log:
+        return
+    try:
+        store.log_actions_bulk(action_log)
+    except Exception:
+        LOGGER.exception("Failed to write %s report audit entries", len(action_log))
+
+
 def main() -> int:
     """Entry point executed by the Cloud Run job container."""
 
-    _configure_logging()
+    configure_logging()
 
     batch_limit = int(os.getenv("I4G_REPORT__BATCH_LIMIT", "25") or 25)
     dry_run = os.getenv("I4G_REPORT__DRY_RUN", "false").lower() in {"1", "true", "yes", "on"}
 
     LOGGER.info("Starting report job: batch_limit=%s dry_run=%s", batch_limit, dry_run)
 
-    review_ids = _resolve_review_ids(limit=batch_limit)
+    # A dry run over explicit IDs touches neither the queue nor the reports, so it skips the store entirely.
+    explicit_ids = _explicit_review_ids()
+    if dry_run and explicit_ids is not None:
+        review_ids = explicit_ids
+    else:
+        # One store (and one SQLite connection) serves both the queue lookup and every report.
+        store = build_review_store()
+        review_ids = _resolve_review_ids(limit=batch_limit, store=store)
     if not review_ids:
         LOGGER.info("No review IDs resolved; nothing to do")
         return 0
 
     LOGGER.info("Resolved %s review ID(s) for processing", len(review_ids))
 
-    store = build_review_store()
     successes = 0
     failures = 0
 
-    for review_id in review_ids:
-        if dry_run:
+    if dry_run:
+        for review_id in review_ids:
             LOGGER.info("Dry run enabled; would generate report for %s", review_id)
             successes += 1
-            continue
-        result = generate_report_for_case(review_id, store=store)
-        if result.startswith("error:"):
-            failures += 1
-            LOGGER.error("Report generation failed for %s: %s", review_id, result)
-        else:
-            successes += 1
-            LOGGER.info("Report generated for %s → %s", review_id, result)
+        LOGGER.info("Report batch complete: successes=%s failures=%s", successes, failures)
+        return 0
+
+    # Report generation is dominated by review-store and template I/O, so cases run concurrently.
+    # ReviewStore serialises access to its shared connection with a lock, so one instance serves every worker.
+    # Audit entries are collected here and written in one transaction once the batch finishes.
+    concurrency = _report_concurrency()
+    action_log: List[Dict[str, Any]] = []
+    try:
+        with ThreadPoolExecutor(
+            max_workers=min(len(review_ids), concurrency), thread_name_prefix="report-job"
+        ) as executor:
+            futures = {
+                executor.submit(generate_report_for_case, review_id, store=store, action_log=action_log): review_id
+                for review_id in review_ids
+            }
+            for future in as_completed(futures):
+                review_id = futures[future]
+                try:
+                    result = future.result()
+                except Exception as exc:  # pragma: no cover - generate_report_for_case reports its own errors
+                    result = f"error:{exc}"
+                if result.startswith("error:"):
+                    failures += 1
+                    LOGGER.error("Report generation failed for %s: %s", review_id, result)
+                else:
+                    successes += 1
+                    LOGGER.info("Report generated for %s → %s", review_id, result)
+    finally:
+        _flush_action_log(store, action_log)
 
     LOGGER.info("Report batch complete: successes=%s failures=%s", successes, failures)
 
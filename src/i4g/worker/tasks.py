@@ -6,7 +6,10 @@ post-review operations such as report generation and export.
 """
 
 import logging
-from typing import Optional
+import threading
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 from i4g.reports.generator import ReportGenerator
 from i4g.services.factories import build_review_store
@@ -25,18 +28,72 @@ def _resolve_review_store(candidate: Optional[ReviewStore]) -> ReviewStore:
     if not isinstance(ReviewStore, type):
         return ReviewStore()
 
+    return _default_review_store()
+
+
+@lru_cache(maxsize=1)
+def _default_review_store() -> ReviewStore:
+    """Share one review store (and its connection) across calls that do not pass one."""
+
     return build_review_store()
 
 
+_generators = threading.local()
+
+
+def _resolve_report_generator() -> ReportGenerator:
+    """Return this thread's cached ReportGenerator, building it on first use.
+
+    The generator owns store handles and an LLM client that are expensive to set up
+    but not safe to share across threads, so each report worker keeps its own.
+    """
+
+    # Tests often monkeypatch ``ReportGenerator`` with a MagicMock factory.
+    if not isinstance(ReportGenerator, type):
+        return ReportGenerator()
+
+    generator = getattr(_generators, "instance", None)
+    if generator is None:
+        generator = _generators.instance = ReportGenerator()
+    return generator
+
+
+def _record_action(
+    store: ReviewStore,
+    action_log: Optional[List[Dict[str, Any]]],
+    review_id: str,
+    action: str,
+    payload: Dict[str, Any],
+) -> None:
+    """Write a worker audit entry now, or defer it to ``action_log`` when one is supplied."""
+
+    if action_log is None:
+        store.log_action(review_id, actor="worker", action=action, payload=payload)
+        return
+    action_log.append(
+        {
+            "review_id": review_id,
+            "actor": "worker",
+            "action": action,
+            "payload": payload,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+    )
+
+
 def generate_report_for_case(
     review_id: str,
     store: Optional[ReviewStore] = None,
+    *,
+    action_log: Optional[List[Dict[str, Any]]] = None,
 ) -> str:
     """Generate and export a report for a specific accepted review case.
 
     Args:
         review_id: Unique ID of the review record.
         store: Optional ReviewStore instance; creates new if omitted.
+        action_log: Optional list collecting audit entries instead of writing them
+            immediately; the caller flushes it with ``ReviewStore.log_actions_bulk``.
 
     Returns:
         The local path of the created report, or "error:<message>" on failure.
@@ -53,22 +110,17 @@ def generate_report_for_case(
         return "error:not_accepted"
 
     try:
-        generator = ReportGenerator()
+        generator = _resolve_report_generator()
         report_result = generator.generate_report(case_id=case.get("case_id"))
 
         report_path = report_result.get("report_path")
         if not report_path:
             raise Exception("Report generated but no local path returned.")
 
-        store.log_action(
-            review_id,
-            actor="worker",
-            action="report_generated",
-            payload={"report_path": report_path},
-        )
+        _record_action(store, action_log, review_id, "report_generated", {"report_path": report_path})
         logger.info("Generated and exported report for %s → %s", review_id, report_path)
         return report_path
     except Exception as exc:
         logger.exception("Report generation/export failed for %s", review_id)
-        store.log_action(review_id, actor="worker", action="error", payload={"error": str(exc)})
+        _record_action(store, action_log, review_id, "error", {"error": str(exc)})
         return f"error:{exc}"
@@ -1,18 +1,100 @@
 # bge_embed_server.py
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+import numpy as np
 import uvicorn
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from sentence_transformers import SentenceTransformer
 
-app = FastAPI()
+try:  # optional: pip install orjson
+    import orjson
+except ImportError:
+    orjson = None
+
+MAX_BATCH = 64
+MAX_LATENCY_MS = 5
+
 model = SentenceTransformer("BAAI/bge-small-en")
+if model.device.type == "cuda":
+    model.half()
+
+# One inference thread: the model is never re-entered, and the event loop stays free.
+_encoder = ThreadPoolExecutor(max_workers=1)
+_pending: asyncio.Queue = None
+
+
+async def _batcher():
+    """Coalesce texts from concurrent requests into a single model.encode call."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _pending.get()]
+        deadline = loop.time() + MAX_LATENCY_MS / 1000
+        while len(batch) < MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_pending.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        texts = [text for text, _ in batch]
+        try:
+            embeddings = await loop.run_in_executor(
+                _encoder,
+                lambda: model.encode(texts, batch_size=MAX_BATCH, convert_to_numpy=True),
+            )
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            continue
+        for (_, future), emb in zip(batch, embeddings):
+            if not future.done():
+                future.set_result(emb)
+
+
+@asynccontextmanager
+async def lifespan(_app):
+    global _pending
+    _pending = asyncio.Queue()
+    task = asyncio.create_task(_batcher())
+    yield
+    task.cancel()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 @app.post("/embed")
 async def embed(request: Request):
     data = await request.json()
     texts = data.get("input", [])
-    embeddings = model.encode(texts, convert_to_numpy=True).tolist()
-    return {"data": [{"embedding": emb} for emb in embeddings]}
+    if isinstance(texts, str):
+        texts = [texts]
+    loop = asyncio.get_running_loop()
+    futures = []
+    for text in texts:
+        future = loop.create_future()
+        _pending.put_nowait((text, future))
+        futures.append(future)
+    rows = await asyncio.gather(*futures)
+    embeddings = np.stack(rows) if rows else np.empty((0, model.get_sentence_embedding_dimension()), np.float32)
+
+    # Binary opt-in: raw float16 rows (half the bytes of float32), shape in X-Shape.
+    # Clients decode with np.frombuffer(body, np.float16).reshape(shape).
+    if "application/octet-stream" in request.headers.get("accept", ""):
+        return Response(
+            content=embeddings.astype(np.float16).tobytes(),
+            media_type="application/octet-stream",
+            headers={"X-Shape": f"{embeddings.shape[0]},{embeddings.shape[1]}"},
+        )
+    if orjson is not None:
+        # orjson encodes the float32 rows straight from the array buffers, with no per-float boxing.
+        body = orjson.dumps({"data": [{"embedding": row} for row in embeddings]}, option=orjson.OPT_SERIALIZE_NUMPY)
+        return Response(content=body, media_type="application/json")
+    return {"data": [{"embedding": row} for row in embeddings.tolist()]}
 
 
 if __name__ == "__main__":
@@ -10,14 +10,21 @@ Usage:
 
 Dependencies:
   pip install datasets requests tqdm regex
+  pip install google-re2   # optional, faster PII masking
 """
 
 import argparse
 import json
+import multiprocessing as mp
 import os
 import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
+import numpy as np
 from tqdm import tqdm
 
 # Try to import Hugging Face datasets (used for SMS and phishing mirrors)
@@ -26,7 +33,19 @@ try:
 except Exception as e:
     raise SystemExit("Please install `datasets` (pip install datasets) before running this script.") from e
 
+try:  # optional: pip install google-re2
+    import re2
+except ImportError:
+    re2 = None
+
+try:  # optional: pip install orjson
+    import orjson
+except ImportError:
+    orjson = None
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ---------------------------
 # Configurable dataset sources
@@ -35,6 +54,19 @@ UCI_SMS_HF = "ucirvine/sms_spam"  # Hugging Face mirror of UCI SMS
 PHISHING_HF = "ealvaradob/phishing-dataset"  # example HF phishing mirror
 ZENODO_SCAM_URL = "https://zenodo.org/records/15212527/files/scam_conversations.jsonl"  # try direct file; if different, script will save landing page
 
+# Shared keep-alive session for the Zenodo file and landing-page requests.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504], raise_on_status=False),
+    ),
+)
+DOWNLOAD_CHUNK_BYTES = 1 << 20
+READ_BUFFER_BYTES = 1 << 20
+
 # ---------------------------
 # Simple PII regexes (tunable)
 # ---------------------------
@@ -49,59 +81,153 @@ PII_PATTERNS = {
 }
 
 
+# Each pass runs over the output of the previous one, in the order above. Fusing them into one alternation
+# changes which digits get redacted (e.g. a URL followed by a phone number can leave most of an SSN visible).
+# With google-re2 installed each pass runs on RE2's linear-time automaton; otherwise ``re`` is used.
+PII_PASSES = tuple(
+    ((re2.compile(pat.pattern) if re2 is not None else pat), f"<REDACTED_{token}>")
+    for token, pat in PII_PATTERNS.items()
+)
+
+
+# Every pattern needs an "@" (EMAIL), "http"/"www." (URL) or a digit (PHONE/CARD/SSN) to match,
+# so texts with none of those markers (most ham SMS) skip the regex pass entirely.
+_HAS_DIGIT = re.compile(r"\d").search
+
+
+def _may_contain_pii(text):
+    return "@" in text or _HAS_DIGIT(text) is not None or "http" in text or "www." in text
+
+
+# Spam corpora repeat template messages verbatim, so identical texts are masked once.
+@lru_cache(maxsize=131072)
 def mask_pii(text):
-    if not text:
+    if not text or not _may_contain_pii(text):
         return text
-    s = text
-    for token, pat in PII_PATTERNS.items():
-        s = pat.sub(f"<REDACTED_{token}>", s)
-    return s
+    for pat, replacement in PII_PASSES:
+        text = pat.sub(replacement, text)
+    return text
+
+
+def mask_messages(texts):
+    """Mask each message of a conversation and join them with newlines."""
+    return "\n".join(mask_pii(text) for text in texts)
+
+
+# ---------------------------
+# Parallel masking (opt-in: --mask-workers)
+# ---------------------------
+MASK_BATCH = 10_000
+MASK_CHUNKSIZE = 1_000
+_MASK_POOL = None
+
+
+def _iter_masked(records, text_of, mask=mask_pii):
+    """
+    Yield ``(record, masked_text)`` pairs in input order.
+    Records are taken in bounded batches so a streamed dataset never sits in memory
+    whole; each batch is masked across the worker pool when one is running.
+    """
+    records = iter(records)
+    while True:
+        batch = list(islice(records, MASK_BATCH))
+        if not batch:
+            return
+        texts = [text_of(record) for record in batch]
+        if _MASK_POOL is None:
+            masked = map(mask, texts)
+        else:
+            masked = _MASK_POOL.map(mask, texts, chunksize=MASK_CHUNKSIZE)
+        yield from zip(batch, masked)
 
 
 # ---------------------------
 # Chunking helper
 # ---------------------------
+# crude sentence split: split on .!? or newline
+SENTENCE_SPLIT = re.compile(r"(?<=[\.\!\?\n])\s+")
+
+
+@lru_cache(maxsize=131072)
 def chunk_text(ret_text, max_chars=800):
     """
     Break text into chunks of at most max_chars, trying to split on sentence endings.
-    Returns list of chunks.
+    Sentences are packed greedily; chunk boundaries come from a prefix sum of
+    sentence lengths instead of growing a string sentence by sentence.
+    Returns a tuple of chunks (immutable, since results are cached).
     """
     if not ret_text:
-        return []
-    # crude sentence split: split on .!? or newline
-    sentences = re.split(r"(?<=[\.\!\?\n])\s+", ret_text.strip())
+        return ()
+    text = ret_text.strip()
+    raw_sentences = [part for part in SENTENCE_SPLIT.split(text) if part]
+    sentences = [part.strip() for part in raw_sentences]
+    if not any(sentences):
+        return ()
+    if len(text) <= max_chars:
+        # Most SMS/email bodies fit in a single chunk.
+        return (" ".join(sentences),)
+
+    # cum[i] = length of sentences[0..i] joined with single spaces, plus one trailing space.
+    cum = np.cumsum(np.fromiter((len(s) + 1 for s in sentences), dtype=np.int64, count=len(sentences)))
+    # The fit test counts a sentence's trailing whitespace (e.g. "\r\n") before it is stripped away.
+    trailing = np.fromiter(
+        (len(raw) - len(s) for raw, s in zip(raw_sentences, sentences)), dtype=np.int64, count=len(sentences)
+    )
+    has_trailing = bool(trailing.any())
     chunks = []
-    cur = ""
-    for sent in sentences:
-        if not sent:
+    emit = chunks.append
+    start = 0
+    while start < len(sentences):
+        sent = raw_sentences[start]
+        if len(sent) > max_chars:
+            # hard-split long sentence
+            chunks.extend(sent[i : i + max_chars] for i in range(0, len(sent), max_chars))
+            start += 1
             continue
-        if len(cur) + len(sent) + 1 <= max_chars:
-            cur = (cur + " " + sent).strip()
-        else:
-            if cur:
-                chunks.append(cur)
-            if len(sent) <= max_chars:
-                cur = sent.strip()
-            else:
-                # hard-split long sentence
-                for i in range(0, len(sent), max_chars):
-                    chunks.append(sent[i : i + max_chars])
-                cur = ""
-    if cur:
-        chunks.append(cur)
-    return chunks
+        base = int(cum[start - 1]) if start else 0
+        limit = base + max_chars
+        end = int(np.searchsorted(cum, limit + 1, side="right"))
+        if has_trailing and end > start + 1:
+            over = cum[start + 1 : end] - 1 + trailing[start + 1 : end] > limit
+            if over.any():
+                end = start + 1 + int(over.argmax())
+        emit(" ".join(sentences[start:end]))
+        start = end
+    return tuple(chunks)
+
+
+# ---------------------------
+# JSON (orjson when installed)
+# ---------------------------
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_line(doc):
+    """Serialize ``doc`` as one UTF-8 JSONL line."""
+    if orjson is not None:
+        return orjson.dumps(doc, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(doc, ensure_ascii=False) + "\n").encode("utf-8")
 
 
 # ---------------------------
 # Normalizers for each dataset
 # ---------------------------
+PHISHING_LABELS = frozenset(("phish", "phishing", "1", "spam"))
+
+
+def _sms_text(item):
+    # dataset fields vary; HF mirror tends to have 'label' and 'text' or 'sms'
+    return item.get("text") or item.get("sms") or item.get("message") or ""
+
+
 def process_ucirvine_sms(dataset, out_docs, chunk_chars):
-    for i, item in enumerate(dataset):
-        # dataset fields vary; HF mirror tends to have 'label' and 'text' or 'sms'
-        text = item.get("text") or item.get("sms") or item.get("message") or ""
+    emit = out_docs.append
+    for i, (item, text) in enumerate(_iter_masked(dataset, _sms_text)):
         label = item.get("label") or item.get("class") or None
         source_id = f"ucisms-{i}"
-        text = mask_pii(text)
         chunks = chunk_text(text, max_chars=chunk_chars)
         for j, c in enumerate(chunks or [text]):
             doc = {
@@ -115,18 +241,21 @@ def process_ucirvine_sms(dataset, out_docs, chunk_chars):
                 ),
                 "metadata": {"orig_index": i},
             }
-            out_docs.append(doc)
+            emit(doc)
+
+
+def _phishing_text(item):
+    # different mirrors use different fields; guess common ones:
+    body = item.get("body") or item.get("email_body") or item.get("text") or item.get("content") or ""
+    subject = item.get("subject") or item.get("title") or ""
+    return (subject + "\n\n" + body).strip()
 
 
 def process_phishing_hf(dataset, out_docs, chunk_chars):
-    for i, item in enumerate(dataset):
-        # different mirrors use different fields; guess common ones:
-        body = item.get("body") or item.get("email_body") or item.get("text") or item.get("content") or ""
-        subject = item.get("subject") or item.get("title") or ""
+    emit = out_docs.append
+    for i, (item, combined) in enumerate(_iter_masked(dataset, _phishing_text)):
         label = item.get("label") or item.get("class") or item.get("is_phish") or item.get("label_text")
         source_id = f"phish-{i}"
-        combined = (subject + "\n\n" + body).strip()
-        combined = mask_pii(combined)
         chunks = chunk_text(combined, max_chars=chunk_chars)
         for j, c in enumerate(chunks or [combined]):
             doc = {
@@ -135,12 +264,30 @@ def process_phishing_hf(dataset, out_docs, chunk_chars):
                 "text": c,
                 "date": item.get("date") or None,
                 "platform": "email",
-                "scam_type": (
-                    "phishing" if label and str(label).lower() in ("phish", "phishing", "1", "spam") else "unknown"
-                ),
+                "scam_type": ("phishing" if label and str(label).lower() in PHISHING_LABELS else "unknown"),
                 "metadata": {"orig_index": i},
             }
-            out_docs.append(doc)
+            emit(doc)
+
+
+def _zenodo_records(fh):
+    """Yield ``(line_index, record, messages)`` for each parseable Zenodo JSONL line."""
+    # Lines stay as bytes: both parsers accept UTF-8 bytes and ignore the trailing newline.
+    for i, line in enumerate(fh):
+        try:
+            rec = _json_loads(line)
+        except Exception:
+            continue
+        # Many scam corpora have a list of messages
+        messages = rec.get("messages") or rec.get("conversation") or []
+        if not messages and isinstance(rec.get("text"), str):
+            messages = [{"text": rec.get("text"), "role": "unknown"}]
+        yield i, rec, messages
+
+
+def _zenodo_texts(record):
+    # Convert into message-level docs
+    return [m["text"] for m in record[2] if m.get("text")]
 
 
 def process_zenodo_scc(local_path, out_docs, chunk_chars):
@@ -151,20 +298,12 @@ def process_zenodo_scc(local_path, out_docs, chunk_chars):
     if not os.path.exists(local_path):
         print(f"[warn] Zenodo file not found at {local_path}")
         return
-    with open(local_path, "r", encoding="utf-8") as fh:
-        for i, line in enumerate(fh):
-            try:
-                rec = json.loads(line.strip())
-            except Exception:
-                continue
+    emit = out_docs.append
+    with open(local_path, "rb", buffering=READ_BUFFER_BYTES) as fh:
+        records = _iter_masked(_zenodo_records(fh), _zenodo_texts, mask=mask_messages)
+        for (i, rec, _), text_join in records:
             # expected SCC JSON structure (convo-level or message-level)
             convo_id = rec.get("id") or f"zenodo-{i}"
-            # Many scam corpora have a list of messages
-            messages = rec.get("messages") or rec.get("conversation") or []
-            if not messages and isinstance(rec.get("text"), str):
-                messages = [{"text": rec.get("text"), "role": "unknown"}]
-            # Convert into message-level docs
-            text_join = "\n".join([mask_pii(m.get("text", "")) for m in messages if m.get("text")])
             chunks = chunk_text(text_join, max_chars=chunk_chars)
             for j, c in enumerate(chunks or [text_join]):
                 doc = {
@@ -176,49 +315,147 @@ def process_zenodo_scc(local_path, out_docs, chunk_chars):
                     "scam_type": rec.get("scam_type") or "scam",
                     "metadata": {"orig": rec.get("meta") or {}},
                 }
-                out_docs.append(doc)
+                emit(doc)
+
+
+# ---------------------------
+# Streaming output
+# ---------------------------
+WRITE_BUFFER_BYTES = 1 << 20
+
+
+class BundleWriter:
+    """
+    List-like sink for one normalizer: each appended doc is serialized once and
+    streamed to its per-source JSONL. Each loader thread owns its own writer, so
+    no file handle or counter is shared between threads.
+    """
+
+    def __init__(self, outdir):
+        self.outdir = Path(outdir)
+        self._by_source = {}
+        self.counts = {}
+        self.total = 0
+
+    def append(self, doc):
+        src = doc["source"]
+        fh = self._by_source.get(src)
+        if fh is None:
+            fh = self._by_source[src] = open(self.path_for(src), "wb", buffering=WRITE_BUFFER_BYTES)
+        fh.write(_json_line(doc))
+        self.counts[src] = self.counts.get(src, 0) + 1
+        self.total += 1
+
+    def path_for(self, src):
+        return self.outdir / f"{src}.jsonl"
+
+    def __len__(self):
+        return self.total
+
+    def close(self):
+        for fh in self._by_source.values():
+            fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_combined_bundle(bundle_path, writers):
+    """Concatenate the per-source JSONL files, in loader order, into the combined bundle."""
+    with open(bundle_path, "wb") as out:
+        for writer in writers:
+            for src in writer.counts:
+                with open(writer.path_for(src), "rb") as fh:
+                    shutil.copyfileobj(fh, out, WRITE_BUFFER_BYTES)
 
 
 # ---------------------------
 # Main orchestration
 # ---------------------------
-def main(outdir="outputs", chunk_chars=800, force_zenodo_download=False):
+def main(outdir="outputs", chunk_chars=800, force_zenodo_download=False, mask_workers=0):
     outdir = Path(outdir)
     outdir.mkdir(parents=True, exist_ok=True)
-    docs = []
 
-    print("[1/4] Loading UCI SMS (Hugging Face mirror)...")
+    global _MASK_POOL
+    if mask_workers > 0:
+        # Start the pool before any loader thread exists; with fork the workers inherit the
+        # compiled patterns and never re-import HF datasets.
+        start_method = "fork" if "fork" in mp.get_all_start_methods() else None
+        _MASK_POOL = mp.get_context(start_method).Pool(processes=mask_workers)
     try:
-        sms_ds = load_dataset(UCI_SMS_HF, split="train")
-        process_ucirvine_sms(sms_ds, docs, chunk_chars)
-        print(f"  -> added {len(docs)} SMS-based docs so far")
-    except Exception as e:
-        print("  [error] failed to load UCI SMS via datasets:", e)
+        writers = _run_loaders(outdir, chunk_chars, force_zenodo_download)
+    finally:
+        if _MASK_POOL is not None:
+            _MASK_POOL.close()
+            _MASK_POOL.join()
+            _MASK_POOL = None
+
+    bundle_path = outdir / "bundle_all.jsonl"
+    write_combined_bundle(bundle_path, writers)
+    total = 0
+    for writer in writers:
+        for src, count in writer.counts.items():
+            print(f"  wrote {count} docs to {writer.path_for(src)}")
+        total += len(writer)
+    print(f"[done] wrote combined bundle to {bundle_path} ({total} total docs)")
+
+
+def _run_loaders(outdir, chunk_chars, force_zenodo_download):
+    # Each loader is dominated by network (HF hub) or disk I/O, so all three run at once
+    # and the bootstrap takes as long as the slowest one rather than their sum.
+    loaders = [
+        (_load_sms, (outdir, chunk_chars)),
+        (_load_phishing, (outdir, chunk_chars)),
+        (_load_zenodo, (outdir, chunk_chars, force_zenodo_download)),
+    ]
+    with ThreadPoolExecutor(max_workers=len(loaders), thread_name_prefix="bundle-loader") as executor:
+        futures = [executor.submit(loader, *loader_args) for loader, loader_args in loaders]
+        return [future.result() for future in futures]
+
+
+def _load_sms(outdir, chunk_chars):
+    print("[1/3] Streaming UCI SMS (Hugging Face mirror)...")
+    with BundleWriter(outdir) as docs:
+        try:
+            sms_ds = load_dataset(UCI_SMS_HF, split="train", streaming=True)
+            process_ucirvine_sms(sms_ds, docs, chunk_chars)
+            print(f"  -> added {len(docs)} SMS-based docs")
+        except Exception as e:
+            print("  [error] failed to load UCI SMS via datasets:", e)
+    return docs
 
-    print("[2/4] Loading Phishing dataset (Hugging Face mirror)...")
-    try:
-        phish_ds = load_dataset(PHISHING_HF, split="train")
-        before = len(docs)
-        process_phishing_hf(phish_ds, docs, chunk_chars)
-        print(f"  -> added {len(docs)-before} phishing docs")
-    except Exception as e:
-        print("  [warn] failed to load phishing HF dataset via datasets:", e)
 
+def _load_phishing(outdir, chunk_chars):
+    print("[2/3] Streaming Phishing dataset (Hugging Face mirror)...")
+    with BundleWriter(outdir) as docs:
+        try:
+            phish_ds = load_dataset(PHISHING_HF, split="train", streaming=True)
+            process_phishing_hf(phish_ds, docs, chunk_chars)
+            print(f"  -> added {len(docs)} phishing docs")
+        except Exception as e:
+            print("  [warn] failed to load phishing HF dataset via datasets:", e)
+    return docs
+
+
+def _load_zenodo(outdir, chunk_chars, force_zenodo_download):
     # Attempt to download zenodo scam corpus (if direct file exists)
     local_zenodo_path = outdir / "zenodo_scam.jsonl"
     # if force_zenodo_download or not local_zenodo_path.exists():
     if False:
-        print("[3/4] Downloading Zenodo Scam Conversation Corpus from Zenodo landing URL...")
+        print("[3/3] Downloading Zenodo Scam Conversation Corpus from Zenodo landing URL...")
         try:
-            r = requests.get(ZENODO_SCAM_URL, stream=True, timeout=30)
+            r = _SESSION.get(ZENODO_SCAM_URL, stream=True, timeout=30)
             if r.status_code == 200 and r.headers.get("content-type", "").startswith("application/json"):
                 with open(local_zenodo_path, "wb") as fh:
-                    for chunk in r.iter_content(chunk_size=1 << 14):
+                    for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES):
                         fh.write(chunk)
                 print("  -> downloaded zenodo file to", local_zenodo_path)
             else:
                 # Save landing page (some Zenodo datasets require manual download due to redirects)
-                landing = requests.get("https://zenodo.org/records/15212527", timeout=30)
+                landing = _SESSION.get("https://zenodo.org/records/15212527", timeout=30)
                 with open(local_zenodo_path, "w", encoding="utf-8") as fh:
                     fh.write(landing.text)
                 print("  -> Zenodo landing page saved; please download the dataset manually if JSONL not present.")
@@ -226,26 +463,9 @@ def main(outdir="outputs", chunk_chars=800, force_zenodo_download=False):
             print("  [warn] zenodo download attempt failed:", e)
 
     # Process local zenodo file if it's JSONL
-    process_zenodo_scc(str(local_zenodo_path), docs, chunk_chars)
-
-    # Write per-dataset outputs (simple split by 'source')
-    out_by_source = {}
-    for d in docs:
-        out_by_source.setdefault(d["source"], []).append(d)
-
-    for src, items in out_by_source.items():
-        fname = outdir / f"{src}.jsonl"
-        with open(fname, "w", encoding="utf-8") as fh:
-            for it in items:
-                fh.write(json.dumps(it, ensure_ascii=False) + "\n")
-        print(f"  wrote {len(items)} docs to {fname}")
-
-    # Write combined bundle
-    bundle_path = outdir / "bundle_all.jsonl"
-    with open(bundle_path, "w", encoding="utf-8") as fh:
-        for it in docs:
-            fh.write(json.dumps(it, ensure_ascii=False) + "\n")
-    print(f"[done] wrote combined bundle to {bundle_path} ({len(docs)} total docs)")
+    with BundleWriter(outdir) as docs:
+        process_zenodo_scc(str(local_zenodo_path), docs, chunk_chars)
+    return docs
 
 
 if __name__ == "__main__":
@@ -257,9 +477,16 @@ if __name__ == "__main__":
         action="store_true",
         help="force download zenodo file",
     )
+    parser.add_argument(
+        "--mask-workers",
+        type=int,
+        default=0,
+        help="processes for PII masking (0 = mask in-process; try os.cpu_count() for large corpora)",
+    )
     args = parser.parse_args()
     main(
         outdir=args.outdir,
         chunk_chars=args.chunk_chars,
         force_zenodo_download=args.force_zenodo_download,
+        mask_workers=args.mask_workers,
     )
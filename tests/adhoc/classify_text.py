@@ -8,6 +8,10 @@ and prints a structured summary including confidence and explanation.
 
 Usage:
     python scripts/classify_text.py "Hi I'm Anna from TrustWallet. Please send 50 USDT for verification."
+    python scripts/classify_text.py --input-file texts.jsonl --concurrency 8
+
+Batch mode reads one text per JSONL line (a JSON string or an object with a "text"
+field) and prints one JSON result per line, in input order.
 
 Assumptions:
   - The Ollama LLM is available locally or at the base_url configured in env.
@@ -17,14 +21,51 @@ Assumptions:
 import argparse
 import json
 import pprint
+from concurrent.futures import ThreadPoolExecutor
 
 from i4g.classification.classifier import classify
 from i4g.extraction.semantic_ner import build_llm, extract_semantic_entities
 
 
+def _read_texts(path):
+    texts = []
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            texts.append(record["text"] if isinstance(record, dict) else str(record))
+    return texts
+
+
+def _classify_one(text, llm):
+    entities = extract_semantic_entities(text, llm)
+    return {"text": text, "entities": entities, "classification": classify(entities)}
+
+
+def run_batch(texts, llm, concurrency):
+    """Classify many texts, keeping up to ``concurrency`` LLM calls in flight on one shared client."""
+    with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="classify") as executor:
+        # map() yields in input order while the calls themselves overlap.
+        for result in executor.map(lambda text: _classify_one(text, llm), texts):
+            print(json.dumps(result, ensure_ascii=False), flush=True)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run fraud classification pipeline on input text")
-    parser.add_argument("text", type=str, help="Text input to analyze")
+    parser.add_argument("text", type=str, nargs="?", help="Text input to analyze")
+    parser.add_argument(
+        "--input-file",
+        type=str,
+        default=None,
+        help="JSONL file of texts to classify in batch mode",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Concurrent LLM calls in batch mode (default: 4)",
+    )
     parser.add_argument(
         "--model",
         type=str,
@@ -38,10 +79,16 @@ def main():
         help="Base URL for Ollama API if not local",
     )
     args = parser.parse_args()
+    if not args.text and not args.input_file:
+        parser.error("provide a text argument or --input-file")
+
+    llm = build_llm(model=args.model, base_url=args.base_url)
+    if args.input_file:
+        run_batch(_read_texts(args.input_file), llm, args.concurrency)
+        return
 
     print("\n=== i4g Fraud Classification CLI ===\n")
 
-    llm = build_llm(model=args.model, base_url=args.base_url)
     print("[Step 1] Extracting semantic entities ...")
     entities = extract_semantic_entities(args.text, llm)
 
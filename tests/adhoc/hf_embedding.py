@@ -11,9 +11,29 @@ import sys
 from typing import Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 API_URL = "https://api-inference.huggingface.co/models/BAAI/bge-small-en-v1.5"
 
+# Keep-alive session so repeated calls reuse one TCP+TLS connection; the endpoint answers
+# 503 while the model warms up, so transient statuses are retried (POST is idempotent here).
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False,
+        ),
+    ),
+)
+
 
 def _read_token() -> str:
     token = os.environ.get("HF_API_TOKEN")
@@ -31,7 +51,7 @@ def _payload(texts: Sequence[str]) -> dict:
 def main(args: Sequence[str]) -> None:
     token = _read_token()
     headers = {"Authorization": f"Bearer {token}"}
-    resp = requests.post(API_URL, headers=headers, json=_payload(args))
+    resp = _SESSION.post(API_URL, headers=headers, json=_payload(args))
     print(resp.status_code)
     try:
         resp.raise_for_status()
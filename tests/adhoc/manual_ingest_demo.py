@@ -7,12 +7,15 @@ import pprint
 from pathlib import Path
 from typing import Sequence
 
-from i4g.store.ingest import IngestPipeline
+from i4g.store.ingest import IngestPipeline, flatten_entities
 from i4g.store.structured import StructuredStore
 from i4g.store.vector import VectorStore
 
 DEFAULT_STRUCTURED_DB = Path("data/manual_demo/structured_demo.db")
-DEFAULT_VECTOR_DIR = Path("data/manual_demo/chroma")
+DEFAULT_VECTOR_DIRS = {
+    "chroma": Path("data/manual_demo/chroma"),
+    "faiss": Path("data/manual_demo/faiss"),
+}
 
 
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
@@ -25,13 +28,22 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=DEFAULT_STRUCTURED_DB,
         help="Path to the SQLite database used for structured cases",
     )
+    parser.add_argument(
+        "--backend",
+        choices=sorted(DEFAULT_VECTOR_DIRS),
+        default="chroma",
+        help="Vector backend; faiss runs exact flat-index search instead of Chroma's HNSW graph",
+    )
     parser.add_argument(
         "--vector-dir",
         type=Path,
-        default=DEFAULT_VECTOR_DIR,
-        help="Directory used for the Chroma vector store",
+        default=None,
+        help="Directory used for the vector store (defaults to a per-backend demo directory)",
     )
-    return parser.parse_args(argv)
+    args = parser.parse_args(argv)
+    if args.vector_dir is None:
+        args.vector_dir = DEFAULT_VECTOR_DIRS[args.backend]
+    return args
 
 
 def main(argv: Sequence[str] | None = None) -> None:
@@ -45,12 +57,12 @@ def main(argv: Sequence[str] | None = None) -> None:
     vector_dir.mkdir(parents=True, exist_ok=True)
 
     structured_store = StructuredStore(str(structured_db))
-    vector_store = VectorStore(persist_dir=str(vector_dir))
+    vector_store = VectorStore(persist_dir=str(vector_dir), backend=args.backend)
     pipeline = IngestPipeline(structured_store=structured_store, vector_store=vector_store)
 
     print("✅ Initialized Structured + Vector stores.")
     print(f"   DB: {structured_db}")
-    print(f"   Chroma dir: {vector_dir}\n")
+    print(f"   Vector dir ({args.backend}): {vector_dir}\n")
 
     # ------------------------------------------------------------------
     # Step 1: Ingest two sample scam cases
@@ -81,11 +93,13 @@ def main(argv: Sequence[str] | None = None) -> None:
         },
     ]
 
+    # Flatten the {"value": ...} entity dicts once up front; the pipeline takes either shape.
+    samples = [{**sample, "entities": flatten_entities(sample["entities"])} for sample in samples]
+
     print("🚀 Ingesting sample cases...")
-    for s in samples:
-        result = pipeline.ingest_classified_case(s)
-        cid = result.case_id
-        print(f"   → Stored case_id: {cid}")
+    # Samples are ingested in bulk chunks: one embedding call and one write per backend per chunk.
+    for result in pipeline.ingest_many(samples):
+        print(f"   → Stored case_id: {result.case_id}")
     print()
 
     # ------------------------------------------------------------------
@@ -97,7 +111,7 @@ def main(argv: Sequence[str] | None = None) -> None:
     results = pipeline.query_similar_cases(query, top_k=3)
 
     if not results:
-        print("No results found. Ensure Ollama and Chroma are running.")
+        print(f"No results found. Ensure Ollama is running and the {args.backend} store is writable.")
         return
 
     print("🧭 Similar Cases:")
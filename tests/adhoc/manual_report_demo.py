@@ -1,14 +1,20 @@
 """Manual demo: Render an FBI-style scam report using template + dummy data."""
 
 import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader
 
 
+@lru_cache(maxsize=None)
+def _template_env(template_dir: str = "templates") -> Environment:
+    """One Environment per template directory, so compiled templates are reused across renders."""
+    return Environment(loader=FileSystemLoader(template_dir), auto_reload=False)
+
+
 def render_report(template_name: str, data: dict, output_path: Path):
-    env = Environment(loader=FileSystemLoader("templates"))
-    template = env.get_template(template_name)
+    template = _template_env().get_template(template_name)
     rendered = template.render(**data)
     output_path.write_text(rendered)
     print(f"✅ Report generated at: {output_path}")
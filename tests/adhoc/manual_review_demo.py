@@ -14,16 +14,24 @@ Then in another terminal:
 import json
 
 import requests
+from requests.adapters import HTTPAdapter
 
 BASE_URL = "http://127.0.0.1:8000"
 
 
+def _session():
+    """Keep-alive session so every demo call reuses one loopback connection."""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    return session
+
+
 def pretty(obj):
     """Pretty-print JSON for better readability."""
     print(json.dumps(obj, indent=2, ensure_ascii=False))
 
 
-def run_demo():
+def run_demo(session):
     print("=== 1. Creating a new review case ===")
     payload = {
         "case_id": "CASE-2025-0001",
@@ -39,29 +47,30 @@ def run_demo():
         },
         "classification": {"label": "crypto_scam", "confidence": 0.93},
     }
-    r = requests.post(f"{BASE_URL}/reviews", json=payload)
+    r = session.post(f"{BASE_URL}/reviews", json=payload)
     r.raise_for_status()
     pretty(r.json())
 
     print("\n=== 2. Listing all review cases ===")
-    r = requests.get(f"{BASE_URL}/reviews")
+    r = session.get(f"{BASE_URL}/reviews")
     r.raise_for_status()
     pretty(r.json())
 
     print("\n=== 3. Updating review decision ===")
     update = {"decision": "accept", "notes": "Classic verification scam."}
-    r = requests.patch(f"{BASE_URL}/reviews/CASE-2025-0001", json=update)
+    r = session.patch(f"{BASE_URL}/reviews/CASE-2025-0001", json=update)
     r.raise_for_status()
     pretty(r.json())
 
     print("\n=== 4. Fetching a single case ===")
-    r = requests.get(f"{BASE_URL}/reviews/CASE-2025-0001")
+    r = session.get(f"{BASE_URL}/reviews/CASE-2025-0001")
     r.raise_for_status()
     pretty(r.json())
 
 
 if __name__ == "__main__":
     try:
-        run_demo()
+        with _session() as session:
+            run_demo(session)
     except requests.exceptions.ConnectionError:
         print("❌ Cannot connect to the API. Make sure the FastAPI server is running.")
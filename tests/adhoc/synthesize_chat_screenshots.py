@@ -13,12 +13,23 @@ Usage:
 
 import argparse
 import json
+import os
 import random
 import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
 from PIL import Image, ImageDraw, ImageFont
 
+try:  # optional: pip install orjson
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 # -------- CONFIG --------
 BG_COLOR = (245, 245, 245)  # chat background
 USER_COLORS = [(220, 248, 198), (255, 255, 255)]  # bubbles (sent, received)
@@ -28,20 +39,33 @@ IMG_WIDTH = 1080
 MAX_BUBBLES = 8  # messages per screenshot
 
 
-def load_font():
-    """Try to load a readable system font."""
+@lru_cache(maxsize=4)
+def load_font(size=FONT_SIZE):
+    """Try to load a readable system font (parsed once per size, then shared)."""
     try:
-        return ImageFont.truetype("Arial.ttf", FONT_SIZE)
-    except:
+        return ImageFont.truetype("Arial.ttf", size)
+    except OSError:
         return ImageFont.load_default()
 
 
+@lru_cache(maxsize=8)
+def _wrapper(max_width):
+    """One TextWrapper per bubble width (every bubble uses the same one)."""
+    return textwrap.TextWrapper(width=int(max_width / (FONT_SIZE * 0.5)))
+
+
+@lru_cache(maxsize=4096)
+def _text_length(font, text):
+    # SMS corpora repeat short lines verbatim, so measured widths are reused.
+    return font.getlength(text)
+
+
 def draw_bubble(draw, xy, text, font, bubble_color, max_width):
     """Draw a single chat bubble and return its bottom Y coordinate."""
     x, y = xy
-    lines = textwrap.wrap(text, width=int(max_width / (FONT_SIZE * 0.5)))
+    lines = _wrapper(max_width).wrap(text)
     text_height = len(lines) * (FONT_SIZE + 4)
-    text_width = max(font.getlength(line) for line in lines)
+    text_width = max(_text_length(font, line) for line in lines)
     pad = 20
     bubble = (x, y, x + text_width + pad * 2, y + text_height + pad)
     draw.rounded_rectangle(bubble, radius=20, fill=bubble_color)
@@ -67,7 +91,7 @@ def create_chat_image(messages, out_path):
         if sender_side == 0:  # left bubble
             x = 60
         else:  # right bubble
-            text_width = font.getlength(text)
+            text_width = _text_length(font, text)
             x = IMG_WIDTH - 60 - min(text_width + 80, IMG_WIDTH // 2)
         y = draw_bubble(draw, (x, y), text, font, USER_COLORS[sender_side], IMG_WIDTH // 2)
         if y > 1700:
@@ -77,24 +101,32 @@ def create_chat_image(messages, out_path):
     img.save(out_path)
 
 
+def _render(group):
+    messages, out_path = group
+    create_chat_image(messages, out_path)
+
+
 def main(input_file, limit):
     output_dir = Path("data/chat_screens")
     output_dir.mkdir(parents=True, exist_ok=True)
-    with open(input_file, "r", encoding="utf-8") as f:
-        lines = [json.loads(l) for l in f.readlines() if l.strip()]
+    # No run needs more than limit * MAX_BUBBLES records, so stop reading there.
+    with open(input_file, "rb") as f:
+        lines = list(islice((_json_loads(l) for l in f if l.strip()), limit * MAX_BUBBLES))
     print(f"Loaded {len(lines)} records")
 
     # group messages randomly into chats of 3–8 lines
+    groups = []
     idx = 0
-    n = 0
-    while idx < len(lines) and n < limit:
+    while idx < len(lines) and len(groups) < limit:
         num_msgs = random.randint(3, MAX_BUBBLES)
-        chat_msgs = lines[idx : idx + num_msgs]
-        out_path = output_dir / f"chat_{n+1:04d}.png"
-        create_chat_image(chat_msgs, out_path)
+        groups.append((lines[idx : idx + num_msgs], output_dir / f"chat_{len(groups)+1:04d}.png"))
         idx += num_msgs
-        n += 1
-    print(f"✅ Generated {n} chat screenshots in {output_dir}/")
+
+    # Each screenshot is independent, CPU-bound PIL rendering, so they render on every core.
+    if groups:
+        with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(groups))) as executor:
+            list(executor.map(_render, groups))
+    print(f"✅ Generated {len(groups)} chat screenshots in {output_dir}/")
 
 
 if __name__ == "__main__":
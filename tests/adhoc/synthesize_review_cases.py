@@ -103,9 +103,11 @@ def _seed_case(store: ReviewStore, target_status: str) -> Tuple[str, str]:
 
 def synthesize_cases(store: ReviewStore, plan: Iterable[str]) -> None:
     created = []
-    for status in plan:
-        review_id, case_id = _seed_case(store, status)
-        created.append((review_id, status, case_id))
+    # Every enqueue/update/log for the whole plan shares one transaction and a single commit.
+    with store.bulk():
+        for status in plan:
+            review_id, case_id = _seed_case(store, status)
+            created.append((review_id, status, case_id))
 
     if not created:
         print("No cases requested; nothing to do.")
@@ -13,9 +13,8 @@ sample = {
         "wallet_addresses": [{"value": "0xAbC..."}],
     },
 }
-    result = pipeline.ingest_classified_case(sample)
-    print("Ingested case:", result.case_id)
-print("Stored case:", cid)
+for result in pipeline.ingest_many([sample]):
+    print("Stored case:", result.case_id)
 
 similar = pipeline.query_similar_cases("TrustWallet verification fee", top_k=3)
 print(similar)
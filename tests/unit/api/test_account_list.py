@@ -4,12 +4,11 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from fastapi.testclient import TestClient
-
 from i4g.api.account_list import get_account_list_service, get_review_store
-from i4g.api.app import create_app
 from i4g.services.account_list import AccountListRequest, AccountListResult, FinancialIndicator
 
+FIXED_NOW = datetime(2025, 11, 28, tzinfo=timezone.utc)
+
 
 class _StubAccountListService:
     def __init__(self, result: AccountListResult) -> None:
@@ -21,10 +20,10 @@ class _StubAccountListService:
         return self.result
 
 
-def test_extract_accounts_success(monkeypatch):
+def test_extract_accounts_success(app, client, monkeypatch):
     result = AccountListResult(
         request_id="acc-test-1",
-        generated_at=datetime.now(tz=timezone.utc),
+        generated_at=FIXED_NOW,
         indicators=[
             FinancialIndicator(
                 category="bank",
@@ -40,9 +39,7 @@ def test_extract_accounts_success(monkeypatch):
         metadata={"indicator_count": 1},
     )
     service = _StubAccountListService(result)
-    app = create_app()
     app.dependency_overrides[get_account_list_service] = lambda: service
-    client = TestClient(app)
 
     log_calls: list[dict[str, object]] = []
 
@@ -75,22 +72,18 @@ def test_extract_accounts_success(monkeypatch):
     assert log_calls[0]["actor"].startswith("accounts_api")
     assert log_calls[0]["result"].request_id == "acc-test-1"
 
-    app.dependency_overrides.clear()
-
 
-def test_extract_accounts_rejects_large_top_k():
-    app = create_app()
+def test_extract_accounts_rejects_large_top_k(app, client):
     app.dependency_overrides[get_account_list_service] = lambda: _StubAccountListService(
         AccountListResult(
             request_id="unused",
-            generated_at=datetime.now(tz=timezone.utc),
+            generated_at=FIXED_NOW,
             indicators=[],
             sources=[],
             warnings=[],
             metadata={},
         )
     )
-    client = TestClient(app)
 
     payload = {
         "categories": ["bank"],
@@ -105,33 +98,27 @@ def test_extract_accounts_rejects_large_top_k():
     assert response.status_code == 400
     assert "top_k" in response.json()["detail"]
 
-    app.dependency_overrides.clear()
 
-
-def test_extract_accounts_requires_api_key():
-    app = create_app()
+def test_extract_accounts_requires_api_key(app, client):
     app.dependency_overrides[get_account_list_service] = lambda: _StubAccountListService(
         AccountListResult(
             request_id="unused",
-            generated_at=datetime.now(tz=timezone.utc),
+            generated_at=FIXED_NOW,
             indicators=[],
             sources=[],
             warnings=[],
             metadata={},
         )
     )
-    client = TestClient(app)
 
     payload = {"categories": ["bank"], "top_k": 5}
     response = client.post("/accounts/extract", json=payload)
     assert response.status_code == 403
     assert response.json()["detail"] == "Invalid account list API key"
 
-    app.dependency_overrides.clear()
-
 
-def test_list_account_runs_returns_audit_entries(monkeypatch):
-    generated_at = datetime.now(tz=timezone.utc).isoformat()
+def test_list_account_runs_returns_audit_entries(app, client):
+    generated_at = FIXED_NOW.isoformat()
     store_calls: list[dict[str, object]] = []
 
     class _StubStore:
@@ -157,9 +144,7 @@ def test_list_account_runs_returns_audit_entries(monkeypatch):
                 }
             ]
 
-    app = create_app()
     app.dependency_overrides[get_review_store] = lambda: _StubStore()
-    client = TestClient(app)
 
     response = client.get("/accounts/runs", headers={"X-API-KEY": "dev-analyst-token"})
     assert response.status_code == 200
@@ -168,5 +153,3 @@ def test_list_account_runs_returns_audit_entries(monkeypatch):
     assert payload["runs"][0]["request_id"] == "account-run-1234"
     assert payload["runs"][0]["artifacts"]["pdf"].endswith("report.pdf")
     assert store_calls == [{"action": "account_list_run", "limit": 20}]
-
-    app.dependency_overrides.clear()
@@ -0,0 +1,43 @@
+"""Shared fixtures for service-layer tests."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+
+from i4g.services.account_list.models import AccountListResult, FinancialIndicator, SourceDocument
+
+
+@pytest.fixture(scope="module")
+def account_list_result() -> AccountListResult:
+    """Account list result shared by tests that only read it."""
+
+    return AccountListResult(
+        request_id="acct-1",
+        generated_at=datetime(2025, 11, 28, tzinfo=timezone.utc),
+        indicators=[
+            FinancialIndicator(
+                category="bank",
+                item="Example Bank",
+                type="bank_account",
+                number="1111",
+                source_case_id="case-1",
+                metadata={"note": "primary"},
+            ),
+            FinancialIndicator(
+                category="crypto",
+                item="Example Chain",
+                type="wallet",
+                number="abcd",
+                source_case_id="case-2",
+            ),
+        ],
+        sources=[
+            SourceDocument(case_id="case-1", content="doc 1", dataset="structured"),
+            SourceDocument(case_id="case-2", content="doc 2", dataset="vector"),
+        ],
+        warnings=["Drive upload failed"],
+        metadata={"indicator_count": 2},
+        artifacts={"csv": "gs://bucket/acct-1.csv"},
+    )
@@ -2,12 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-
 import pytest
 
 from i4g.services.account_list.audit import log_account_list_run
-from i4g.services.account_list.models import AccountListResult, FinancialIndicator, SourceDocument
 
 
 class _StubStore:
@@ -29,40 +26,9 @@ class _StubStore:
         )
 
 
-def _build_result() -> AccountListResult:
-    now = datetime(2025, 11, 28, tzinfo=timezone.utc)
-    return AccountListResult(
-        request_id="acct-1",
-        generated_at=now,
-        indicators=[
-            FinancialIndicator(
-                category="bank",
-                item="Example Bank",
-                type="bank_account",
-                number="1111",
-                source_case_id="case-1",
-            ),
-            FinancialIndicator(
-                category="crypto",
-                item="Example Chain",
-                type="wallet",
-                number="abcd",
-                source_case_id="case-2",
-            ),
-        ],
-        sources=[
-            SourceDocument(case_id="case-1", content="doc 1", dataset="structured"),
-            SourceDocument(case_id="case-2", content="doc 2", dataset="vector"),
-        ],
-        warnings=["Drive upload failed"],
-        metadata={"indicator_count": 2},
-        artifacts={"csv": "gs://bucket/acct-1.csv"},
-    )
-
-
-def test_log_account_list_run_records_action():
+def test_log_account_list_run_records_action(account_list_result):
     store = _StubStore()
-    result = _build_result()
+    result = account_list_result
 
     log_account_list_run(actor="api", source="api", result=result, store=store)
 
@@ -85,9 +51,9 @@ class _FailPlaceholderStore(_StubStore):
         raise RuntimeError("boom")
 
 
-def test_log_account_list_run_aborts_when_placeholder_fails(caplog: pytest.LogCaptureFixture):
+def test_log_account_list_run_aborts_when_placeholder_fails(caplog: pytest.LogCaptureFixture, account_list_result):
     store = _FailPlaceholderStore()
-    result = _build_result()
+    result = account_list_result
 
     with caplog.at_level("ERROR"):
         log_account_list_run(actor="api", source="worker", result=result, store=store)
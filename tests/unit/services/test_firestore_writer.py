@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from typing import Any, Dict, List, Tuple
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -17,58 +18,23 @@ from i4g.store.sql_writer import (
 )
 
 
-class _FakeDocumentReference:
-    def __init__(self, path: str) -> None:
-        self.path = path
+def _reference(path: str) -> MagicMock:
+    ref = MagicMock(path=path)
+    ref.collection.side_effect = lambda name: _reference(f"{path}/{name}")
+    ref.document.side_effect = lambda doc_id: _reference(f"{path}/{doc_id}")
+    return ref
 
-    def collection(self, name: str) -> "_FakeCollectionReference":
-        return _FakeCollectionReference(f"{self.path}/{name}")
 
-
-class _FakeCollectionReference:
-    def __init__(self, path: str) -> None:
-        self._path = path
-
-    def document(self, doc_id: str) -> _FakeDocumentReference:
-        return _FakeDocumentReference(f"{self._path}/{doc_id}")
-
-
-class _FakeBatch:
-    def __init__(self, client: "_FakeFirestoreClient") -> None:
-        self._client = client
-        self._operations: List[Tuple[str, Dict[str, Any]]] = []
-
-    def set(self, doc_ref: _FakeDocumentReference, payload: Dict[str, Any]) -> None:
-        self._operations.append((doc_ref.path, payload))
-
-    def commit(self) -> None:
-        if self._client.raise_on_commit:
-            raise RuntimeError("commit-failed")
-        self._client.commits.append(list(self._operations))
-        self._operations.clear()
-
-
-class _FakeFirestoreClient:
-    def __init__(self, *, raise_on_commit: bool = False) -> None:
-        self.raise_on_commit = raise_on_commit
-        self.commits: List[List[Tuple[str, Dict[str, Any]]]] = []
-
-    def collection(self, name: str) -> _FakeCollectionReference:
-        return _FakeCollectionReference(name)
-
-    def batch(self) -> _FakeBatch:
-        return _FakeBatch(self)
-
-
-def _flatten(commits: List[List[Tuple[str, Dict[str, Any]]]]) -> List[Tuple[str, Dict[str, Any]]]:
-    flattened: List[Tuple[str, Dict[str, Any]]] = []
-    for batch in commits:
-        flattened.extend(batch)
-    return flattened
+def _client(ops: List[Tuple[str, Dict[str, Any]]]) -> MagicMock:
+    client = MagicMock()
+    client.collection.side_effect = _reference
+    client.batch.return_value.set.side_effect = lambda ref, payload: ops.append((ref.path, payload))
+    return client
 
 
 def test_firestore_writer_persists_case_documents_and_entities():
-    client = _FakeFirestoreClient()
+    ops: List[Tuple[str, Dict[str, Any]]] = []
+    client = _client(ops)
     writer = FirestoreWriter(project="demo", collection="cases", client=client, batch_size=2)
 
     case_payload = CasePayload(
@@ -100,17 +66,19 @@ def test_firestore_writer_persists_case_documents_and_entities():
     assert result.document_paths == ["cases/case-1/documents/doc-1"]
     assert result.entity_paths == ["cases/case-1/entities/ent-1"]
 
-    ops = dict(_flatten(client.commits))
-    case_doc = ops["cases/case-1"]
+    assert client.batch.return_value.commit.call_count == 2
+    docs = dict(ops)
+    case_doc = docs["cases/case-1"]
     assert case_doc["ingestion_run_id"] == "run-1"
     assert case_doc["document_ids"] == ["doc-1"]
 
-    entity_doc = ops["cases/case-1/entities/ent-1"]
+    entity_doc = docs["cases/case-1/entities/ent-1"]
     assert entity_doc["mentions"][0]["document_id"] == "doc-1"
 
 
 def test_firestore_writer_wraps_commit_errors():
-    client = _FakeFirestoreClient(raise_on_commit=True)
+    client = _client([])
+    client.batch.return_value.commit.side_effect = RuntimeError("commit-failed")
     writer = FirestoreWriter(project="demo", collection="cases", client=client)
 
     case_payload = CasePayload(
@@ -6,7 +6,7 @@ from types import SimpleNamespace
 
 from google.cloud import discoveryengine_v1beta as discoveryengine
 
-from i4g.services.vertex_writer import VertexDocumentWriter, VertexWriterError
+from i4g.services.vertex_writer import MAX_IMPORT_DOCUMENTS, VertexDocumentWriter, VertexWriterError
 
 
 class _FakeOperation:
@@ -53,6 +53,21 @@ def test_vertex_writer_upserts_document():
     assert inline_docs[0].id == "case-123"
 
 
+def test_vertex_writer_splits_large_batches_into_import_chunks():
+    client = _FakeClient()
+    writer = VertexDocumentWriter(project="proj", location="global", data_store_id="store", client=client)
+    records = [{"case_id": f"case-{index}", "text": "hello"} for index in range(MAX_IMPORT_DOCUMENTS * 2 + 5)]
+
+    results = writer.upsert_records(records)
+
+    assert [len(request.inline_source.documents) for request in client.requests] == [
+        MAX_IMPORT_DOCUMENTS,
+        MAX_IMPORT_DOCUMENTS,
+        5,
+    ]
+    assert [result.document_id for result in results] == [record["case_id"] for record in records]
+
+
 def test_vertex_writer_raises_on_failed_import(monkeypatch):
     class _FailingClient(_FakeClient):
         def import_documents(self, request):  # type: ignore[override]
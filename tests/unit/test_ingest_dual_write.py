@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import threading
+
+import pytest
 import sqlalchemy as sa
 
 from i4g.services.firestore_writer import FirestoreWriteResult
 from i4g.services.ingest_payloads import prepare_ingest_payload
 from i4g.settings.config import get_settings, reload_settings
 from i4g.store import sql as sql_schema
-from i4g.store.ingest import IngestPipeline
+from i4g.store.ingest import IngestPipeline, PartialIngestError, flatten_entities
 from i4g.store.structured import StructuredStore
 
 
@@ -169,3 +172,192 @@ def test_ingest_pipeline_persists_network_entities(tmp_path, monkeypatch):
         }
     finally:
         get_settings.cache_clear()
+
+
+class _BulkFirestoreWriter(_DummyFirestoreWriter):
+    def __init__(self, *, fail_bulk: bool = False, fail_case_text: str | None = None) -> None:
+        super().__init__()
+        self.bulk_calls: list[int] = []
+        self._fail_bulk = fail_bulk
+        self._fail_case_text = fail_case_text
+
+    def persist_case_bundles(self, items, *, ingestion_run_id=None):
+        self.bulk_calls.append(len(items))
+        if self._fail_bulk:
+            raise RuntimeError("batch rejected")
+        return [FirestoreWriteResult(case_path=f"cases/{sql_result.case_id}") for _, sql_result in items]
+
+    def persist_case_bundle(self, bundle, sql_result, *, ingestion_run_id=None):
+        if bundle.case.text == self._fail_case_text:
+            raise RuntimeError("bad case")
+        return super().persist_case_bundle(bundle, sql_result, ingestion_run_id=ingestion_run_id)
+
+
+def _bulk_pipeline(tmp_path, monkeypatch, firestore_writer):
+    db_path = tmp_path / "dual_write_bulk.db"
+    monkeypatch.setenv("I4G_STORAGE__SQLITE_PATH", str(db_path))
+    monkeypatch.setenv("I4G_INGESTION__ENABLE_SQL", "true")
+    monkeypatch.setenv("I4G_INGESTION__DEFAULT_DATASET", "bulk_demo")
+    reload_settings(env="local")
+
+    engine = sa.create_engine(f"sqlite:///{db_path}", future=True)
+    sql_schema.METADATA.create_all(engine)
+    engine.dispose()
+
+    pipeline = IngestPipeline(
+        structured_store=StructuredStore(str(db_path)),
+        vector_store=None,
+        enable_vector=False,
+        enable_firestore=True,
+        firestore_writer=firestore_writer,
+        default_dataset="bulk_demo",
+    )
+    return pipeline, db_path
+
+
+def test_flatten_entities_accepts_dict_and_flat_entries():
+    entities = {"people": [{"value": "Anna"}, "John"], "notes": "not-a-list"}
+
+    flat = flatten_entities(entities)
+
+    assert flat == {"people": ["Anna", "John"]}
+    assert flatten_entities(flat) == flat
+
+
+def _bulk_payloads(count: int) -> list[dict]:
+    return [
+        {
+            "case_id": f"bulk-{index}",
+            "text": f"Wallet verification fee #{index}",
+            "fraud_type": "crypto_investment",
+            "fraud_confidence": 0.9,
+            "entities": {"organizations": [{"value": f"Org{index}"}]},
+        }
+        for index in range(count)
+    ]
+
+
+def test_ingest_classified_cases_writes_each_backend_once(tmp_path, monkeypatch):
+    """The bulk API persists every payload with one Firestore batch and one SQL transaction."""
+
+    writer = _BulkFirestoreWriter()
+    try:
+        pipeline, db_path = _bulk_pipeline(tmp_path, monkeypatch, writer)
+        results = pipeline.ingest_classified_cases(_bulk_payloads(3), ingestion_run_id="run-bulk")
+
+        assert [result.case_id for result in results] == ["bulk-0", "bulk-1", "bulk-2"]
+        assert all(result.sql_result is not None and result.firestore_written for result in results)
+        assert writer.bulk_calls == [3]
+        assert writer.calls == 0
+        assert pipeline.structured_store.get_by_id("bulk-2") is not None
+
+        with sa.create_engine(f"sqlite:///{db_path}", future=True).connect() as conn:
+            cases = conn.execute(sa.select(sql_schema.cases.c.case_id)).fetchall()
+        assert len(cases) == 3
+    finally:
+        get_settings.cache_clear()
+
+
+def test_ingest_classified_cases_isolates_failures_after_bulk_error(tmp_path, monkeypatch):
+    """A rejected Firestore batch is replayed per case so only the bad case is marked failed."""
+
+    payloads = _bulk_payloads(3)
+    writer = _BulkFirestoreWriter(fail_bulk=True, fail_case_text=payloads[1]["text"])
+    try:
+        pipeline, _ = _bulk_pipeline(tmp_path, monkeypatch, writer)
+        results = pipeline.ingest_classified_cases(payloads)
+
+        assert [result.firestore_written for result in results] == [True, False, True]
+        assert all(result.firestore_attempted for result in results)
+        assert results[1].firestore_error == "bad case"
+        assert writer.bulk_calls == [3]
+        assert writer.calls == 2
+    finally:
+        get_settings.cache_clear()
+
+
+def test_ingest_classified_cases_flags_failures_after_structured_write(tmp_path, monkeypatch):
+    """Errors raised once structured rows are committed surface as ``PartialIngestError``."""
+
+    try:
+        pipeline, _ = _bulk_pipeline(tmp_path, monkeypatch, _BulkFirestoreWriter())
+
+        def _explode(*_args, **_kwargs):
+            raise RuntimeError("sql session lost")
+
+        monkeypatch.setattr(pipeline, "_write_sql_cases", _explode)
+        with pytest.raises(PartialIngestError):
+            pipeline.ingest_classified_cases(_bulk_payloads(2))
+
+        assert pipeline.structured_store.get_by_id("bulk-1") is not None
+        pipeline.close()
+        assert pipeline._fanout_executor is None
+    finally:
+        get_settings.cache_clear()
+
+
+def test_ingest_classified_cases_reports_retryable_writes_after_firestore_error(tmp_path, monkeypatch):
+    """A Firestore error after the SQL write reports every case as a failed Firestore attempt."""
+
+    try:
+        pipeline, _ = _bulk_pipeline(tmp_path, monkeypatch, _BulkFirestoreWriter())
+
+        def _explode(*_args, **_kwargs):
+            raise RuntimeError("firestore channel closed")
+
+        monkeypatch.setattr(pipeline, "_write_firestore_cases", _explode)
+        with pytest.raises(PartialIngestError) as excinfo:
+            pipeline.ingest_classified_cases(_bulk_payloads(2))
+
+        results = excinfo.value.results
+        assert [result.case_id for result in results] == ["bulk-0", "bulk-1"]
+        assert all(result.sql_result is not None for result in results)
+        assert all(result.firestore_attempted and not result.firestore_written for result in results)
+        assert {result.firestore_error for result in results} == {"firestore channel closed"}
+        assert not any(result.vertex_attempted for result in results)
+        pipeline.close()
+    finally:
+        get_settings.cache_clear()
+
+
+def test_ingest_many_chunks_payloads_into_bulk_batches(tmp_path, monkeypatch):
+    """``ingest_many`` feeds ``ingest_classified_cases`` fixed-size chunks and keeps input order."""
+
+    writer = _BulkFirestoreWriter()
+    try:
+        pipeline, _ = _bulk_pipeline(tmp_path, monkeypatch, writer)
+        results = pipeline.ingest_many(iter(_bulk_payloads(5)), batch_size=2)
+
+        assert [result.case_id for result in results] == [f"bulk-{index}" for index in range(5)]
+        assert writer.bulk_calls == [2, 2, 1]
+    finally:
+        get_settings.cache_clear()
+
+
+class _ThreadRecordingVertexWriter:
+    def __init__(self) -> None:
+        self.threads: list[str] = []
+        self.batches: list[int] = []
+
+    def upsert_records(self, records):
+        self.threads.append(threading.current_thread().name)
+        self.batches.append(len(records))
+        return []
+
+
+def test_ingest_classified_cases_overlaps_vertex_import(tmp_path, monkeypatch):
+    """The Vertex import runs off the calling thread while SQL/Firestore writes proceed."""
+
+    vertex_writer = _ThreadRecordingVertexWriter()
+    try:
+        pipeline, _ = _bulk_pipeline(tmp_path, monkeypatch, _BulkFirestoreWriter())
+        pipeline._vertex_enabled = True
+        pipeline.vertex_writer = vertex_writer
+
+        results = pipeline.ingest_classified_cases(_bulk_payloads(2))
+
+        assert all(result.vertex_written and result.firestore_written for result in results)
+        assert vertex_writer.batches == [2]
+        assert vertex_writer.threads[0].startswith("ingest-fanout")
+    finally:
+        get_settings.cache_clear()
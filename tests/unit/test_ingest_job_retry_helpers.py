@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import io
+import json
+import logging
+from datetime import date
 from typing import Any, Dict
 from unittest.mock import Mock
 
+import pytest
+
+from i4g.store.ingest import IngestResult
 from i4g.store.sql_writer import SqlWriterResult
 from i4g.worker.jobs import ingest
 
@@ -27,6 +34,14 @@ def test_clone_payload_round_trips_without_shared_state() -> None:
     assert payload["metadata"]["source"] == "unit"
 
 
+def test_clone_payload_serialises_non_json_values() -> None:
+    """Non-JSON values should fall back to the string-coercing serialization path."""
+
+    payload: Dict[str, Any] = {"case_id": "case-2", "when": date(2024, 1, 2), "pair": ("a", "b")}
+    clone = ingest._clone_payload(payload)
+    assert clone == {"case_id": "case-2", "when": "2024-01-02", "pair": ["a", "b"]}
+
+
 def test_clone_payload_falls_back_when_serialization_fails() -> None:
     """Verify we still return a dict when JSON serialization raises."""
 
@@ -36,12 +51,10 @@ def test_clone_payload_falls_back_when_serialization_fails() -> None:
     assert clone is not payload
 
 
-def test_maybe_enqueue_retry_skips_when_not_attempted() -> None:
+def test_build_retry_spec_skips_when_not_attempted() -> None:
     """Retries should only be scheduled when a backend attempt actually ran and failed."""
 
-    store = Mock()
-    result = ingest._maybe_enqueue_retry(
-        store,
+    spec = ingest._build_retry_spec(
         backend="firestore",
         attempted=False,
         succeeded=False,
@@ -49,18 +62,18 @@ def test_maybe_enqueue_retry_skips_when_not_attempted() -> None:
         retry_delay=30,
         max_retries=3,
     )
-    assert result == 0
-    store.enqueue.assert_not_called()
+    assert spec is None
 
 
-def test_maybe_enqueue_retry_enqueues_failed_attempt() -> None:
-    """Failed backend writes should enqueue a cloned payload for retry processing."""
+def test_build_retry_spec_clones_failed_attempt_for_flush() -> None:
+    """Failed backend writes should produce a cloned payload that is flushed for retry processing."""
 
+    written: list = []
     store = Mock()
+    store.enqueue_many.side_effect = lambda items: written.extend(items)
     payload = {"case_id": "case-retry", "nested": {"value": 1}}
     sql_result = SqlWriterResult(case_id="case-retry", document_ids=["doc-1"], entity_ids=[], indicator_ids=[])
-    result = ingest._maybe_enqueue_retry(
-        store,
+    spec = ingest._build_retry_spec(
         backend="vertex",
         attempted=True,
         succeeded=False,
@@ -70,13 +83,11 @@ def test_maybe_enqueue_retry_enqueues_failed_attempt() -> None:
         error="boom",
         sql_result=sql_result,
     )
-    assert result == 1
-    store.enqueue.assert_called_once()
-    kwargs = store.enqueue.call_args.kwargs
-    assert kwargs["case_id"] == "case-retry"
-    assert kwargs["backend"] == "vertex"
-    assert kwargs["delay_seconds"] == 45
-    queue_payload = kwargs["payload"]
+    assert spec is not None
+    assert spec.case_id == "case-retry"
+    assert spec.backend == "vertex"
+    assert spec.delay_seconds == 45
+    queue_payload = spec.payload
     assert queue_payload["record"] == payload
     assert queue_payload["record"] is not payload
     queue_payload["record"]["nested"]["value"] = 5
@@ -89,38 +100,228 @@ def test_maybe_enqueue_retry_enqueues_failed_attempt() -> None:
         "indicator_ids": [],
     }
 
+    assert ingest._flush_retries(store, [spec], max_retries=5) == 1
+    assert written == [spec]
 
-def test_maybe_enqueue_retry_handles_enqueue_failures() -> None:
-    """Retry scheduling should swallow enqueue errors and continue the job loop."""
 
-    store = Mock()
-    store.enqueue.side_effect = RuntimeError("db down")
-    result = ingest._maybe_enqueue_retry(
-        store,
-        backend="vertex",
+def test_build_retry_spec_respects_max_retries() -> None:
+    """Retries should be skipped entirely when max_retries is zero or negative."""
+
+    spec = ingest._build_retry_spec(
+        backend="firestore",
         attempted=True,
         succeeded=False,
-        payload={"case_id": "case-error"},
-        retry_delay=15,
-        max_retries=2,
+        payload={"case_id": "case-skip"},
+        retry_delay=10,
+        max_retries=0,
     )
-    assert result == 0
-    store.enqueue.assert_called_once()
+    assert spec is None
 
 
-def test_maybe_enqueue_retry_respects_max_retries() -> None:
-    """Retries should be skipped entirely when max_retries is zero or negative."""
+def test_flush_retries_writes_pending_batch_once() -> None:
+    """Buffered retry specs should be written with a single enqueue_many call."""
 
+    written: list = []
     store = Mock()
-    payload = {"case_id": "case-skip"}
-    result = ingest._maybe_enqueue_retry(
-        store,
-        backend="firestore",
+    store.enqueue_many.side_effect = lambda items: written.extend(items)
+    pending = [
+        ingest._build_retry_spec(
+            backend=backend,
+            attempted=True,
+            succeeded=False,
+            payload={"case_id": "case-batch"},
+            retry_delay=5,
+            max_retries=3,
+        )
+        for backend in ("firestore", "vertex")
+    ]
+    assert ingest._flush_retries(store, pending, max_retries=3) == 2
+    store.enqueue_many.assert_called_once()
+    assert [spec.backend for spec in written] == ["firestore", "vertex"]
+    assert pending == []
+
+    store.enqueue_many.side_effect = RuntimeError("db down")
+    pending.append(
+        ingest._build_retry_spec(
+            backend="vertex", attempted=True, succeeded=False, payload={}, retry_delay=5, max_retries=3
+        )
+    )
+    assert ingest._flush_retries(store, pending, max_retries=3) == 0
+    assert pending == []
+
+
+def test_prefetch_payloads_yields_records_then_reader_error(tmp_path) -> None:
+    """Records before a malformed line are ingested before the reader error surfaces."""
+
+    dataset = tmp_path / "cases.jsonl"
+    dataset.write_text('{"case_id": "case-1", "text": "one"}\n{"case_id": "case-2", "text": "two"}\n{broken\n')
+
+    records = ingest._prefetch_payloads(dataset, dataset_name="unit", maxsize=1)
+    first, _ = next(records)
+    second, _ = next(records)
+    assert (first["case_id"], second["case_id"]) == ("case-1", "case-2")
+    with pytest.raises(ValueError, match="line 3"):
+        next(records)
+
+
+def test_build_retry_spec_can_skip_clone() -> None:
+    """The batched ingestion path hands the payload to the store without a defensive copy."""
+
+    payload = {"case_id": "case-shared", "text": "hello"}
+    spec = ingest._build_retry_spec(
+        backend="vertex",
         attempted=True,
         succeeded=False,
         payload=payload,
-        retry_delay=10,
-        max_retries=0,
+        retry_delay=5,
+        max_retries=3,
+        deep_clone=False,
     )
-    assert result == 0
-    store.enqueue.assert_not_called()
+    assert spec is not None
+    assert spec.payload["record"] is payload
+
+
+def test_iter_lines_matches_split_across_chunk_boundaries() -> None:
+    """The chunked fallback reader must agree with a plain split regardless of chunk size."""
+
+    data = b'{"a": 1}\n\n{"b": "two"}\n{"c": 3}'
+    for chunk_size in (1, 3, 8, 1024):
+        assert list(ingest._iter_lines(io.BytesIO(data), chunk_size=chunk_size)) == data.split(b"\n")
+
+
+def test_prepare_worker_count_stays_serial_for_small_inputs(tmp_path, monkeypatch) -> None:
+    """Parallel payload preparation only kicks in for large files unless explicitly overridden."""
+
+    dataset = tmp_path / "small.jsonl"
+    dataset.write_text('{"case_id": "case-1"}\n')
+    monkeypatch.delenv("I4G_INGEST__PREPARE_WORKERS", raising=False)
+    assert ingest._prepare_worker_count(dataset, dry_run=False, batch_limit=None) == 0
+
+    monkeypatch.setenv("I4G_INGEST__PREPARE_WORKERS", "3")
+    assert ingest._prepare_worker_count(dataset, dry_run=False, batch_limit=None) == 3
+
+
+def test_json_log_formatter_promotes_extra_fields() -> None:
+    """Per-record fields passed via ``extra`` should become top-level JSON keys."""
+
+    record = logging.LogRecord("i4g.test", logging.INFO, __file__, 1, "Ingested %s", ("record",), None)
+    record.case_id = "case-log"
+    entry = json.loads(ingest._JsonLogFormatter().format(record))
+    assert entry["severity"] == "INFO"
+    assert entry["message"] == "Ingested record"
+    assert entry["case_id"] == "case-log"
+    assert set(entry["timestamp"]) == {"seconds", "nanos"}
+
+
+def test_ingest_batch_falls_back_to_single_records() -> None:
+    """When the bulk call raises, each payload is retried alone and its error is returned in place."""
+
+    class _Pipeline:
+        def ingest_classified_cases(self, payloads, *, ingestion_run_id=None):
+            raise RuntimeError("bulk failed")
+
+        def ingest_classified_case(self, payload, *, ingestion_run_id=None):
+            if payload["case_id"] == "bad":
+                raise ValueError("bad payload")
+            return payload["case_id"]
+
+    outcomes = ingest._ingest_batch(_Pipeline(), [{"case_id": "a"}, {"case_id": "bad"}, {"case_id": "c"}], run_id="r")
+
+    assert outcomes[0] == "a" and outcomes[2] == "c"
+    assert isinstance(outcomes[1], ValueError)
+
+
+def test_ingest_batch_pins_case_ids_and_skips_fallback_after_partial_write() -> None:
+    """Payloads get stable case ids before the bulk call, and a partial write is not replayed."""
+
+    class _Pipeline:
+        seen_case_ids: list[str] = []
+
+        def ingest_classified_cases(self, payloads, *, ingestion_run_id=None):
+            self.seen_case_ids = [payload["case_id"] for payload in payloads]
+            raise ingest.PartialIngestError(
+                "sql failed after structured write",
+                results=[
+                    IngestResult(case_id=payload["case_id"], vertex_attempted=True, vertex_error="sql failed")
+                    for payload in payloads
+                ],
+            )
+
+        def ingest_classified_case(self, payload, *, ingestion_run_id=None):
+            raise AssertionError("partial bulk writes must not be replayed")
+
+    payloads = [{"case_id": "a"}, {"text": "no id yet"}]
+    pipeline = _Pipeline()
+    outcomes = ingest._ingest_batch(pipeline, payloads, run_id="r")
+
+    assert [outcome.case_id for outcome in outcomes] == ["a", payloads[1]["case_id"]]
+    assert all(outcome.vertex_attempted and not outcome.vertex_written for outcome in outcomes)
+    assert payloads[0]["case_id"] == "a"
+    assert payloads[1]["case_id"]
+    assert pipeline.seen_case_ids == ["a", payloads[1]["case_id"]]
+
+
+def test_main_queues_backend_retries_for_partially_written_batch(tmp_path, monkeypatch) -> None:
+    """A batch that fails after its structured write still queues a retry per failed backend write."""
+
+    dataset = tmp_path / "cases.jsonl"
+    dataset.write_text(
+        "\n".join(json.dumps({"case_id": f"case-{index}", "text": f"Scam text {index}"}) for index in range(2)),
+        encoding="utf-8",
+    )
+    sql_result = SqlWriterResult(case_id="sql", document_ids=["doc"], entity_ids=[], indicator_ids=[])
+
+    class _Pipeline:
+        def __init__(self, **_kwargs) -> None:
+            self.closed = False
+
+        def ingest_classified_cases(self, payloads, *, ingestion_run_id=None):
+            raise ingest.PartialIngestError(
+                "firestore failed after structured write",
+                results=[
+                    IngestResult(
+                        case_id=payload["case_id"],
+                        sql_result=sql_result,
+                        firestore_attempted=True,
+                        firestore_error="firestore down",
+                        vertex_attempted=True,
+                        vertex_error="firestore down",
+                    )
+                    for payload in payloads
+                ],
+            )
+
+        def close(self) -> None:
+            self.closed = True
+
+    written: list = []
+    retry_store = Mock()
+    retry_store.enqueue_many.side_effect = lambda items: written.extend(items)
+    monkeypatch.setenv("I4G_INGEST__JSONL_PATH", str(dataset))
+    monkeypatch.setenv("I4G_INGEST__DRY_RUN", "false")
+    monkeypatch.setenv("I4G_INGEST__ENABLE_VECTOR", "false")
+    monkeypatch.setattr(ingest, "configure_logging", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(ingest, "build_structured_store", Mock())
+    monkeypatch.setattr(ingest, "build_ingestion_run_tracker", Mock(side_effect=RuntimeError("no db")))
+    monkeypatch.setattr(ingest, "build_ingestion_retry_store", lambda: retry_store)
+    monkeypatch.setattr(ingest, "IngestPipeline", _Pipeline)
+
+    assert ingest.main() == 0
+
+    assert sorted((spec.case_id, spec.backend) for spec in written) == [
+        ("case-0", "firestore"),
+        ("case-0", "vertex"),
+        ("case-1", "firestore"),
+        ("case-1", "vertex"),
+    ]
+    firestore_spec = next(spec for spec in written if spec.backend == "firestore")
+    assert firestore_spec.payload["context"]["sql_result"]["document_ids"] == ["doc"]
+
+
+def test_ingest_batch_size_reads_env(monkeypatch) -> None:
+    """The micro-batch size honours the env override and ignores invalid values."""
+
+    monkeypatch.setenv("I4G_INGEST__BATCH_SIZE", "25")
+    assert ingest._ingest_batch_size() == 25
+    monkeypatch.setenv("I4G_INGEST__BATCH_SIZE", "nope")
+    assert ingest._ingest_batch_size() == ingest._INGEST_BATCH_SIZE
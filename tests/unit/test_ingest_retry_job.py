@@ -67,8 +67,8 @@ def test_main_processes_firestore_retry_success(monkeypatch):
         def __init__(self):
             self.deleted = []
 
-        def fetch_ready(self, limit):
-            return [item]
+        def fetch_ready(self, limit, exclude_ids=()):
+            return [] if item.retry_id in exclude_ids else [item]
 
         def delete(self, retry_id):
             self.deleted.append(retry_id)
@@ -105,8 +105,8 @@ def test_main_reschedules_and_drops_on_failure(monkeypatch):
             self.deleted = []
             self.scheduled = []
 
-        def fetch_ready(self, limit):
-            return [item]
+        def fetch_ready(self, limit, exclude_ids=()):
+            return [] if item.retry_id in exclude_ids else [item]
 
         def delete(self, retry_id):
             self.deleted.append(retry_id)
@@ -141,8 +141,8 @@ def test_main_drops_malformed_payload(monkeypatch):
             self.deleted = []
             self.scheduled = []
 
-        def fetch_ready(self, limit):
-            return [item]
+        def fetch_ready(self, limit, exclude_ids=()):
+            return [] if item.retry_id in exclude_ids else [item]
 
         def delete(self, retry_id):
             self.deleted.append(retry_id)
@@ -165,3 +165,98 @@ def test_main_drops_malformed_payload(monkeypatch):
     firestore_writer.persist_case_bundle.assert_not_called()
     assert store.deleted == [item.retry_id]
     assert store.scheduled == []
+
+
+def test_main_replays_items_concurrently_and_tallies_outcomes(monkeypatch):
+    items = [
+        RetryItem(
+            retry_id=f"retry-{idx}",
+            case_id=f"case-{idx}",
+            backend="vertex",
+            payload={"record": {"case_id": f"case-{idx}", "text": "retry me"}},
+            attempt_count=0,
+            next_attempt_at=datetime.now(timezone.utc),
+        )
+        for idx in range(5)
+    ]
+
+    class StubStore:
+        def __init__(self):
+            self.deleted = []
+            self.scheduled = []
+
+        def fetch_ready(self, limit, exclude_ids=()):
+            return [entry for entry in items if entry.retry_id not in exclude_ids]
+
+        def delete(self, retry_id):
+            self.deleted.append(retry_id)
+
+        def schedule_retry(self, retry_id, delay_seconds):
+            self.scheduled.append(retry_id)
+            return 1
+
+    def _upsert(record):
+        if record["case_id"] == "case-3":
+            raise RuntimeError("Vertex down")
+
+    store = StubStore()
+    vertex_writer = Mock()
+    vertex_writer.upsert_record.side_effect = _upsert
+    build_vertex_writer = Mock(return_value=vertex_writer)
+
+    monkeypatch.setenv("I4G_INGEST_RETRY__CONCURRENCY", "3")
+    monkeypatch.setattr(ingest_retry, "build_ingestion_retry_store", lambda: store)
+    monkeypatch.setattr(ingest_retry, "build_vertex_writer", build_vertex_writer)
+    monkeypatch.setattr(ingest_retry, "build_firestore_writer", Mock(side_effect=AssertionError("unused backend")))
+    monkeypatch.setattr(ingest_retry, "get_settings", lambda: _settings(max_retries=3))
+
+    exit_code = ingest_retry.main()
+
+    assert exit_code == 1
+    build_vertex_writer.assert_called_once()
+    assert vertex_writer.upsert_record.call_count == 5
+    assert sorted(store.deleted) == ["retry-0", "retry-1", "retry-2", "retry-4"]
+    assert store.scheduled == ["retry-3"]
+
+
+def test_main_pages_through_batches_with_prefetch(monkeypatch):
+    items = [
+        RetryItem(
+            retry_id=f"retry-{idx}",
+            case_id=f"case-{idx}",
+            backend="vertex",
+            payload={"record": {"case_id": f"case-{idx}", "text": "retry me"}},
+            attempt_count=0,
+            next_attempt_at=datetime.now(timezone.utc),
+        )
+        for idx in range(5)
+    ]
+
+    class StubStore:
+        def __init__(self):
+            self.deleted = []
+            self.fetches = []
+
+        def fetch_ready(self, limit, exclude_ids=()):
+            self.fetches.append(sorted(exclude_ids))
+            pending = [entry for entry in items if entry.retry_id not in self.deleted]
+            return [entry for entry in pending if entry.retry_id not in exclude_ids][:limit]
+
+        def delete(self, retry_id):
+            self.deleted.append(retry_id)
+
+    store = StubStore()
+    vertex_writer = Mock()
+
+    monkeypatch.setenv("I4G_INGEST_RETRY__BATCH_LIMIT", "2")
+    monkeypatch.setattr(ingest_retry, "build_ingestion_retry_store", lambda: store)
+    monkeypatch.setattr(ingest_retry, "build_vertex_writer", lambda: vertex_writer)
+    monkeypatch.setattr(ingest_retry, "build_firestore_writer", Mock())
+    monkeypatch.setattr(ingest_retry, "get_settings", lambda: _settings())
+
+    exit_code = ingest_retry.main()
+
+    assert exit_code == 0
+    assert vertex_writer.upsert_record.call_count == 5
+    assert sorted(store.deleted) == [item.retry_id for item in items]
+    assert store.fetches[1] == ["retry-0", "retry-1"]
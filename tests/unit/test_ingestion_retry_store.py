@@ -6,7 +6,7 @@ import sqlalchemy as sa
 from sqlalchemy.orm import sessionmaker
 
 from i4g.store import sql as sql_schema
-from i4g.store.ingestion_retry_store import IngestionRetryStore
+from i4g.store.ingestion_retry_store import IngestionRetryStore, RetryEnqueueSpec
 
 
 def _build_store(tmp_path):
@@ -33,6 +33,7 @@ def test_enqueue_updates_existing_and_fetch_ready(tmp_path):
 
         ready = store.fetch_ready(limit=10)
         assert ready[0].payload["n"] == 2
+        assert store.fetch_ready(limit=10, exclude_ids=[retry_id]) == []
     finally:
         engine.dispose()
 
@@ -48,3 +49,39 @@ def test_schedule_retry_increments_attempt(tmp_path):
         assert ready == []  # next_attempt moved into the future
     finally:
         engine.dispose()
+
+
+def test_enqueue_many_inserts_and_updates_in_one_batch(tmp_path):
+    store, engine = _build_store(tmp_path)
+    try:
+        existing_id = store.enqueue(case_id="case-1", backend="vertex", payload={"n": 1})
+
+        retry_ids = store.enqueue_many(
+            [
+                RetryEnqueueSpec(case_id="case-1", backend="vertex", payload={"n": 2}),
+                RetryEnqueueSpec(case_id="case-1", backend="firestore", payload={"n": 3}),
+                RetryEnqueueSpec(case_id="case-3", backend="vertex", payload={"n": 4}),
+                RetryEnqueueSpec(case_id="case-3", backend="vertex", payload={"n": 5}),
+            ]
+        )
+        assert len(retry_ids) == 3
+        assert retry_ids[0] == existing_id
+
+        ready = {(item.case_id, item.backend): item.payload["n"] for item in store.fetch_ready(limit=10)}
+        assert ready == {("case-1", "vertex"): 2, ("case-1", "firestore"): 3, ("case-3", "vertex"): 5}
+        assert store.enqueue_many([]) == []
+    finally:
+        engine.dispose()
+
+
+def test_enqueue_many_fallback_without_native_upsert(tmp_path, monkeypatch):
+    store, engine = _build_store(tmp_path)
+    try:
+        monkeypatch.setattr(IngestionRetryStore, "_upsert", staticmethod(lambda session, rows: None))
+        first = store.enqueue(case_id="case-1", backend="vertex", payload={"n": 1})
+        assert store.enqueue(case_id="case-1", backend="vertex", payload={"n": 2}) == first
+
+        ready = store.fetch_ready(limit=10)
+        assert [(item.retry_id, item.payload["n"]) for item in ready] == [(first, 2)]
+    finally:
+        engine.dispose()
@@ -38,3 +38,33 @@ def test_tracker_start_record_complete(tmp_path):
         assert row.completed_at is not None
 
     engine.dispose()
+
+
+def test_tracker_record_cases_bulk_aggregates_counters(tmp_path):
+    db_path = tmp_path / "runs.db"
+    engine = sa.create_engine(f"sqlite:///{db_path}", future=True)
+    sql_schema.METADATA.create_all(engine)
+    factory = sessionmaker(bind=engine, future=True)
+
+    tracker = IngestionRunTracker(session_factory=factory)
+    run_id = tracker.start_run(dataset="bulk", source_bundle=None, vector_enabled=False)
+
+    results = [
+        SqlWriterResult(case_id="case-1", document_ids=[], entity_ids=["ent-1", "ent-2"], indicator_ids=["ind-1"]),
+        None,
+        SqlWriterResult(case_id="case-3", document_ids=[], entity_ids=["ent-3"], indicator_ids=[]),
+    ]
+    tracker.record_cases_bulk(run_id, results, firestore_writes=2, vertex_writes=1)
+
+    with engine.connect() as conn:
+        row = conn.execute(
+            sa.select(sql_schema.ingestion_runs).where(sql_schema.ingestion_runs.c.run_id == run_id)
+        ).one()
+        assert row.case_count == 3
+        assert row.entity_count == 3
+        assert row.indicator_count == 1
+        assert row.sql_writes == 2
+        assert row.firestore_writes == 2
+        assert row.vertex_writes == 1
+
+    engine.dispose()
@@ -0,0 +1,51 @@
+"""Unit tests for the batch report worker job."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import Mock
+
+from i4g.worker.jobs import report
+
+
+def test_main_generates_reports_concurrently(monkeypatch):
+    """Cases are dispatched to the thread pool and the tally covers every review id."""
+
+    store = Mock()
+    monkeypatch.setenv("I4G_REPORT__REVIEW_IDS", "r1,r2,r3")
+    monkeypatch.setenv("I4G_REPORT__CONCURRENCY", "3")
+    monkeypatch.setattr(report, "build_review_store", lambda: store)
+
+    barrier = threading.Barrier(3, timeout=5)
+    calls = []
+
+    def fake_generate(review_id, store=None, action_log=None):
+        calls.append((review_id, store))
+        action_log.append({"review_id": review_id, "actor": "worker", "action": "report_generated"})
+        # Every worker must be in flight at once for the barrier to release.
+        barrier.wait()
+        return "error:boom" if review_id == "r2" else f"/tmp/{review_id}.md"
+
+    monkeypatch.setattr(report, "generate_report_for_case", fake_generate)
+
+    assert report.main() == 1
+    assert sorted(review_id for review_id, _ in calls) == ["r1", "r2", "r3"]
+    assert all(passed is store for _, passed in calls)
+    # Audit entries from every worker are flushed in a single bulk write.
+    store.log_actions_bulk.assert_called_once()
+    (entries,) = store.log_actions_bulk.call_args.args
+    assert sorted(entry["review_id"] for entry in entries) == ["r1", "r2", "r3"]
+
+
+def test_main_dry_run_skips_generation(monkeypatch):
+    monkeypatch.setenv("I4G_REPORT__REVIEW_IDS", "r1,r2")
+    monkeypatch.setenv("I4G_REPORT__DRY_RUN", "true")
+    build_store = Mock()
+    monkeypatch.setattr(report, "build_review_store", build_store)
+    generate = Mock()
+    monkeypatch.setattr(report, "generate_report_for_case", generate)
+
+    assert report.main() == 0
+    generate.assert_not_called()
+    # Explicit IDs in a dry run need neither the queue nor the reports, so no store is built.
+    build_store.assert_not_called()
@@ -7,6 +7,7 @@ action logging behaviors.
 """
 
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 
 from i4g.store.review_store import ReviewStore
 
@@ -76,6 +77,52 @@ def test_action_logging_and_retrieval(tmp_path):
     assert "Claimed for review" in actions[0]["payload"]
 
 
+def test_log_actions_bulk_inserts_every_entry(tmp_path):
+    """Bulk logging writes all entries in one call and returns their IDs in order."""
+    store = ReviewStore(str(tmp_path / "bulk_actions.db"))
+    review_id = store.enqueue_case("CASE_BULK")
+
+    action_ids = store.log_actions_bulk(
+        [
+            {"review_id": review_id, "actor": "worker", "action": "report_generated", "payload": {"n": 1}},
+            {"review_id": review_id, "actor": "worker", "action": "error", "created_at": "2020-01-01T00:00:00+00:00"},
+        ]
+    )
+
+    assert len(action_ids) == 2
+    actions = store.get_actions(review_id)
+    assert {action["action_id"] for action in actions} == set(action_ids)
+    assert {action["action"] for action in actions} == {"report_generated", "error"}
+    assert store.log_actions_bulk([]) == []
+
+
+def test_bulk_commits_once_and_rolls_back_on_error(tmp_path):
+    """Calls inside ``bulk()`` share one transaction that commits or rolls back as a unit."""
+    db_path = tmp_path / "bulk_test.db"
+    store = ReviewStore(str(db_path))
+
+    with store.bulk():
+        review_id = store.enqueue_case("CASE_BULK_OK")
+        store.update_status(review_id, status="accepted")
+        with store.bulk():
+            store.log_action(review_id, actor="seed", action="status_set")
+        # Nothing is visible to other connections until the outermost block exits.
+        with sqlite3.connect(db_path) as other:
+            assert other.execute("SELECT COUNT(*) FROM review_queue").fetchone()[0] == 0
+
+    assert store.get_review(review_id)["status"] == "accepted"
+    assert len(store.get_actions(review_id)) == 1
+
+    try:
+        with store.bulk():
+            store.enqueue_case("CASE_BULK_FAIL")
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    assert [item["case_id"] for item in store.get_queue(status="queued")] == []
+
+
 def test_queue_and_actions_integration(tmp_path):
     """Ensure actions correspond to existing queue entries."""
     db_path = tmp_path / "integration_test.db"
@@ -136,3 +183,15 @@ def test_bulk_update_tags_replace(tmp_path):
 
     record = store.get_saved_search(sid)
     assert record["tags"] == ["primary"]
+
+
+def test_store_is_shared_safely_across_threads(tmp_path):
+    """Concurrent writers on one store reuse its connection without losing rows."""
+    store = ReviewStore(str(tmp_path / "threads.db"))
+    review_id = store.enqueue_case("case-threads")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: store.log_action(review_id, actor="worker", action=f"a{i}"), range(40)))
+
+    assert len(store.get_actions(review_id)) == 40
+    store.close()
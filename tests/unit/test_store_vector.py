@@ -117,6 +117,25 @@ def test_faiss_backend_add_and_query(tmp_path, mock_embeddings, mock_faiss):
     mock_faiss.from_texts.return_value.similarity_search_with_score.assert_called_once()
 
 
+def test_faiss_deferred_persist_saves_index_once(tmp_path, mock_embeddings, mock_faiss):
+    """Writes inside ``deferred_persist`` skip the per-call save and flush once on exit."""
+    store = VectorStore(
+        persist_dir=str(tmp_path / "faiss"),
+        embedding_model="fake-model",
+        backend="faiss",
+    )
+    faiss_store = mock_faiss.from_texts.return_value
+
+    with store.deferred_persist():
+        store.add_texts(["first"], ids=["case-1"])
+        store.add_texts(["second"], ids=["case-2"])
+        faiss_store.save_local.assert_not_called()
+
+    faiss_store.save_local.assert_called_once()
+    store.add_texts(["third"], ids=["case-3"])
+    assert faiss_store.save_local.call_count == 2
+
+
 # ----------------------------------------------------------------------
 # IngestPipeline tests
 # ----------------------------------------------------------------------
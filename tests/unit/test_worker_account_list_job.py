@@ -9,6 +9,8 @@ from unittest.mock import MagicMock
 from i4g.services.account_list import AccountListRequest, AccountListResult
 from i4g.worker.jobs import account_list as account_job
 
+FIXED_NOW = datetime(2025, 11, 28, tzinfo=timezone.utc)
+
 
 def _settings(default_formats: list[str] | None = None, max_top_k: int = 250, env: str = "local") -> SimpleNamespace:
     return SimpleNamespace(
@@ -55,10 +57,9 @@ def test_build_request_env_overrides(monkeypatch):
 
 
 def test_main_dry_run_skips_service(monkeypatch):
-    now = datetime.now(timezone.utc)
     request = AccountListRequest(
-        start_time=now - timedelta(days=1),
-        end_time=now,
+        start_time=FIXED_NOW - timedelta(days=1),
+        end_time=FIXED_NOW,
         categories=["bank"],
         top_k=10,
         include_sources=True,
@@ -82,10 +83,9 @@ def test_main_dry_run_skips_service(monkeypatch):
 
 
 def test_main_runs_service(monkeypatch):
-    now = datetime.now(timezone.utc)
     request = AccountListRequest(
-        start_time=now - timedelta(days=1),
-        end_time=now,
+        start_time=FIXED_NOW - timedelta(days=1),
+        end_time=FIXED_NOW,
         categories=["bank"],
         top_k=10,
         include_sources=True,
@@ -93,7 +93,7 @@ def test_main_runs_service(monkeypatch):
     )
     result = AccountListResult(
         request_id="req-1",
-        generated_at=now,
+        generated_at=FIXED_NOW,
         indicators=[],
         sources=[],
         warnings=[],
@@ -124,10 +124,9 @@ def test_main_runs_service(monkeypatch):
 
 
 def test_main_handles_failures(monkeypatch):
-    now = datetime.now(timezone.utc)
     request = AccountListRequest(
-        start_time=now - timedelta(days=1),
-        end_time=now,
+        start_time=FIXED_NOW - timedelta(days=1),
+        end_time=FIXED_NOW,
         categories=["bank"],
         top_k=10,
         include_sources=True,
@@ -0,0 +1,21 @@
+"""Unit tests for helpers shared by the worker job entrypoints."""
+
+from __future__ import annotations
+
+import pytest
+
+from i4g.worker.jobs.common import env_flag
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [(None, None), ("1", True), (" Yes ", True), ("off", False), ("FALSE", False), ("maybe", None)],
+)
+def test_env_flag_parses_common_spellings(monkeypatch, raw, expected) -> None:
+    """Boolean env flags accept the usual spellings and ignore anything else."""
+
+    if raw is None:
+        monkeypatch.delenv("I4G_TEST__FLAG", raising=False)
+    else:
+        monkeypatch.setenv("I4G_TEST__FLAG", raw)
+    assert env_flag("I4G_TEST__FLAG") is expected
@@ -2,8 +2,10 @@
 Unit tests for i4g.worker.tasks.
 """
 
+import threading
 from unittest.mock import MagicMock, patch
 
+from i4g.worker import tasks
 from i4g.worker.tasks import generate_report_for_case
 
 
@@ -87,3 +89,45 @@ def test_generate_report_success(mock_report_generator_cls, mock_store_cls):
         action="report_generated",
         payload={"report_path": "/path/to/report.docx"},
     )
+
+
+def test_report_generator_is_reused_per_thread(monkeypatch):
+    """The real ReportGenerator is built once per thread and reused across cases."""
+
+    class _Generator:
+        instances = 0
+
+        def __init__(self):
+            type(self).instances += 1
+
+    monkeypatch.setattr(tasks, "ReportGenerator", _Generator)
+    monkeypatch.setattr(tasks, "_generators", threading.local())
+
+    first = tasks._resolve_report_generator()
+    assert tasks._resolve_report_generator() is first
+
+    other = []
+    worker = threading.Thread(target=lambda: other.append(tasks._resolve_report_generator()))
+    worker.start()
+    worker.join()
+
+    assert other[0] is not first
+    assert _Generator.instances == 2
+
+
+@patch("i4g.worker.tasks.ReportGenerator")
+def test_generate_report_defers_audit_entry_to_action_log(mock_report_generator_cls):
+    """When an action log is supplied the audit entry is collected instead of written."""
+    mock_store = MagicMock()
+    mock_store.get_review.return_value = {"review_id": "rev-5", "case_id": "CASE5", "status": "accepted"}
+    mock_report_generator_cls.return_value.generate_report.return_value = {"report_path": "/tmp/rev-5.md"}
+    action_log = []
+
+    result = generate_report_for_case("rev-5", store=mock_store, action_log=action_log)
+
+    assert result == "/tmp/rev-5.md"
+    mock_store.log_action.assert_not_called()
+    assert len(action_log) == 1
+    assert action_log[0]["action"] == "report_generated"
+    assert action_log[0]["payload"] == {"report_path": "/tmp/rev-5.md"}
+    assert action_log[0]["created_at"]